@@ -1,6 +1,10 @@
 from tools import *
 from helpers.logging_config import get_logger
 from helpers.utils.context import mcp, __ctx_cache
+from helpers.utils.http_pool import HttpPoolConfig, configure_http_pool
+from helpers.clients.sql_client import SqlPoolConfig, sql_engines
+from helpers.utils.delta_cache import configure_delta_cache
+from helpers.utils.rate_limiter import RateLimitConfig, fabric_rate_limiter
 import uvicorn
 import argparse
 import logging
@@ -27,8 +31,21 @@ if __name__ == "__main__":
     logger.info("Starting MCP server...")
     parser = argparse.ArgumentParser(description="Run MCP Streamable HTTP based server")
     parser.add_argument("--port", type=int, default=8081, help="Localhost port to listen on")
+    parser.add_argument("--http-pool-size", type=int, default=100, help="Max pooled connections per API host")
+    parser.add_argument("--no-http2", action="store_true", help="Disable HTTP/2 for pooled API connections")
+    parser.add_argument("--sql-pool-size", type=int, default=5, help="Pooled connections per SQL endpoint")
+    parser.add_argument("--delta-cache-file", default=None, help="Persist the Delta schema cache to this JSON file")
+    parser.add_argument("--api-rate", type=float, default=20.0, help="Initial requests/s per API host and workspace (adapts to throttling)")
     args = parser.parse_args()
 
+    configure_http_pool(
+        HttpPoolConfig(max_connections=args.http_pool_size, http2=not args.no_http2)
+    )
+    sql_engines.configure(SqlPoolConfig(pool_size=args.sql_pool_size))
+    fabric_rate_limiter.configure(RateLimitConfig(initial_rate=args.api_rate))
+    if args.delta_cache_file:
+        configure_delta_cache(persist_path=args.delta_cache_file)
+
     # Start the server with Streamable HTTP transport
     uvicorn.run(mcp.streamable_http_app, host="0.0.0.0", port=args.port)
     # mcp.run(transport="stdio")
@@ -1,18 +1,37 @@
 from pydantic import BaseModel
-from typing import Dict, Any, List, Optional, Tuple, Union
+from typing import AsyncIterator, Awaitable, Callable, Dict, Any, List, Optional, Tuple, Union
+import asyncio
 import base64
 from urllib.parse import quote
-from functools import lru_cache
-import requests
+import httpx
 from azure.identity import DefaultAzureCredential
 from helpers.logging_config import get_logger
 from helpers.utils import _is_valid_uuid
+from helpers.utils.authentication import get_cached_token_async
+from helpers.utils.http_pool import get_http_client
+from helpers.utils.lro import lro_manager
+from helpers.utils.name_index import name_index, tenant_from_token
+from helpers.utils.rate_limiter import fabric_rate_limiter, retry_after_seconds
+from helpers.utils.single_flight import fabric_get_flights
 import json
 from uuid import UUID
 
 logger = get_logger(__name__)
 # from  sempy_labs._helper_functions import create_item
 
+# Transport failures that are safe to retry (nothing reached the server, or the
+# pooled connection was dropped before a response came back).
+_RETRYABLE_TRANSPORT_ERRORS = (
+    httpx.ConnectError,
+    httpx.ConnectTimeout,
+    httpx.RemoteProtocolError,
+)
+
+
+def _query_params(params: Dict[str, Any]) -> Dict[str, Any]:
+    """Drop None values so they are omitted from the query string."""
+    return {key: value for key, value in params.items() if value is not None}
+
 
 
 class FabricApiConfig(BaseModel):
@@ -28,17 +47,20 @@ class FabricApiClient:
     def __init__(self, credential=None, config=None):
         self.credential = credential or DefaultAzureCredential()
         self.config = config or FabricApiConfig()
-        # Initialize cached methods
-        self._cached_resolve_workspace = lru_cache(maxsize=128)(self._resolve_workspace)
-        self._cached_resolve_lakehouse = lru_cache(maxsize=128)(self._resolve_lakehouse)
 
-    def _get_headers(self, token_scope: Optional[str] = None) -> Dict[str, str]:
-        """Get headers for Fabric API calls"""
+    async def _get_headers(self, token_scope: Optional[str] = None) -> Dict[str, str]:
+        """Get headers for Fabric API calls; a token fetch runs off the event loop"""
         scope = token_scope or "https://api.fabric.microsoft.com/.default"
         return {
-            "Authorization": f"Bearer {self.credential.get_token(scope).token}"
+            "Authorization": f"Bearer {await get_cached_token_async(self.credential, scope)}"
         }
 
+    async def _tenant(self) -> str:
+        """Tenant of the current credential, used to partition the name index"""
+        return tenant_from_token(
+            await get_cached_token_async(self.credential, "https://api.fabric.microsoft.com/.default")
+        )
+
     def _build_url(
         self, endpoint: str, continuation_token: Optional[str] = None
     ) -> str:
@@ -61,250 +83,459 @@ class FabricApiClient:
         method: str = "GET",
         use_pagination: bool = False,
         data_key: str = "value",
+        page_size: Optional[int] = None,
         lro: bool = False,
         lro_poll_interval: int = 2,  # seconds between polls
         lro_timeout: int = 300,  # max seconds to wait
         token_scope: Optional[str] = None,
         max_retries: int = 3,
         raw_mode: bool = False,
+        lro_wait: bool = True,
     ) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
         """
         Make an asynchronous call to the Fabric API.
 
-        If use_pagination is True, it will automatically handle paginated responses.
+        If use_pagination is True, every page is fetched (see iter_pages) and the
+        entries are concatenated; page_size overrides the default maxResults.
 
-        If lro is True, will poll for long-running operation completion.
+        If lro is True, a 202 response is handed to the shared LRO manager. With
+        lro_wait the call waits up to lro_timeout for the result; otherwise, or
+        when the wait times out, the operation handle (see get_operation) is returned.
 
-        Retries on 429 (Too Many Requests) and 503 (Service Unavailable) with exponential backoff.
+        Every request is paced by the shared adaptive rate limiter. 429 (Too Many Requests)
+        responses slow down and pause all requests to the same host/workspace and are
+        retried once Retry-After passes; 503 (Service Unavailable) is retried with backoff.
+        All waiting is done with asyncio.sleep so other requests keep running on the event loop,
+        and connections come from the shared per-host pool in helpers.utils.http_pool.
         """
-        import time
-
         params = params or {}
 
         if not use_pagination:
-            url = self._build_url(endpoint=endpoint)
-            response = None
-            for attempt in range(max_retries + 1):
-                try:
-                    if method.upper() in ("POST", "PATCH"):
-                        response = requests.request(
-                            method=method.upper(),
-                            url=url,
-                            headers=self._get_headers(token_scope),
-                            json=params,
-                            timeout=120,
-                        )
-                    elif method.upper() == "DELETE":
-                        response = requests.delete(
-                            url,
-                            headers=self._get_headers(token_scope),
-                            timeout=120,
-                        )
-                    else:
-                        query_params = params.copy()
-                        if not raw_mode and "maxResults" not in query_params:
-                            query_params["maxResults"] = self.config.max_results
-                        response = requests.request(
-                            method=method.upper(),
-                            url=url,
-                            headers=self._get_headers(token_scope),
-                            params=query_params,
-                            timeout=120,
-                        )
-
-                    # Retry on 429 and 503
-                    if response.status_code in (429, 503) and attempt < max_retries:
-                        retry_after = int(response.headers.get("Retry-After", 2 ** attempt))
-                        logger.warning(
-                            f"Got {response.status_code}, retrying in {retry_after}s (attempt {attempt + 1}/{max_retries})"
-                        )
-                        time.sleep(retry_after)
-                        continue
-                    break
-                except requests.ConnectionError as conn_err:
-                    if attempt < max_retries:
-                        wait = 2 ** attempt
-                        logger.warning(f"Connection error, retrying in {wait}s: {conn_err}")
-                        time.sleep(wait)
-                        continue
-                    raise
+            writing = method.upper() != "GET"
+            tenant = await self._tenant() if writing else None
+            result = await self._request_single(
+                endpoint=endpoint,
+                params=params,
+                method=method,
+                lro=lro,
+                lro_poll_interval=lro_poll_interval,
+                lro_timeout=lro_timeout,
+                token_scope=token_scope,
+                max_retries=max_retries,
+                raw_mode=raw_mode,
+                lro_wait=lro_wait,
+                on_lro_done=(
+                    (lambda: self._invalidate_name_index(tenant, endpoint, method))
+                    if writing
+                    else None
+                ),
+            )
+            if writing:
+                self._invalidate_name_index(tenant, endpoint, method)
+            return result
+        return await self._request_paginated(
+            endpoint=endpoint,
+            params=params,
+            method=method,
+            data_key=data_key,
+            raw_mode=raw_mode,
+            page_size=page_size,
+        )
+
+    def _invalidate_name_index(self, tenant: str, endpoint: str, method: str) -> None:
+        """Drop cached workspace/item names that a successful write may have changed."""
+        url = self._build_url(endpoint=endpoint)
+        if not url.startswith(self.config.base_url):
+            return
+        name_index.invalidate_for_write(tenant, method, httpx.URL(url).path)
+
+    def _flight_key(self, url: str, params: Dict, token_scope: Optional[str], *extra: Any) -> Tuple:
+        """Identify a GET for coalescing: same caller identity, URL, params and scope"""
+        return (
+            id(self.credential),
+            url,
+            tuple(sorted((str(k), str(v)) for k, v in (params or {}).items())),
+            token_scope,
+            *extra,
+        )
+
+    async def _request_single(
+        self,
+        endpoint: str,
+        params: Dict,
+        method: str,
+        lro: bool,
+        lro_poll_interval: int,
+        lro_timeout: int,
+        token_scope: Optional[str],
+        max_retries: int,
+        raw_mode: bool,
+        lro_wait: bool = True,
+        on_lro_done: Optional[Callable[[], None]] = None,
+    ) -> Union[Dict[str, Any], List[Dict[str, Any]], None]:
+        """Send one request; concurrent identical GETs share a single upstream call."""
+        send = lambda: self._send_single(
+            endpoint,
+            params,
+            method,
+            lro,
+            lro_poll_interval,
+            lro_timeout,
+            token_scope,
+            max_retries,
+            raw_mode,
+            lro_wait,
+            on_lro_done,
+        )
+        if method.upper() != "GET" or lro:
+            return await send()
+        key = self._flight_key(self._build_url(endpoint=endpoint), params, token_scope, raw_mode)
+        return await fabric_get_flights.do(key, send)
+
+    async def _send_single(
+        self,
+        endpoint: str,
+        params: Dict,
+        method: str,
+        lro: bool,
+        lro_poll_interval: int,
+        lro_timeout: int,
+        token_scope: Optional[str],
+        max_retries: int,
+        raw_mode: bool,
+        lro_wait: bool = True,
+        on_lro_done: Optional[Callable[[], None]] = None,
+    ) -> Union[Dict[str, Any], List[Dict[str, Any]], None]:
+        """Send one (optionally long-running) request, retrying on throttling."""
+        url = self._build_url(endpoint=endpoint)
+        http = get_http_client(url)
+
+        async def _send() -> httpx.Response:
+            if method.upper() in ("POST", "PATCH"):
+                return await http.request(
+                    method=method.upper(),
+                    url=url,
+                    headers=await self._get_headers(token_scope),
+                    json=params,
+                )
+            if method.upper() == "DELETE":
+                return await http.delete(
+                    url,
+                    headers=await self._get_headers(token_scope),
+                )
+            query_params = params.copy()
+            if not raw_mode and "maxResults" not in query_params:
+                query_params["maxResults"] = self.config.max_results
+            return await http.request(
+                method=method.upper(),
+                url=url,
+                headers=await self._get_headers(token_scope),
+                params=_query_params(query_params),
+            )
+
+        response = await self._send_paced(url, _send, max_retries)
+
+        try:
+            # LRO support: check for 202 and Operation-Location/Location
+            if lro and response.status_code == 202:
+                return await self._start_lro(
+                    response,
+                    label=f"{method.upper()} {httpx.URL(url).path}",
+                    lro_poll_interval=lro_poll_interval,
+                    lro_timeout=lro_timeout,
+                    token_scope=token_scope,
+                    lro_wait=lro_wait,
+                    on_done=on_lro_done,
+                )
+            response.raise_for_status()
+
+            # Handle empty response body (common for DELETE 204, PATCH 200)
+            if response.status_code == 204 or not response.text or response.text.strip() == "":
+                if method.upper() == "DELETE":
+                    return {"success": True, "status": response.status_code}
+                return {}
 
             try:
-    
-                # LRO support: check for 202 and Operation-Location/Location
-                if lro and response.status_code == 202:
-                    # Fabric APIs use two headers:
-                    # - Operation-Location: URL to poll for operation status
-                    # - Location: URL to GET the actual result after operation completes
-                    op_location = (
-                        response.headers.get("Operation-Location")
-                        or response.headers.get("operation-location")
+                return response.json()
+            except ValueError as e:
+                logger.error(f"Failed to parse JSON response: {e}")
+                logger.error(f"Response text: {response.text[:500]}")
+                return None
+        except httpx.HTTPError as e:
+            logger.error(f"API call failed: {str(e)}")
+            error_msg = f"API call failed: {str(e)}"
+            error_response = getattr(e, "response", None)
+            if error_response is not None:
+                logger.error(f"Response status: {error_response.status_code}")
+                logger.error(f"Response content: {error_response.text}")
+                error_msg += f"\nStatus: {error_response.status_code}\nResponse: {error_response.text}"
+            raise ValueError(error_msg)
+
+    async def _send_paced(
+        self,
+        url: str,
+        send: Callable[[], Awaitable[httpx.Response]],
+        max_retries: int,
+    ) -> httpx.Response:
+        """Send through the shared rate limiter, retrying throttling and dropped connections.
+
+        429s are retried for as long as their Retry-After waits (at least
+        min_throttle_wait each) fit in the limiter's throttle budget; 503s and
+        transport errors up to max_retries.
+        """
+        attempt = 0
+        throttle_waited = 0.0
+        while True:
+            await fabric_rate_limiter.acquire(url)
+            try:
+                response = await send()
+            except _RETRYABLE_TRANSPORT_ERRORS as conn_err:
+                if attempt < max_retries:
+                    wait = 2 ** attempt
+                    attempt += 1
+                    logger.warning(f"Connection error, retrying in {wait}s: {conn_err}")
+                    await asyncio.sleep(wait)
+                    continue
+                raise
+            fabric_rate_limiter.record(url, response)
+
+            if response.status_code == 429:
+                # The limiter now holds every request to this host/workspace
+                # until Retry-After passes; this one queues behind it.
+                config = fabric_rate_limiter.config
+                retry_after = retry_after_seconds(response, config.default_retry_after)
+                # Every retry costs at least min_throttle_wait, so a server that keeps
+                # answering Retry-After: 0 (or a past date) still exhausts the budget
+                wait = max(retry_after, config.min_throttle_wait)
+                if throttle_waited + wait <= config.throttle_budget:
+                    throttle_waited += wait
+                    logger.warning(f"Got 429, queued for {wait:.1f}s before retrying")
+                    if wait > retry_after:
+                        await asyncio.sleep(wait - retry_after)
+                    continue
+            elif response.status_code == 503 and attempt < max_retries:
+                retry_after = retry_after_seconds(response, 2 ** attempt)
+                attempt += 1
+                logger.warning(
+                    f"Got 503, retrying in {retry_after}s (attempt {attempt}/{max_retries})"
+                )
+                await asyncio.sleep(retry_after)
+                continue
+            return response
+
+    async def _start_lro(
+        self,
+        response: httpx.Response,
+        label: str,
+        lro_poll_interval: int,
+        lro_timeout: int,
+        token_scope: Optional[str],
+        lro_wait: bool,
+        on_done: Optional[Callable[[], None]],
+    ) -> Optional[Dict[str, Any]]:
+        """Hand a 202 Accepted response to the LRO manager and optionally wait for it."""
+        operation = lro_manager.start(
+            response,
+            poll_headers=self._get_headers,
+            result_headers=lambda: self._get_headers(token_scope),
+            poll_interval=lro_poll_interval,
+            label=label,
+            on_done=on_done,
+        )
+        if operation is None:
+            logger.error("LRO: No Operation-Location header found in 202 response.")
+            logger.error(f"LRO: Response headers: {dict(response.headers)}")
+            logger.error(f"LRO: Response body: {response.text[:500] if response.text else 'empty'}")
+            try:
+                body = response.json()
+                logger.info(f"LRO: Returning response body despite missing Operation-Location")
+                return body
+            except Exception:
+                return None
+        if not lro_wait:
+            return operation.to_dict()
+
+        await lro_manager.wait(operation.id, timeout=lro_timeout)
+        if not operation.done:
+            logger.warning(
+                f"LRO: {label} still running after {lro_timeout}s; returning operation {operation.id}"
+            )
+            return operation.to_dict()
+        return operation.result
+
+    async def _request_paginated(
+        self,
+        endpoint: str,
+        params: Dict,
+        method: str,
+        data_key: str,
+        raw_mode: bool,
+        page_size: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """Follow continuation tokens and concatenate every page."""
+        results = []
+        async for page in self.iter_pages(
+            endpoint,
+            params=params,
+            method=method,
+            data_key=data_key,
+            raw_mode=raw_mode,
+            page_size=page_size,
+        ):
+            results.extend(page)
+        return results
+
+    async def _fetch_page(
+        self,
+        endpoint: str,
+        params: Dict,
+        method: str,
+        data_key: str,
+        raw_mode: bool,
+        page_size: Optional[int],
+        continuation_token: Optional[str],
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """Fetch one page of a listing; returns its entries and the next continuation token."""
+        request_params = params.copy()
+        # Remove any existing continuationToken in parameters to avoid conflict.
+        request_params.pop("continuationToken", None)
+        try:
+            if method.upper() == "POST":
+                url = self._build_url(endpoint=endpoint, continuation_token=continuation_token)
+
+                async def _send() -> httpx.Response:
+                    return await get_http_client(url).post(
+                        url,
+                        headers=await self._get_headers(),
+                        json=request_params,
                     )
-                    location = (
-                        response.headers.get("Location")
-                        or response.headers.get("location")
+
+                response = await self._send_paced(url, _send, max_retries=3)
+            else:
+                # httpx replaces the URL's query string with params, so the
+                # token has to travel as a parameter
+                url = self._build_url(endpoint=endpoint)
+                if continuation_token:
+                    request_params["continuationToken"] = continuation_token
+                if not raw_mode and "maxResults" not in request_params:
+                    request_params["maxResults"] = page_size or self.config.max_results
+
+                async def _send() -> httpx.Response:
+                    return await get_http_client(url).request(
+                        method=method.upper(),
+                        url=url,
+                        headers=await self._get_headers(),
+                        params=_query_params(request_params),
                     )
 
-                    # If both exist, poll op_location and fetch result from location
-                    # If only location exists, use it for polling (legacy pattern)
-                    op_url = op_location or location
-                    result_url = location if op_location and location and op_location != location else None
-
-                    if not op_url:
-                        logger.error("LRO: No Operation-Location header found in 202 response.")
-                        logger.error(f"LRO: Response headers: {dict(response.headers)}")
-                        logger.error(f"LRO: Response body: {response.text[:500] if response.text else 'empty'}")
-                        try:
-                            body = response.json()
-                            logger.info(f"LRO: Returning response body despite missing Operation-Location")
-                            return body
-                        except Exception:
-                            return None
-                    logger.info(f"LRO: Polling {op_url} for operation status...")
-                    if result_url:
-                        logger.info(f"LRO: Result will be fetched from {result_url}")
-                    start_time = time.time()
-                    while True:
-                        # Respect Retry-After when provided
-                        retry_after_header = response.headers.get("Retry-After") or response.headers.get("retry-after")
-                        retry_after = None
-                        try:
-                            if retry_after_header is not None:
-                                retry_after = int(retry_after_header)
-                        except Exception:
-                            retry_after = None
-                        poll_resp = requests.get(
-                            op_url, headers=self._get_headers(), timeout=60
-                        )
-                        if poll_resp.status_code not in (200, 201, 202):
-                            logger.error(
-                                f"LRO: Poll failed with status {poll_resp.status_code}"
-                            )
-                            return None
-                        poll_data = poll_resp.json()
-                        status = poll_data.get("status") or poll_data.get(
-                            "operationStatus"
-                        )
-
-                        # If 200 response with no status field, the result IS the data
-                        # (Location URL returns actual content when operation completes)
-                        if poll_resp.status_code == 200 and status is None:
-                            logger.info("LRO: Got 200 with no status field - treating as completed result.")
-                            return poll_data
-
-                        if status in (
-                            "Succeeded",
-                            "succeeded",
-                            "Completed",
-                            "completed",
-                        ):
-                            logger.info("LRO: Operation succeeded.")
-
-                            # If we have a separate result URL, fetch the actual result
-                            if result_url:
-                                logger.info(f"LRO: Fetching result from {result_url}")
-                                try:
-                                    result_resp = requests.get(
-                                        result_url, headers=self._get_headers(token_scope), timeout=120
-                                    )
-                                    if result_resp.status_code == 200 and result_resp.text:
-                                        return result_resp.json()
-                                    logger.warning(f"LRO: Result fetch returned {result_resp.status_code}")
-                                except Exception as result_exc:
-                                    logger.warning(f"LRO: Failed to fetch result: {result_exc}")
-
-                            # Extract resource details from the polling response
-                            resource = (
-                                poll_data.get("resource")
-                                or poll_data.get("result")
-                                or poll_data.get("item")
-                            )
-                            if resource and isinstance(resource, dict):
-                                return resource
-                            return poll_data
-                        if status in ("Failed", "failed", "Canceled", "canceled"):
-                            logger.error(
-                                f"LRO: Operation failed or canceled. Status: {status}"
-                            )
-                            return poll_data
-                        if time.time() - start_time > lro_timeout:
-                            logger.error("LRO: Polling timed out.")
-                            return None
-                        wait_time = retry_after if retry_after is not None else lro_poll_interval
-                        logger.debug(
-                            f"LRO: Status {status}, waiting {wait_time}s..."
-                        )
-                        time.sleep(wait_time)
-                response.raise_for_status()
-
-                # Handle empty response body (common for DELETE 204, PATCH 200)
-                if response.status_code == 204 or not response.text or response.text.strip() == "":
-                    if method.upper() == "DELETE":
-                        return {"success": True, "status": response.status_code}
-                    return {}
-                
-                try:
-                    return response.json()
-                except ValueError as e:
-                    logger.error(f"Failed to parse JSON response: {e}")
-                    logger.error(f"Response text: {response.text[:500]}")
-                    return None
-            except requests.RequestException as e:
-                logger.error(f"API call failed: {str(e)}")
-                error_msg = f"API call failed: {str(e)}"
-                if e.response is not None:
-                    logger.error(f"Response status: {e.response.status_code}")
-                    logger.error(f"Response content: {e.response.text}")
-                    error_msg += f"\nStatus: {e.response.status_code}\nResponse: {e.response.text}"
-                raise ValueError(error_msg)
-        else:
-            results = []
-            continuation_token = None
-            while True:
-                url = self._build_url(
-                    endpoint=endpoint, continuation_token=continuation_token
-                )
-                request_params = params.copy()
-                # Remove any existing continuationToken in parameters to avoid conflict.
-                request_params.pop("continuationToken", None)
-                try:
-                    if method.upper() == "POST":
-                        response = requests.post(
-                            url,
-                            headers=self._get_headers(),
-                            json=request_params,
-                            timeout=120,
-                        )
-                    else:
-                        if not raw_mode and "maxResults" not in request_params:
-                            request_params["maxResults"] = self.config.max_results
-                        response = requests.request(
-                            method=method.upper(),
-                            url=url,
-                            headers=self._get_headers(),
-                            params=request_params,
-                            timeout=120,
-                        )
-                    response.raise_for_status()
-                    data = response.json()
-                except requests.RequestException as e:
-                    logger.error(f"API call failed: {str(e)}")
-                    if e.response is not None:
-                        logger.error(f"Response content: {e.response.text}")
-                    return results if results else None
-
-                if not isinstance(data, dict) or data_key not in data:
-                    raise ValueError(f"Unexpected response format: {data}")
-
-                results.extend(data[data_key])
-                continuation_token = data.get("continuationToken")
-                if not continuation_token:
-                    break
-            return results
+                response = await self._send_paced(url, _send, max_retries=3)
+            response.raise_for_status()
+            data = response.json()
+        except httpx.HTTPError as e:
+            logger.error(f"API call failed: {str(e)}")
+            error_msg = f"API call failed: {str(e)}"
+            error_response = getattr(e, "response", None)
+            if error_response is not None:
+                logger.error(f"Response content: {error_response.text}")
+                error_msg += f"\nStatus: {error_response.status_code}\nResponse: {error_response.text}"
+            raise ValueError(error_msg)
+
+        if not isinstance(data, dict) or data_key not in data:
+            raise ValueError(f"Unexpected response format: {data}")
+        return data[data_key], data.get("continuationToken")
+
+    async def iter_pages(
+        self,
+        endpoint: str,
+        params: Optional[Dict] = None,
+        method: str = "GET",
+        data_key: str = "value",
+        raw_mode: bool = False,
+        page_size: Optional[int] = None,
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Yield each page of a paginated listing as soon as it arrives.
+
+        The next page is requested as soon as its continuation token is known,
+        so it downloads while the caller processes the current one. A failed
+        page raises ValueError instead of ending the listing early. page_size
+        overrides FabricApiConfig.max_results for APIs that accept larger pages.
+        """
+        params = params or {}
+
+        def _fetch(continuation_token: Optional[str]) -> "asyncio.Task":
+            fetch = lambda: self._fetch_page(
+                endpoint, params, method, data_key, raw_mode, page_size, continuation_token
+            )
+            if method.upper() != "GET":
+                return asyncio.create_task(fetch())
+            key = self._flight_key(
+                self._build_url(endpoint=endpoint),
+                params,
+                None,
+                raw_mode,
+                data_key,
+                page_size,
+                continuation_token,
+            )
+            return asyncio.create_task(fabric_get_flights.do(key, fetch))
+
+        pending: Optional[asyncio.Task] = _fetch(None)
+        try:
+            while pending is not None:
+                page, continuation_token = await pending
+                pending = _fetch(continuation_token) if continuation_token else None
+                yield page
+        finally:
+            if pending is not None and not pending.done():
+                pending.cancel()
+
+    async def iter_workspaces(self, page_size: Optional[int] = None) -> AsyncIterator[Dict]:
+        """Stream all available workspaces; a complete listing warms the name index"""
+        workspaces = []
+        async for page in self.iter_pages("workspaces", page_size=page_size):
+            workspaces.extend(page)
+            for workspace in page:
+                yield workspace
+        name_index.store_workspaces(await self._tenant(), workspaces)
+
+    async def iter_items(
+        self,
+        workspace_id: str,
+        item_type: Optional[str] = None,
+        params: Optional[Dict] = None,
+        page_size: Optional[int] = None,
+    ) -> AsyncIterator[Dict]:
+        """Stream the items of a workspace; a complete unfiltered listing warms the name index"""
+        if not _is_valid_uuid(workspace_id):
+            raise ValueError("Invalid workspace ID.")
+        if item_type:
+            params = params or {}
+            params["type"] = item_type
+        items = []
+        async for page in self.iter_pages(
+            f"workspaces/{workspace_id}/items", params=params, page_size=page_size
+        ):
+            items.extend(page)
+            for item in page:
+                yield item
+        if not params:
+            name_index.store_items(await self._tenant(), workspace_id, items)
+
+    async def iter_tables(
+        self, workspace_id: str, rsc_id: str, type: str, page_size: Optional[int] = None
+    ) -> AsyncIterator[Dict]:
+        """Stream the tables of a lakehouse or warehouse"""
+        async for page in self.iter_pages(
+            f"workspaces/{workspace_id}/{type}s/{rsc_id}/tables",
+            data_key="data",
+            page_size=page_size,
+        ):
+            for table in page:
+                yield table
 
     async def get_workspaces(self) -> List[Dict]:
         """Get all available workspaces"""
-        return await self._make_request("workspaces", use_pagination=True)
+        return [workspace async for workspace in self.iter_workspaces()]
 
     async def create_workspace(
         self,
@@ -357,11 +588,7 @@ class FabricApiClient:
         Returns:
             A list of dictionaries containing table details or an error message.
         """
-        return await self._make_request(
-            f"workspaces/{workspace_id}/{type}s/{rsc_id}/tables",
-            use_pagination=True,
-            data_key="data",
-        )
+        return [table async for table in self.iter_tables(workspace_id, rsc_id, type)]
 
     async def get_reports(self, workspace_id: str) -> List[Dict]:
         """Get all reports in a lakehouse
@@ -405,18 +632,19 @@ class FabricApiClient:
         )
 
     async def resolve_workspace(self, workspace: str) -> str:
-        """Convert workspace name or ID to workspace ID with caching"""
-        return await self._cached_resolve_workspace(workspace)
-
-    async def _resolve_workspace(self, workspace: str) -> str:
-        """Internal method to convert workspace name or ID to workspace ID"""
+        """Convert workspace name or ID to workspace ID using the shared name index"""
         if _is_valid_uuid(workspace):
             return workspace
 
-        workspaces = await self.get_workspaces()
-        matching_workspaces = [
-            w for w in workspaces if w["displayName"].lower() == workspace.lower()
-        ]
+        tenant = await self._tenant()
+        matching_workspaces = name_index.find_workspaces_by_name(
+            tenant, workspace, case_sensitive=False
+        )
+        if not matching_workspaces:
+            await self.get_workspaces()
+            matching_workspaces = name_index.find_workspaces_by_name(
+                tenant, workspace, case_sensitive=False
+            )
 
         if not matching_workspaces:
             raise ValueError(f"No workspaces found with name: {workspace}")
@@ -426,18 +654,13 @@ class FabricApiClient:
         return matching_workspaces[0]["id"]
 
     async def resolve_lakehouse(self, workspace_id: str, lakehouse: str) -> str:
-        """Convert lakehouse name or ID to lakehouse ID with caching"""
-        return await self._cached_resolve_lakehouse(workspace_id, lakehouse)
-
-    async def _resolve_lakehouse(self, workspace_id: str, lakehouse: str) -> str:
-        """Internal method to convert lakehouse name or ID to lakehouse ID"""
+        """Convert lakehouse name or ID to lakehouse ID using the shared name index"""
         if _is_valid_uuid(lakehouse):
             return lakehouse
 
-        lakehouses = await self.get_lakehouses(workspace_id)
-        matching_lakehouses = [
-            lh for lh in lakehouses if lh["displayName"].lower() == lakehouse.lower()
-        ]
+        matching_lakehouses = await self.find_items_by_name(
+            workspace_id, lakehouse, type="Lakehouse", case_sensitive=False
+        )
 
         if not matching_lakehouses:
             raise ValueError(f"No lakehouse found with name: {lakehouse}")
@@ -446,6 +669,25 @@ class FabricApiClient:
 
         return matching_lakehouses[0]["id"]
 
+    async def find_items_by_name(
+        self,
+        workspace_id: str,
+        name: str,
+        type: Optional[str] = None,
+        case_sensitive: bool = True,
+    ) -> List[Dict]:
+        """Look up items by display name, listing the workspace once on a miss"""
+        tenant = await self._tenant()
+        matches = name_index.find_items_by_name(
+            tenant, workspace_id, name, type=type, case_sensitive=case_sensitive
+        )
+        if not matches:
+            await self.get_items(workspace_id=workspace_id)
+            matches = name_index.find_items_by_name(
+                tenant, workspace_id, name, type=type, case_sensitive=case_sensitive
+            )
+        return matches
+
     async def get_items(
         self,
         workspace_id: str,
@@ -453,14 +695,9 @@ class FabricApiClient:
         params: Optional[Dict] = None,
     ) -> List[Dict]:
         """Get all items in a workspace"""
-        if not _is_valid_uuid(workspace_id):
-            raise ValueError("Invalid workspace ID.")
-        if item_type:
-            params = params or {}
-            params["type"] = item_type
-        return await self._make_request(
-            f"workspaces/{workspace_id}/items", params=params, use_pagination=True
-        )
+        return [
+            item async for item in self.iter_items(workspace_id, item_type=item_type, params=params)
+        ]
 
     async def get_item(
         self,
@@ -592,9 +829,9 @@ class FabricApiClient:
                 lro=lro,
                 lro_poll_interval=0.5,
             )
-        except requests.RequestException as e:
+        except httpx.HTTPError as e:
             logger.error(f"API call failed: {str(e)}")
-            if e.response is not None:
+            if isinstance(e, httpx.HTTPStatusError):
                 logger.error(f"Response content: {e.response.text}")
             raise ValueError(
                 f"Failed to create item '{name}' of type '{item_type}' in the '{workspace_id}' workspace."
@@ -737,14 +974,10 @@ class FabricApiClient:
         (workspace_name, workspace_id) = await self.resolve_workspace_name_and_id(
             workspace
         )
-        item_id = await self.resolve_item_id(
-            item=item, type=type, workspace=workspace_id
+        item_data = await self._resolve_item(
+            item=item, type=type, workspace_id=workspace_id, workspace_name=workspace_name
         )
-        item_data = await self._make_request(
-            f"workspaces/{workspace_id}/items/{item_id}"
-        )
-        item_name = item_data.get("displayName")
-        return item_name, item_id
+        return item_data.get("displayName"), item_data.get("id")
 
     async def resolve_item_id(
         self,
@@ -755,40 +988,50 @@ class FabricApiClient:
         (workspace_name, workspace_id) = await self.resolve_workspace_name_and_id(
             workspace
         )
-        item_id = None
+        item_data = await self._resolve_item(
+            item=item, type=type, workspace_id=workspace_id, workspace_name=workspace_name
+        )
+        return item_data.get("id")
+
+    async def _resolve_item(
+        self,
+        item: str | UUID,
+        type: Optional[str],
+        workspace_id: str,
+        workspace_name: str,
+    ) -> Dict[str, Any]:
+        """Find an item's index entry by ID or exact display name"""
+        tenant = await self._tenant()
 
         if _is_valid_uuid(item):
-            # Check (optional)
-            item_id = item
+            item_data = name_index.find_item_by_id(tenant, workspace_id, str(item))
+            if item_data is not None:
+                return item_data
             try:
-                await self._make_request(
-                    endpoint=f"workspaces/{workspace_id}/items/{item_id}"
+                item_data = await self._make_request(
+                    endpoint=f"workspaces/{workspace_id}/items/{item}"
                 )
-            except requests.RequestException:
+            except ValueError:
                 raise ValueError(
-                    f"The '{item_id}' item was not found in the '{workspace_name}' workspace."
+                    f"The '{item}' item was not found in the '{workspace_name}' workspace."
                 )
-        else:
-            if type is None:
+            if not isinstance(item_data, dict) or not item_data.get("id"):
                 raise ValueError(
-                    "The 'type' parameter is required if specifying an item name."
+                    f"The '{item}' item was not found in the '{workspace_name}' workspace."
                 )
-            responses = await self._make_request(
-                endpoint=f"workspaces/{workspace_id}/items?type={type}",
-                use_pagination=True,
-            )
-            for v in responses:
-                display_name = v["displayName"]
-                if display_name == item:
-                    item_id = v.get("id")
-                    break
+            name_index.add_item(tenant, workspace_id, item_data)
+            return item_data
 
-        if item_id is None:
+        if type is None:
+            raise ValueError(
+                "The 'type' parameter is required if specifying an item name."
+            )
+        matches = await self.find_items_by_name(workspace_id, str(item), type=type)
+        if not matches:
             raise ValueError(
                 f"There's no item '{item}' of type '{type}' in the '{workspace_name}' workspace."
             )
-
-        return item_id
+        return matches[0]
 
     async def resolve_workspace_name_and_id(
         self,
@@ -797,6 +1040,9 @@ class FabricApiClient:
         """
         Obtains the name and ID of the Fabric workspace.
 
+        Names and IDs are served from the shared name index; a miss on a name
+        lists every workspace once and warms the index for later lookups.
+
         Parameters
         ----------
         workspace : str | uuid.UUID, default=None
@@ -812,37 +1058,31 @@ class FabricApiClient:
         logger.debug(f"Resolving workspace name and ID for: {workspace}")
         if workspace is None:
             raise ValueError("Workspace must be specified.")
-        elif _is_valid_uuid(workspace):
+        if _is_valid_uuid(workspace):
             workspace_id = workspace
             workspace_name = await self.resolve_workspace_name(workspace_id)
             return workspace_name, workspace_id
-        else:
-            responses = await self._make_request(
-                endpoint="workspaces", use_pagination=True
-            )
+
+        tenant = await self._tenant()
+        matches = name_index.find_workspaces_by_name(tenant, workspace)
+        if not matches:
+            responses = await self.get_workspaces()
             if not responses:
                 raise ValueError(f"Failed to list workspaces - API returned None/empty")
             if not isinstance(responses, list):
                 raise ValueError(f"Failed to list workspaces - API returned unexpected type: {type(responses).__name__}")
-            
-            workspace_id = None
-            workspace_name = None
-            for r in responses:
-                if not isinstance(r, dict):
-                    logger.warning(f"Skipping non-dict workspace entry: {type(r).__name__}")
-                    continue
-                display_name = r.get("displayName")
-                if display_name == workspace:
-                    workspace_name = workspace
-                    workspace_id = r.get("id")
-                    return workspace_name, workspace_id
+            matches = name_index.find_workspaces_by_name(tenant, workspace)
 
-        if workspace_name is None or workspace_id is None:
+        if not matches:
             raise ValueError(f"Workspace '{workspace}' not found in available workspaces")
 
-        return workspace_name, workspace_id
+        return workspace, matches[0].get("id")
 
     async def resolve_workspace_name(self, workspace_id: Optional[UUID] = None) -> str:
+        tenant = await self._tenant()
+        cached = name_index.find_workspace_by_id(tenant, str(workspace_id))
+        if cached is not None and cached.get("displayName"):
+            return cached["displayName"]
         try:
             response = await self._make_request(endpoint=f"workspaces/{workspace_id}")
             if not response:
@@ -851,8 +1091,9 @@ class FabricApiClient:
                 raise ValueError(f"Workspace '{workspace_id}' API returned unexpected type: {type(response).__name__}")
             if "displayName" not in response:
                 raise ValueError(f"Workspace '{workspace_id}' not found or API response invalid: {response}")
+            name_index.add_workspace(tenant, response)
             return response.get("displayName")
-        except requests.RequestException as e:
+        except httpx.HTTPError as e:
             raise ValueError(f"The '{workspace_id}' workspace was not found: {str(e)}")
 
     async def get_notebooks(self, workspace_id: str) -> List[Dict]:
@@ -964,9 +1205,9 @@ class FabricApiClient:
             )
             logger.info(f"Created shortcut '{shortcut_name}' in {shortcut_path}")
             return response
-        except requests.RequestException as e:
+        except httpx.HTTPError as e:
             logger.error(f"Failed to create shortcut: {str(e)}")
-            if e.response is not None:
+            if isinstance(e, httpx.HTTPStatusError):
                 logger.error(f"Response content: {e.response.text}")
             raise ValueError(f"Failed to create shortcut '{shortcut_name}': {str(e)}")
 
@@ -999,7 +1240,7 @@ class FabricApiClient:
                 use_pagination=True,
             )
             return response if response else []
-        except requests.RequestException as e:
+        except httpx.HTTPError as e:
             logger.error(f"Failed to list shortcuts: {str(e)}")
             return []
 
@@ -1041,9 +1282,9 @@ class FabricApiClient:
             )
             logger.info(f"Deleted shortcut '{shortcut_name}' from {shortcut_path}")
             return {"success": True, "message": f"Shortcut '{shortcut_name}' deleted successfully"}
-        except requests.RequestException as e:
+        except httpx.HTTPError as e:
             logger.error(f"Failed to delete shortcut: {str(e)}")
-            if e.response is not None:
+            if isinstance(e, httpx.HTTPStatusError):
                 logger.error(f"Response content: {e.response.text}")
             raise ValueError(f"Failed to delete shortcut '{shortcut_name}': {str(e)}")
 
@@ -1130,9 +1371,9 @@ class FabricApiClient:
             )
             logger.info(f"Created pipeline '{pipeline_name}' in workspace '{workspace_id}'")
             return response
-        except requests.RequestException as e:
+        except httpx.HTTPError as e:
             logger.error(f"Failed to create pipeline: {str(e)}")
-            if e.response is not None:
+            if isinstance(e, httpx.HTTPStatusError):
                 logger.error(f"Response content: {e.response.text}")
             raise ValueError(f"Failed to create pipeline '{pipeline_name}': {str(e)}")
 
@@ -1177,8 +1418,8 @@ class FabricApiClient:
 
             logger.info(f"Retrieved pipeline definition for '{pipeline_id}'")
             return response
-        except requests.RequestException as e:
+        except httpx.HTTPError as e:
             logger.error(f"Failed to get pipeline definition: {str(e)}")
-            if e.response is not None:
+            if isinstance(e, httpx.HTTPStatusError):
                 logger.error(f"Response content: {e.response.text}")
             raise ValueError(f"Failed to get pipeline definition for '{pipeline_id}': {str(e)}")
@@ -1,16 +1,75 @@
 import asyncio
 import base64
+import fnmatch
+import io
+import json
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import List, Dict, Optional, Tuple
+from typing import Any, AsyncIterator, BinaryIO, List, Dict, Iterator, Optional, Tuple, Union
 
-from azure.core.exceptions import ResourceNotFoundError, ResourceExistsError
+import pyarrow.parquet as pq
+from azure.core import MatchConditions
+from azure.core.exceptions import HttpResponseError, ResourceNotFoundError, ResourceExistsError
+from azure.core.pipeline.transport import RequestsTransport
 from azure.storage.filedatalake import DataLakeServiceClient
+from cachetools import TTLCache
 
 from helpers.logging_config import get_logger
+from helpers.utils.http_pool import get_sync_session
 
 
 logger = get_logger(__name__)
 
+# (file system, directory path) pairs known to exist, so writes skip create_directory
+_known_directories: TTLCache = TTLCache(maxsize=4096, ttl=600)
+_known_directories_lock = threading.Lock()
+
+# Entries per List Paths request (the service maximum)
+_LIST_PAGE_SIZE = 5000
+# Service pages of recent listings: (file system, listed path, recursive, page token)
+_listing_cache: TTLCache = TTLCache(maxsize=64, ttl=30)
+_listing_cache_lock = threading.Lock()
+
+
+def _encode_listing_token(page_token: Optional[str], skip: int) -> str:
+    """Continuation token: the service page to re-read and how many of its entries to skip."""
+    state = json.dumps({"page": page_token, "skip": skip})
+    return base64.urlsafe_b64encode(state.encode("utf-8")).decode("ascii")
+
+
+def _decode_listing_token(token: Optional[str]) -> Tuple[Optional[str], int]:
+    if not token:
+        return None, 0
+    try:
+        state = json.loads(base64.urlsafe_b64decode(token.encode("ascii")))
+        return state["page"], int(state["skip"])
+    except (ValueError, KeyError, TypeError):
+        raise ValueError("Invalid continuation token.")
+
+
+def _forget_listings(file_system: str, changed_path: str) -> None:
+    """Drop cached listings that could include ``changed_path`` or anything below it."""
+    changed = changed_path.rstrip("/")
+    with _listing_cache_lock:
+        for key in list(_listing_cache.keys()):
+            listed = key[1].rstrip("/")
+            if key[0] == file_system and (
+                changed == listed
+                or changed.startswith(listed + "/")
+                or listed.startswith(changed + "/")
+            ):
+                _listing_cache.pop(key, None)
+
+
+def _forget_directories(file_system: str, directory_path: str) -> None:
+    """Drop a deleted directory and everything below it from the known directories."""
+    prefix = directory_path.rstrip("/") + "/"
+    with _known_directories_lock:
+        for key in list(_known_directories.keys()):
+            if key[0] == file_system and (key[1] == prefix[:-1] or key[1].startswith(prefix)):
+                _known_directories.pop(key, None)
+
 
 @dataclass
 class OneLakePath:
@@ -19,16 +78,236 @@ class OneLakePath:
     relative_path: str
 
 
+class OneLakeUploadStream(io.RawIOBase):
+    """Writable file object that streams into a OneLake file with append/flush.
+
+    Writes are buffered into ``chunk_size`` chunks. Each chunk is appended at
+    its own offset, with up to ``max_concurrency`` appends in flight on worker
+    threads (writers block while all slots are busy), and the file is
+    committed by a single flush on ``close()`` once every append has landed.
+    """
+
+    def __init__(
+        self,
+        file_client,
+        chunk_size: int = 8 * 1024 * 1024,
+        max_concurrency: int = 4,
+    ):
+        self._file_client = file_client
+        self._chunk_size = chunk_size
+        self._max_concurrency = max(1, max_concurrency)
+        self._buffer = bytearray()
+        self._offset = 0
+        self._slots = threading.BoundedSemaphore(self._max_concurrency)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending: List[Future] = []
+
+    @property
+    def bytes_written(self) -> int:
+        return self._offset + len(self._buffer)
+
+    def writable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self.bytes_written
+
+    def write(self, data) -> int:
+        if self.closed:
+            raise ValueError("write to closed upload stream")
+        self._raise_failed()
+        self._buffer.extend(data)
+        while len(self._buffer) >= self._chunk_size:
+            self._append(bytes(self._buffer[: self._chunk_size]))
+            del self._buffer[: self._chunk_size]
+        return len(data)
+
+    def _append(self, chunk: bytes) -> None:
+        offset = self._offset
+        self._offset += len(chunk)
+        if self._max_concurrency == 1:
+            self._file_client.append_data(chunk, offset=offset, length=len(chunk))
+            return
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._max_concurrency, thread_name_prefix="onelake-upload"
+            )
+        self._slots.acquire()
+        try:
+            future = self._executor.submit(
+                self._file_client.append_data, chunk, offset=offset, length=len(chunk)
+            )
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        self._pending.append(future)
+
+    def _raise_failed(self) -> None:
+        """Re-raise the first failed append and forget the finished ones."""
+        pending = []
+        for future in self._pending:
+            if not future.done():
+                pending.append(future)
+            elif future.exception() is not None:
+                raise future.exception()
+        self._pending = pending
+
+    def _shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+    def close(self) -> None:
+        if not self.closed:
+            if self._buffer:
+                self._append(bytes(self._buffer))
+                self._buffer.clear()
+            for future in self._pending:
+                future.result()
+            self._pending = []
+            self._shutdown()
+            self._file_client.flush_data(self._offset)
+            _forget_listings(self._file_client.file_system_name, self._file_client.path_name)
+        super().close()
+
+    def abort(self) -> None:
+        """Discard the partially written file."""
+        self._shutdown()
+        self._pending = []
+        if not self.closed:
+            super().close()
+        try:
+            self._file_client.delete_file()
+        except ResourceNotFoundError:
+            pass
+        _forget_listings(self._file_client.file_system_name, self._file_client.path_name)
+
+
+class OneLakeRangeReader(io.RawIOBase):
+    """Seekable read-only file object that fetches each read as a ranged GET.
+
+    Lets Parquet readers pull just the footer (or selected column chunks) of
+    a large file instead of downloading all of it.
+    """
+
+    def __init__(self, client: "OneLakeClient", file_client, size: int, path: str):
+        self._client = client
+        self._file_client = file_client
+        self._size = size
+        self._path = path
+        self._position = 0
+        self.bytes_read = 0
+        self.requests = 0
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self._position
+        elif whence == io.SEEK_END:
+            offset += self._size
+        self._position = max(offset, 0)
+        return self._position
+
+    def readinto(self, buffer) -> int:
+        length = min(len(buffer), self._size - self._position)
+        if length <= 0:
+            return 0
+        data = self._client._download_range(self._file_client, self._position, length, self._path)
+        buffer[: len(data)] = data
+        self._position += len(data)
+        self.bytes_read += len(data)
+        self.requests += 1
+        return len(data)
+
+
+def _decode_content(data: bytes, cut: bool = False) -> Tuple[str, str, int]:
+    """Return (content, encoding, bytes used): UTF-8 text when possible, base64 otherwise.
+
+    When the data was cut short, up to three trailing bytes of a split
+    multi-byte character are left out of the text.
+    """
+    for trim in range(4 if cut and data else 1):
+        try:
+            return data[: len(data) - trim].decode("utf-8"), "utf-8", len(data) - trim
+        except UnicodeDecodeError:
+            continue
+    return base64.b64encode(data).decode("utf-8"), "base64", len(data)
+
+
+def _stat_value(value: Any) -> Any:
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, bytes):
+        return value.decode("utf-8", errors="replace")
+    return str(value)
+
+
+def _describe_parquet(metadata: pq.FileMetaData) -> Dict[str, Any]:
+    schema = metadata.schema.to_arrow_schema()
+    row_groups = []
+    for index in range(metadata.num_row_groups):
+        row_group = metadata.row_group(index)
+        columns = []
+        for position in range(row_group.num_columns):
+            column = row_group.column(position)
+            entry: Dict[str, Any] = {
+                "name": column.path_in_schema,
+                "compression": column.compression,
+                "compressedBytes": column.total_compressed_size,
+                "uncompressedBytes": column.total_uncompressed_size,
+            }
+            stats = column.statistics
+            if stats is not None:
+                entry["nullCount"] = stats.null_count if stats.has_null_count else None
+                if stats.has_min_max:
+                    entry["min"] = _stat_value(stats.min)
+                    entry["max"] = _stat_value(stats.max)
+            columns.append(entry)
+        row_groups.append(
+            {
+                "numRows": row_group.num_rows,
+                "totalBytes": row_group.total_byte_size,
+                "columns": columns,
+            }
+        )
+    return {
+        "numRows": metadata.num_rows,
+        "numRowGroups": metadata.num_row_groups,
+        "createdBy": metadata.created_by,
+        "schema": [{"name": field.name, "type": str(field.type)} for field in schema],
+        "rowGroups": row_groups,
+    }
+
+
 class OneLakeClient:
     """Thin wrapper around Azure Data Lake Storage Gen2 client for OneLake."""
 
     ACCOUNT_URL = "https://onelake.dfs.fabric.microsoft.com"
 
-    def __init__(self, credential):
+    def __init__(self, credential, timeout: Optional[float] = None):
         self.credential = credential
+        # Connect/read timeout per request; the SDK default is 300 seconds
+        timeouts = {"connection_timeout": timeout, "read_timeout": timeout} if timeout else {}
+        # Reuse the process-wide keep-alive session for the OneLake DFS host
         self._service_client = DataLakeServiceClient(
             account_url=self.ACCOUNT_URL,
             credential=credential,
+            transport=RequestsTransport(
+                session=get_sync_session(self.ACCOUNT_URL), session_owner=False, **timeouts
+            ),
         )
 
     def _normalize_guid(self, value: str) -> str:
@@ -44,7 +323,7 @@ class OneLakeClient:
         lakehouse_guid = self._normalize_guid(lakehouse_id)
         normalized_path = (path or "").strip("/")
 
-        if normalized_path.startswith("Files/") or normalized_path.startswith("Tables/"):
+        if normalized_path in ("Files", "Tables") or normalized_path.startswith(("Files/", "Tables/")):
             full_path = f"{lakehouse_guid}/{normalized_path}"
         elif normalized_path:
             full_path = f"{lakehouse_guid}/Files/{normalized_path}"
@@ -65,111 +344,408 @@ class OneLakeClient:
             file_system=self._normalize_guid(workspace_id)
         )
 
+    def _list_page(
+        self, fs_client, prefix: str, recursive: bool, token: Optional[str], use_cache: bool
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """Fetch one service page of a listing as (entries, next page token)."""
+        key = (fs_client.file_system_name, prefix, recursive, token)
+        if use_cache:
+            with _listing_cache_lock:
+                cached = _listing_cache.get(key)
+            if cached is not None:
+                return cached
+
+        lakehouse_prefix = prefix.split("/", 1)[0] + "/"
+        pages = fs_client.get_paths(
+            path=prefix, recursive=recursive, max_results=_LIST_PAGE_SIZE
+        ).by_page(continuation_token=token)
+        try:
+            page = next(pages, [])
+            entries = [
+                {
+                    "name": item.name[len(lakehouse_prefix):],
+                    "is_directory": bool(getattr(item, "is_directory", False)),
+                    "size": getattr(item, "content_length", None),
+                    "last_modified": getattr(item, "last_modified", None),
+                }
+                for item in page
+            ]
+        except ResourceNotFoundError:
+            raise FileNotFoundError(f"Directory '{prefix}' not found.")
+        result = (entries, pages.continuation_token)
+
+        if use_cache:
+            with _listing_cache_lock:
+                _listing_cache[key] = result
+        return result
+
+    def _iter_listing(
+        self,
+        workspace_id: str,
+        lakehouse_id: str,
+        path: Optional[str],
+        recursive: bool,
+        prefix: Optional[str],
+        pattern: Optional[str],
+        continuation_token: Optional[str],
+        use_cache: bool,
+    ) -> Iterator[Tuple[Optional[str], int, str, Dict[str, Any]]]:
+        """Yield (page token, index in page, path below ``path``, entry) for matching entries."""
+        onelake_path, full_path = self._parse_path(workspace_id, lakehouse_id, path)
+        fs_client = self._get_file_system_client(onelake_path.workspace_id)
+        base = full_path.rstrip("/")
+        prefix = (prefix or "").strip("/")
+        listed = base
+        if "/" in prefix:
+            listed = f"{base}/{prefix.rsplit('/', 1)[0]}"
+        logger.debug("Listing OneLake path %s", listed)
+
+        # Entry names are relative to the lakehouse; strip "<base>/" from them
+        strip = len(base) - len(onelake_path.lakehouse_id)
+        token, skip = _decode_listing_token(continuation_token)
+        while True:
+            page, next_token = self._list_page(fs_client, listed, recursive, token, use_cache)
+            for index in range(skip, len(page)):
+                relative = page[index]["name"][strip:]
+                if prefix and not relative.startswith(prefix):
+                    continue
+                if pattern and not fnmatch.fnmatchcase(relative, pattern):
+                    continue
+                yield token, index, relative, page[index]
+            if not next_token:
+                return
+            token, skip = next_token, 0
+
     async def list_directory(
         self,
         workspace_id: str,
         lakehouse_id: str,
         path: Optional[str] = None,
-    ) -> List[Dict[str, Optional[str]]]:
-        def _inner():
-            onelake_path, full_path = self._parse_path(workspace_id, lakehouse_id, path)
-            fs_client = self._get_file_system_client(onelake_path.workspace_id)
+        recursive: bool = False,
+        pattern: Optional[str] = None,
+        prefix: Optional[str] = None,
+        max_entries: Optional[int] = None,
+        continuation_token: Optional[str] = None,
+        use_cache: bool = False,
+    ) -> Dict[str, Any]:
+        """List a directory, optionally recursively, one bounded page at a time.
+
+        ``prefix`` keeps entries whose path below ``path`` starts with it (its
+        directory part narrows the server-side listing); ``pattern`` is a glob
+        matched against that same relative path. At most ``max_entries``
+        entries are returned, with a ``continuationToken`` to resume from
+        when more remain. With ``use_cache``, service pages are reused for a
+        few seconds; writes and deletes through this client drop them.
+        """
 
-            prefix = full_path.rstrip("/")
-            logger.debug("Listing OneLake path %s", prefix)
-
-            try:
-                paths_iter = fs_client.get_paths(path=prefix, recursive=False)
-            except ResourceNotFoundError:
-                raise FileNotFoundError(
-                    f"Directory '{prefix}' not found in lakehouse '{lakehouse_id}'."
-                )
-
-            entries: List[Dict[str, Optional[str]]] = []
-            for entry in paths_iter:
-                name = entry.name
-                relative_name = name[len(f"{onelake_path.lakehouse_id}/") :]
-                entries.append(
-                    {
-                        "name": relative_name,
-                        "is_directory": getattr(entry, "is_directory", False),
-                        "size": getattr(entry, "content_length", None),
-                        "last_modified": getattr(entry, "last_modified", None),
+        def _inner():
+            entries: List[Dict[str, Any]] = []
+            for token, index, _, entry in self._iter_listing(
+                workspace_id, lakehouse_id, path, recursive, prefix, pattern,
+                continuation_token, use_cache,
+            ):
+                if max_entries is not None and len(entries) >= max_entries:
+                    return {
+                        "entries": entries,
+                        "continuationToken": _encode_listing_token(token, index),
                     }
-                )
+                entries.append(entry)
+            return {"entries": entries, "continuationToken": None}
 
-            return entries
+        return await asyncio.to_thread(_inner)
+
+    async def summarize_directory(
+        self,
+        workspace_id: str,
+        lakehouse_id: str,
+        path: Optional[str] = None,
+        pattern: Optional[str] = None,
+        prefix: Optional[str] = None,
+        use_cache: bool = False,
+    ) -> Dict[str, Any]:
+        """Count files and bytes below ``path``, in total and per immediate subdirectory.
+
+        Walks the full recursive listing without keeping the entries.
+        """
+
+        def _inner():
+            totals = {"files": 0, "directories": 0, "bytes": 0}
+            children: Dict[str, Dict[str, int]] = {}
+            for _, _, relative, entry in self._iter_listing(
+                workspace_id, lakehouse_id, path, True, prefix, pattern, None, use_cache
+            ):
+                if entry["is_directory"]:
+                    totals["directories"] += 1
+                    if "/" not in relative:
+                        children.setdefault(relative, {"files": 0, "bytes": 0})
+                    continue
+                size = int(entry["size"] or 0)
+                totals["files"] += 1
+                totals["bytes"] += size
+                if "/" in relative:
+                    child = children.setdefault(
+                        relative.split("/", 1)[0], {"files": 0, "bytes": 0}
+                    )
+                    child["files"] += 1
+                    child["bytes"] += size
+            return {**totals, "subdirectories": children}
 
         return await asyncio.to_thread(_inner)
 
+    def open_range_reader(self, file_client, path: str) -> OneLakeRangeReader:
+        """A OneLakeRangeReader over ``file_client``; raises FileNotFoundError when it is missing."""
+        try:
+            size = file_client.get_file_properties().size
+        except ResourceNotFoundError:
+            raise FileNotFoundError(f"File '{path}' not found.")
+        return OneLakeRangeReader(self, file_client, size, path)
+
+    def _download_range(self, file_client, offset: int, length: Optional[int], path: str) -> bytes:
+        """GET one byte range; an offset at or past the end of the file reads as empty."""
+        try:
+            return file_client.download_file(offset=offset, length=length).readall()
+        except ResourceNotFoundError:
+            raise FileNotFoundError(f"File '{path}' not found.")
+        except HttpResponseError as exc:
+            if exc.status_code == 416:
+                return b""
+            raise
+
     async def read_file(
         self,
         workspace_id: str,
         lakehouse_id: str,
         path: str,
-    ) -> Dict[str, str]:
+        offset: int = 0,
+        length: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """Read a file, or the byte range starting at ``offset``, in one request.
+
+        At most ``max_bytes`` bytes are returned; one extra byte is requested
+        so that ``truncated`` can report whether the range continues.
+        """
+        if offset < 0:
+            raise ValueError("offset must be zero or positive.")
+
         def _inner():
             onelake_path, full_path = self._parse_path(workspace_id, lakehouse_id, path)
             fs_client = self._get_file_system_client(onelake_path.workspace_id)
             file_client = fs_client.get_file_client(full_path)
 
-            if not file_client.exists():
-                raise FileNotFoundError(
-                    f"File '{onelake_path.relative_path or path}' not found."
-                )
-
-            downloader = file_client.download_file()
-            data = downloader.readall()
-
-            try:
-                content = data.decode("utf-8")
-                encoding = "utf-8"
-            except UnicodeDecodeError:
-                content = base64.b64encode(data).decode("utf-8")
-                encoding = "base64"
-
-            return {
+            limit = length
+            if max_bytes is not None and (limit is None or max_bytes < limit):
+                limit = max_bytes
+            probe = None if limit is None else limit + 1
+            data = self._download_range(
+                file_client, offset, probe, onelake_path.relative_path or path
+            )
+
+            truncated = limit is not None and len(data) > limit
+            if truncated:
+                data = data[:limit]
+            capped = truncated and (length is None or limit < length)
+
+            content, encoding, used = _decode_content(data, cut=truncated)
+            result: Dict[str, Any] = {
                 "path": path,
                 "content": content,
                 "encoding": encoding,
+                "bytesRead": used,
+                "truncated": capped,
             }
+            if offset or length is not None:
+                result["offset"] = offset
+            if capped:
+                result["nextOffset"] = offset + used
+            return result
 
         return await asyncio.to_thread(_inner)
 
-    async def write_file(
+    def iter_file(
         self,
         workspace_id: str,
         lakehouse_id: str,
         path: str,
-        data: bytes,
-        overwrite: bool = True,
-    ) -> Dict[str, str]:
+        offset: int = 0,
+        length: Optional[int] = None,
+        chunk_size: int = 4 * 1024 * 1024,
+    ) -> Iterator[bytes]:
+        """Yield a file (or a byte range of it) in ``chunk_size`` pieces.
+
+        Each chunk is a separate ranged GET, so memory use is bounded by the
+        chunk size. Blocking; iterate from a worker thread.
+        """
+        onelake_path, full_path = self._parse_path(workspace_id, lakehouse_id, path)
+        file_client = self._get_file_system_client(onelake_path.workspace_id).get_file_client(
+            full_path
+        )
+        position = offset
+        end = None if length is None else offset + length
+        while end is None or position < end:
+            size = chunk_size if end is None else min(chunk_size, end - position)
+            chunk = self._download_range(
+                file_client, position, size, onelake_path.relative_path or path
+            )
+            if not chunk:
+                return
+            yield chunk
+            position += len(chunk)
+            if len(chunk) < size:
+                return
+
+    async def read_parquet_metadata(
+        self,
+        workspace_id: str,
+        lakehouse_id: str,
+        path: str,
+    ) -> Dict[str, Any]:
+        """Describe a Parquet file from its footer without reading any data pages."""
+
         def _inner():
             onelake_path, full_path = self._parse_path(workspace_id, lakehouse_id, path)
-            fs_client = self._get_file_system_client(onelake_path.workspace_id)
-
-            directory_path = full_path.rsplit("/", 1)[0]
-            directory_client = fs_client.get_directory_client(directory_path)
-            try:
-                directory_client.create_directory()
-            except ResourceExistsError:
-                pass
-            except ResourceNotFoundError:
-                raise FileNotFoundError(
-                    f"Directory '{directory_path}' could not be created."
-                )
-
-            file_client = fs_client.get_file_client(full_path)
-            file_client.upload_data(data, overwrite=overwrite)
-
+            file_client = self._get_file_system_client(
+                onelake_path.workspace_id
+            ).get_file_client(full_path)
+            reader = self.open_range_reader(file_client, onelake_path.relative_path or path)
+            metadata = pq.read_metadata(reader)
             return {
                 "path": path,
-                "bytes_written": str(len(data)),
-                "overwrite": str(overwrite),
+                "fileSize": reader.size,
+                **_describe_parquet(metadata),
+                "bytesRead": reader.bytes_read,
+                "requests": reader.requests,
             }
 
         return await asyncio.to_thread(_inner)
 
+    def _ensure_parent_directory(self, fs_client, full_path: str) -> None:
+        directory_path = full_path.rsplit("/", 1)[0]
+        key = (fs_client.file_system_name, directory_path)
+        with _known_directories_lock:
+            if key in _known_directories:
+                return
+        directory_client = fs_client.get_directory_client(directory_path)
+        try:
+            directory_client.create_directory()
+        except ResourceExistsError:
+            pass
+        except ResourceNotFoundError:
+            raise FileNotFoundError(
+                f"Directory '{directory_path}' could not be created."
+            )
+        # Creating a directory creates its ancestors too
+        parts = directory_path.split("/")
+        with _known_directories_lock:
+            for depth in range(1, len(parts) + 1):
+                _known_directories[(key[0], "/".join(parts[:depth]))] = True
+
+    async def write_file(
+        self,
+        workspace_id: str,
+        lakehouse_id: str,
+        path: str,
+        data: Union[bytes, BinaryIO, AsyncIterator[bytes]],
+        overwrite: bool = True,
+        chunk_size: int = 8 * 1024 * 1024,
+        max_concurrency: int = 4,
+    ) -> Dict[str, str]:
+        """Write ``data`` to ``path``.
+
+        ``data`` may be bytes, a readable binary file object or an async
+        iterator of bytes. Up to one chunk of bytes is sent with a single
+        upload; anything larger goes through an upload stream that appends
+        ``chunk_size`` chunks with up to ``max_concurrency`` in parallel.
+        """
+        if isinstance(data, (bytes, bytearray, memoryview)) and len(data) <= chunk_size:
+
+            def _inner():
+                onelake_path, full_path = self._parse_path(workspace_id, lakehouse_id, path)
+                fs_client = self._get_file_system_client(onelake_path.workspace_id)
+                self._ensure_parent_directory(fs_client, full_path)
+
+                file_client = fs_client.get_file_client(full_path)
+                file_client.upload_data(bytes(data), overwrite=overwrite)
+                _forget_listings(fs_client.file_system_name, full_path)
+
+                return {
+                    "path": path,
+                    "bytes_written": str(len(data)),
+                    "overwrite": str(overwrite),
+                }
+
+            return await asyncio.to_thread(_inner)
+
+        stream = await asyncio.to_thread(
+            self.open_upload_stream,
+            workspace_id,
+            lakehouse_id,
+            path,
+            overwrite,
+            chunk_size,
+            max_concurrency,
+        )
+        try:
+            if isinstance(data, (bytes, bytearray, memoryview)):
+                view = memoryview(data)
+
+                def _write_bytes():
+                    for start in range(0, len(view), chunk_size):
+                        stream.write(view[start : start + chunk_size])
+
+                await asyncio.to_thread(_write_bytes)
+            elif hasattr(data, "__aiter__"):
+                async for piece in data:
+                    # Blocks only while every append slot is busy
+                    await asyncio.to_thread(stream.write, piece)
+            else:
+
+                def _copy_file():
+                    while True:
+                        piece = data.read(chunk_size)
+                        if not piece:
+                            break
+                        stream.write(piece)
+
+                await asyncio.to_thread(_copy_file)
+            await asyncio.to_thread(stream.close)
+        except BaseException:
+            await asyncio.to_thread(stream.abort)
+            raise
+
+        return {
+            "path": path,
+            "bytes_written": str(stream.bytes_written),
+            "overwrite": str(overwrite),
+        }
+
+    def open_upload_stream(
+        self,
+        workspace_id: str,
+        lakehouse_id: str,
+        path: str,
+        overwrite: bool = True,
+        chunk_size: int = 8 * 1024 * 1024,
+        max_concurrency: int = 4,
+    ) -> OneLakeUploadStream:
+        """Create ``path`` and return a stream that uploads into it.
+
+        Blocking; call it from a worker thread together with the writes.
+        """
+        onelake_path, full_path = self._parse_path(workspace_id, lakehouse_id, path)
+        fs_client = self._get_file_system_client(onelake_path.workspace_id)
+        self._ensure_parent_directory(fs_client, full_path)
+
+        file_client = fs_client.get_file_client(full_path)
+        if overwrite:
+            file_client.create_file()
+        else:
+            file_client.create_file(match_condition=MatchConditions.IfMissing)
+        _forget_listings(fs_client.file_system_name, full_path)
+        return OneLakeUploadStream(
+            file_client, chunk_size=chunk_size, max_concurrency=max_concurrency
+        )
+
     async def delete_path(
         self,
         workspace_id: str,
@@ -184,11 +760,14 @@ class OneLakeClient:
             file_client = fs_client.get_file_client(full_path)
             if file_client.exists():
                 file_client.delete_file()
+                _forget_listings(fs_client.file_system_name, full_path)
                 return {"deleted": path, "type": "file"}
 
             directory_client = fs_client.get_directory_client(full_path)
             if directory_client.exists():
                 directory_client.delete_directory(recursive=recursive)
+                _forget_directories(fs_client.file_system_name, full_path)
+                _forget_listings(fs_client.file_system_name, full_path)
                 return {"deleted": path, "type": "directory"}
 
             raise FileNotFoundError(f"Path '{path}' not found in lakehouse.")
@@ -1,8 +1,15 @@
+import time
+from typing import Any, Dict, Optional, Tuple
+
 from helpers.logging_config import get_logger
 from helpers.clients.fabric_client import FabricApiClient
+from helpers.utils.result_cache import dax_source, query_result_cache
 
 logger = get_logger(__name__)
 
+# Refresh history statuses of a refresh that has not finished yet
+_REFRESH_RUNNING = ("Unknown", "NotStarted")
+
 
 class SemanticModelClient:
     def __init__(self, client: FabricApiClient):
@@ -31,6 +38,86 @@ class SemanticModelClient:
 
         return model
 
+    async def last_refresh(self, workspace_id: str, model_id: str) -> Optional[Dict[str, Any]]:
+        """The most recent entry of the model's refresh history, or None if it has none."""
+        response = await self.client._make_request(
+            endpoint=f"https://api.powerbi.com/v1.0/myorg/groups/{workspace_id}/datasets/{model_id}/refreshes",
+            params={"$top": 1},
+            token_scope="https://analysis.windows.net/powerbi/api/.default",
+            raw_mode=True,
+        )
+        if not isinstance(response, dict) or "value" not in response:
+            raise ValueError(f"Unexpected refresh history response: {str(response)[:200]}")
+        return response["value"][0] if response["value"] else None
+
+    async def _data_version(self, workspace_id: str, model_id: str) -> Tuple[bool, Any]:
+        """(cacheable, version) of the model's data, from its last refresh.
+
+        Results are not cached while a refresh is running, since the data can
+        change under them at any moment, nor when the history is unavailable.
+        """
+        try:
+            refresh = await self.last_refresh(workspace_id, model_id)
+        except Exception as exc:
+            logger.warning(f"Refresh history unavailable, not caching DAX results: {exc}")
+            return False, None
+        if refresh is None:
+            return True, None
+        if refresh.get("status") in _REFRESH_RUNNING:
+            return False, None
+        return True, (refresh.get("requestId") or refresh.get("id"), refresh.get("endTime"))
+
+    async def execute_dax(
+        self,
+        workspace_id: str,
+        model_id: str,
+        query: str,
+        use_cache: bool = False,
+        invalidate_cache: bool = False,
+    ) -> Tuple[Any, Optional[Dict[str, Any]], float]:
+        """Run a DAX query through executeQueries.
+
+        Returns (response, cache metadata or None, seconds). With use_cache,
+        a cached response for the same model and normalized query is returned
+        when available; invalidate_cache drops the model's cached results first.
+        Cached results are keyed by the model's last completed refresh, so a
+        refresh makes them stale as soon as it finishes, and nothing is cached
+        or served from the cache while a refresh is running.
+        """
+        source = dax_source(workspace_id, model_id)
+        if invalidate_cache:
+            query_result_cache.invalidate(source)
+        version, bypassed = None, False
+        if use_cache:
+            use_cache, version = await self._data_version(workspace_id, model_id)
+            bypassed = not use_cache
+        if use_cache:
+            cached = query_result_cache.get(source, query, version=version)
+            if cached is not None:
+                response, metadata = cached
+                return response, metadata, metadata.get("originalSeconds", 0.0)
+
+        started = time.perf_counter()
+        response = await self.client._make_request(
+            endpoint=f"https://api.powerbi.com/v1.0/myorg/groups/{workspace_id}/datasets/{model_id}/executeQueries",
+            params={
+                "queries": [{"query": query}],
+                "serializerSettings": {"includeNulls": True},
+            },
+            method="post",
+            token_scope="https://analysis.windows.net/powerbi/api/.default",
+        )
+        seconds = time.perf_counter() - started
+
+        metadata = None
+        if use_cache and isinstance(response, dict) and "error" not in response:
+            metadata = query_result_cache.put(
+                source, query, None, response, seconds=seconds, version=version
+            )
+        elif bypassed:
+            metadata = {"hit": False, "bypassed": "model refresh running or history unavailable"}
+        return response, metadata, seconds
+
     # async def get_model_schema(
     #     self,
     #     workspace: str,
@@ -1,14 +1,25 @@
+import datetime
+import decimal
+import re
 import struct
+import threading
+import time
 import urllib.parse
+import uuid
 from itertools import chain, repeat
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 import polars as pl
+import pyarrow as pa
 from azure.identity import DefaultAzureCredential
-from sqlalchemy import Engine, create_engine
-from sqlalchemy.exc import ResourceClosedError
+from cachetools import TTLCache
+from pydantic import BaseModel
+from sqlalchemy import Engine, create_engine, event
+from sqlalchemy.exc import DBAPIError, DisconnectionError, ResourceClosedError
 
 from helpers.logging_config import get_logger
+from helpers.utils.authentication import get_cached_access_token
+from helpers.utils.result_cache import query_result_cache, sql_source
 from helpers.clients.fabric_client import FabricApiClient
 from helpers.clients.lakehouse_client import LakehouseClient
 from helpers.clients.warehouse_client import WarehouseClient
@@ -18,6 +29,72 @@ logger = get_logger(__name__)
 
 DRIVER = "{ODBC Driver 18 for SQL Server}"
 RESOURCE_URL = "https://database.windows.net/.default"
+SQL_COPT_SS_ACCESS_TOKEN = 1256
+
+
+class SqlPoolConfig(BaseModel):
+    """Configuration for the shared SQL endpoint engines"""
+
+    pool_size: int = 5
+    max_overflow: int = 5
+    pool_timeout: float = 30.0
+    # Pooled connections are retired this many seconds before their AAD token expires
+    token_expiry_margin: int = 300
+    endpoint_ttl: int = 1800  # seconds an endpoint descriptor stays cached
+
+
+# Arrow types for the Python types pyodbc reports in cursor.description
+_ARROW_TYPES = {
+    bool: pa.bool_(),
+    int: pa.int64(),
+    float: pa.float64(),
+    str: pa.string(),
+    bytes: pa.binary(),
+    bytearray: pa.binary(),
+    datetime.datetime: pa.timestamp("us"),
+    datetime.date: pa.date32(),
+    datetime.time: pa.time64("us"),
+}
+
+_SELECT_HEAD = re.compile(r"^\s*select\s+(?:(?:distinct|all)\s+)?", re.IGNORECASE)
+_NO_LIMIT_PUSHDOWN = re.compile(
+    r"^\s*select\s+(?:(?:distinct|all)\s+)?top\b|\b(?:union|intersect|except|into)\b"
+    r"|\boffset\s+\S+\s+rows?\b|--|/\*|;",
+    re.IGNORECASE,
+)
+
+
+def _arrow_type(column_description) -> pa.DataType:
+    type_code = column_description[1]
+    if type_code is decimal.Decimal:
+        precision, scale = column_description[4], column_description[5]
+        if precision and precision <= 38:
+            return pa.decimal128(precision, scale or 0)
+        return pa.string()
+    # Anything else (uniqueidentifier, sql_variant, ...) is carried as text
+    return _ARROW_TYPES.get(type_code, pa.string())
+
+
+def _column_array(values: List[Any], arrow_type: pa.DataType) -> pa.Array:
+    if arrow_type == pa.string():
+        values = [v if v is None or isinstance(v, str) else str(v) for v in values]
+    return pa.array(values, type=arrow_type)
+
+
+def push_down_row_limit(query: str, limit: int) -> str:
+    """Add ``TOP (limit)`` to a plain SELECT so the endpoint only produces ``limit`` rows.
+
+    Queries that already limit themselves, combine result sets, or are not a
+    single SELECT are returned unchanged; callers still stop reading after
+    ``limit`` rows.
+    """
+    stripped = query.strip()
+    if stripped.endswith(";"):
+        stripped = stripped[:-1].rstrip()
+    head = _SELECT_HEAD.match(stripped)
+    if not head or _NO_LIMIT_PUSHDOWN.search(stripped):
+        return query
+    return f"{stripped[:head.end()]}TOP ({int(limit)}) {stripped[head.end():]}"
 
 
 def _build_access_token_bytes(token: str) -> bytes:
@@ -51,20 +128,124 @@ def _create_engine(
     database: str,
     credential: DefaultAzureCredential,
     driver: str = DRIVER,
+    config: Optional[SqlPoolConfig] = None,
+    stats: Optional[Dict[str, int]] = None,
 ) -> Engine:
+    config = config or SqlPoolConfig()
+    stats = stats if stats is not None else {}
     connection_string = (
         f"Driver={driver};Server={server};Database={database};Encrypt=Yes;TrustServerCertificate=No"
     )
     params = urllib.parse.quote(connection_string)
 
-    token = credential.get_token(RESOURCE_URL)
-    attrs_before = {1256: _build_access_token_bytes(token.token)}
-
-    return create_engine(
+    engine = create_engine(
         f"mssql+pyodbc:///?odbc_connect={params}",
-        connect_args={"attrs_before": attrs_before},
+        pool_size=config.pool_size,
+        max_overflow=config.max_overflow,
+        pool_timeout=config.pool_timeout,
+        pool_pre_ping=True,
+        # Send executemany parameter arrays in one round trip (bulk loads)
+        fast_executemany=True,
     )
 
+    @event.listens_for(engine, "do_connect")
+    def _provide_token(dialect, conn_rec, cargs, cparams):
+        # Every new physical connection logs in with a current token
+        token = get_cached_access_token(credential, RESOURCE_URL)
+        cparams["attrs_before"] = {
+            SQL_COPT_SS_ACCESS_TOKEN: _build_access_token_bytes(token.token)
+        }
+        conn_rec.info["token_expires_on"] = token.expires_on
+        conn_rec.info["fresh"] = True
+        stats["connects"] = stats.get("connects", 0) + 1
+
+    @event.listens_for(engine, "checkout")
+    def _recycle_before_expiry(dbapi_conn, conn_rec, conn_proxy):
+        stats["checkouts"] = stats.get("checkouts", 0) + 1
+        # A brand-new connection is always handed out, even if the token cache
+        # served a token inside the margin while it refreshes in the background.
+        if conn_rec.info.pop("fresh", False):
+            return
+        expires_on = conn_rec.info.get("token_expires_on")
+        if expires_on is not None and expires_on - time.time() < config.token_expiry_margin:
+            stats["tokenRecycles"] = stats.get("tokenRecycles", 0) + 1
+            # Raising DisconnectionError makes the pool discard this connection
+            # and retry the checkout with a fresh login.
+            raise DisconnectionError("SQL access token is about to expire")
+
+    return engine
+
+
+class SqlEngineRegistry:
+    """Long-lived SQLAlchemy engines and endpoint descriptors shared across tool calls.
+
+    Engines are keyed by (server, database, credential) so back-to-back queries
+    against the same lakehouse or warehouse reuse a warm, bounded connection pool.
+    """
+
+    def __init__(self, config: Optional[SqlPoolConfig] = None):
+        self.config = config or SqlPoolConfig()
+        self._engines: Dict[Tuple[str, str, int], Engine] = {}
+        self._endpoints: TTLCache = TTLCache(maxsize=256, ttl=self.config.endpoint_ttl)
+        self._lock = threading.Lock()
+        self._stats: Dict[str, int] = {
+            "engineHits": 0,
+            "engineMisses": 0,
+            "endpointHits": 0,
+            "endpointMisses": 0,
+            "connects": 0,
+            "checkouts": 0,
+            "tokenRecycles": 0,
+        }
+
+    def configure(self, config: SqlPoolConfig) -> None:
+        """Replace the configuration and dispose existing engines."""
+        with self._lock:
+            self.config = config
+            for engine in self._engines.values():
+                engine.dispose()
+            self._engines.clear()
+            self._endpoints = TTLCache(maxsize=256, ttl=config.endpoint_ttl)
+
+    def get_engine(self, server: str, database: str, credential) -> Engine:
+        key = (server.lower(), database.lower(), id(credential))
+        with self._lock:
+            engine = self._engines.get(key)
+            if engine is not None:
+                self._stats["engineHits"] += 1
+                return engine
+            self._stats["engineMisses"] += 1
+            engine = _create_engine(
+                server, database, credential, config=self.config, stats=self._stats
+            )
+            self._engines[key] = engine
+            logger.debug(f"Created pooled SQL engine for {server}/{database}")
+            return engine
+
+    def get_endpoint(self, key: Tuple) -> Optional[Tuple[str, Dict[str, str]]]:
+        with self._lock:
+            cached = self._endpoints.get(key)
+            self._stats["endpointHits" if cached else "endpointMisses"] += 1
+            return cached
+
+    def store_endpoint(self, key: Tuple, name: Optional[str], endpoint: Dict[str, str]) -> None:
+        with self._lock:
+            self._endpoints[key] = (name, endpoint)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return engine/endpoint hit counters and per-engine pool status."""
+        with self._lock:
+            stats: Dict[str, Any] = dict(self._stats)
+            stats["reusedConnections"] = max(stats["checkouts"] - stats["connects"], 0)
+            stats["engines"] = [
+                {"server": server, "database": database, "pool": engine.pool.status()}
+                for (server, database, _), engine in self._engines.items()
+            ]
+            return stats
+
+
+sql_engines = SqlEngineRegistry()
+
 
 async def get_sql_endpoint(
     workspace: Optional[str] = None,
@@ -77,6 +258,18 @@ async def get_sql_endpoint(
         credential = credential or DefaultAzureCredential()
         client = FabricApiClient(credential)
 
+        resource = lakehouse if type and type.lower() == "lakehouse" else warehouse
+        cache_key = (
+            await client._tenant(),
+            str(workspace).lower(),
+            (type or "").lower(),
+            str(resource).lower(),
+        )
+        cached = sql_engines.get_endpoint(cache_key)
+        if cached is not None:
+            name, endpoint = cached
+            return name, dict(endpoint)
+
         _, workspace_id = await client.resolve_workspace_name_and_id(workspace)
 
         connection_string: Optional[str] = None
@@ -101,12 +294,12 @@ async def get_sql_endpoint(
 
             # Find the SQLEndpoint item - we need its ID as the database name
             sql_endpoint_id = None
-            items = await client.get_items(workspace_id=workspace_id)
-            for item in items:
-                if item.get("type") == "SQLEndpoint" and item.get("displayName") == resource_name:
-                    sql_endpoint_id = item["id"]
-                    logger.info(f"Found SQLEndpoint item: {sql_endpoint_id}")
-                    break
+            sql_endpoints = await client.find_items_by_name(
+                workspace_id, resource_name, type="SQLEndpoint"
+            )
+            if sql_endpoints:
+                sql_endpoint_id = sql_endpoints[0]["id"]
+                logger.info(f"Found SQLEndpoint item: {sql_endpoint_id}")
 
             # If no connection string from lakehouse properties, try the SQLEndpoint item
             if not connection_string and sql_endpoint_id:
@@ -181,13 +374,15 @@ async def get_sql_endpoint(
             # It's a full connection string, parse it
             server, database = _parse_connection_string(connection_string)
 
-        return resource_name, {
+        endpoint = {
             "workspaceId": workspace_id,
             "resourceId": resource_id,
             "server": server,
             "database": database,
             "connectionString": connection_string,
         }
+        sql_engines.store_endpoint(cache_key, resource_name, endpoint)
+        return resource_name, dict(endpoint)
     except Exception as exc:
         logger.error("Failed to resolve SQL endpoint: %s", exc)
         return None, None
@@ -203,45 +398,163 @@ class SQLClient:
         self._server = server
         self._database = database
         self._credential = credential
-        self.engine = _create_engine(server, database, credential)
-
-    def _refresh_engine(self) -> None:
-        """Recreate engine with fresh token. Azure tokens expire after ~1 hour."""
-        if self.engine:
-            self.engine.dispose()
-        self.engine = _create_engine(self._server, self._database, self._credential)
+        # Engines are shared process-wide, so constructing a client is cheap and
+        # reuses pooled, already-authenticated connections.
+        self.engine = sql_engines.get_engine(server, database, credential)
 
     def run_query(self, query: str) -> pl.DataFrame:
         try:
             return pl.read_database(query, connection=self.engine)
-        except Exception as e:
-            if "login" in str(e).lower() or "token" in str(e).lower() or "expired" in str(e).lower():
-                logger.info("SQL token may have expired, refreshing engine...")
-                self._refresh_engine()
-                return pl.read_database(query, connection=self.engine)
-            raise
+        except DBAPIError as e:
+            if not e.connection_invalidated:
+                raise
+            # The pool already dropped the dead connection; retry once on a new one.
+            logger.info("SQL connection was invalidated, retrying on a fresh connection...")
+            return pl.read_database(query, connection=self.engine)
+
+    def iter_batches(
+        self,
+        query: str,
+        batch_size: int = 10_000,
+        max_rows: Optional[int] = None,
+    ) -> Iterator[pa.RecordBatch]:
+        """Execute ``query`` and yield the result as Arrow record batches.
+
+        Rows are fetched from the cursor ``batch_size`` at a time, so memory use
+        does not grow with the size of the result. Reading stops after
+        ``max_rows`` rows when it is given.
+        """
+        connection = self.engine.raw_connection()
+        try:
+            cursor = connection.cursor()
+            cursor.execute(query)
+            if cursor.description is None:
+                return
+            names = [column[0] for column in cursor.description]
+            types = [_arrow_type(column) for column in cursor.description]
+            first_batch = True
+            remaining = max_rows
+            while remaining is None or remaining > 0:
+                size = batch_size if remaining is None else min(batch_size, remaining)
+                rows = cursor.fetchmany(size)
+                if not rows:
+                    break
+                arrays = []
+                for index, arrow_type in enumerate(types):
+                    values = [row[index] for row in rows]
+                    try:
+                        arrays.append(_column_array(values, arrow_type))
+                    except (pa.ArrowInvalid, pa.ArrowTypeError, TypeError, OverflowError):
+                        if not first_batch:
+                            raise
+                        # Fix the column as text for the rest of the result
+                        types[index] = pa.string()
+                        arrays.append(_column_array(values, pa.string()))
+                first_batch = False
+                if remaining is not None:
+                    remaining -= len(rows)
+                yield pa.RecordBatch.from_arrays(arrays, names=names)
+            cursor.close()
+        finally:
+            connection.close()
 
     def load_data(
         self,
         df: pl.DataFrame,
         table_name: str,
         if_exists: str = "append",
-    ) -> None:
-        pdf = df.to_pandas()
-        pdf.to_sql(table_name, con=self.engine, if_exists=if_exists, index=False)
+        method: str = "executemany",
+        chunk_size: int = 50_000,
+        staging: Optional[Tuple[Any, str, str]] = None,
+    ) -> Dict[str, Any]:
+        """Bulk load ``df`` into ``table_name`` and return load statistics.
+
+        method="executemany" inserts ``chunk_size`` rows per fast_executemany
+        batch and commits each chunk. method="copy_into" stages the frame as
+        Parquet in a lakehouse and issues COPY INTO; ``staging`` is a tuple of
+        (OneLakeClient, workspace_id, lakehouse_id).
+        """
+        if method not in ("executemany", "copy_into"):
+            raise ValueError("method must be 'executemany' or 'copy_into'.")
+        if method == "copy_into" and staging is None:
+            raise ValueError("A staging lakehouse is required for method='copy_into'.")
+
+        schema, table = table_name.split(".", 1) if "." in table_name else (None, table_name)
+        started = time.perf_counter()
+
+        # Create (or replace) the target table from the frame's schema
+        df.head(0).to_pandas().to_sql(
+            table, con=self.engine, schema=schema, if_exists=if_exists, index=False
+        )
+
+        chunks = 0
+        if method == "executemany":
+            for chunk in df.iter_slices(chunk_size):
+                chunk.to_pandas().to_sql(
+                    table, con=self.engine, schema=schema, if_exists="append", index=False
+                )
+                chunks += 1
+        elif df.height:
+            onelake_client, workspace_id, lakehouse_id = staging
+            staging_path = f"Files/_staging/{table}_{uuid.uuid4().hex}.parquet"
+            stream = onelake_client.open_upload_stream(workspace_id, lakehouse_id, staging_path)
+            try:
+                df.write_parquet(stream, row_group_size=chunk_size)
+                stream.close()
+            except Exception:
+                stream.abort()
+                raise
+            target = ".".join(f"[{part}]" for part in (schema, table) if part)
+            source = f"{onelake_client.ACCOUNT_URL}/{workspace_id}/{lakehouse_id}/{staging_path}"
+            try:
+                with self.engine.begin() as connection:
+                    connection.exec_driver_sql(
+                        f"COPY INTO {target} FROM '{source}' WITH (FILE_TYPE = 'PARQUET')"
+                    )
+            finally:
+                # abort() on a closed stream just removes the staged file
+                try:
+                    stream.abort()
+                except Exception as exc:
+                    logger.warning(f"Failed to remove staging file {staging_path}: {exc}")
+            chunks = 1
+
+        self._invalidate_cached_results()
+        seconds = time.perf_counter() - started
+        rows_per_second = round(df.height / seconds, 1) if seconds > 0 else None
+        logger.info(
+            f"Loaded {df.height} rows into {table_name} via {method} "
+            f"in {seconds:.1f}s ({rows_per_second} rows/s)"
+        )
+        return {
+            "method": method,
+            "rows": df.height,
+            "chunks": chunks,
+            "seconds": round(seconds, 3),
+            "rowsPerSecond": rows_per_second,
+        }
 
     def execute(self, statement: str) -> Dict[str, Any]:
         """Execute a SQL statement that may not return a result set."""
 
-        with self.engine.connect() as connection:
-            result = connection.exec_driver_sql(statement)
-            response: Dict[str, Any] = {"rowcount": result.rowcount}
-            try:
-                rows = result.fetchall()
-                columns = list(result.keys())
-                response["columns"] = columns
-                response["rows"] = [dict(zip(columns, row)) for row in rows]
-            except ResourceClosedError:
-                response["columns"] = []
-                response["rows"] = []
-            return response
+        try:
+            with self.engine.connect() as connection:
+                result = connection.exec_driver_sql(statement)
+                response: Dict[str, Any] = {"rowcount": result.rowcount}
+                try:
+                    rows = result.fetchall()
+                    columns = list(result.keys())
+                    response["columns"] = columns
+                    response["rows"] = [dict(zip(columns, row)) for row in rows]
+                except ResourceClosedError:
+                    response["columns"] = []
+                    response["rows"] = []
+                return response
+        finally:
+            # Any statement may write, so cached query results of this endpoint go stale
+            self._invalidate_cached_results()
+
+    def _invalidate_cached_results(self) -> None:
+        dropped = query_result_cache.invalidate(sql_source(self._server, self._database))
+        if dropped:
+            logger.debug(f"Dropped {dropped} cached results for {self._database}")
@@ -1,6 +1,6 @@
 from helpers.logging_config import get_logger
 from helpers.clients.fabric_client import FabricApiClient
-from helpers.utils.table_tools import get_delta_schemas
+from helpers.utils.table_tools import extract_delta_schemas, get_delta_schemas
 from azure.identity import DefaultAzureCredential
 from helpers.formatters.schema_formatter import format_schema_to_markdown
 from datetime import datetime
@@ -66,8 +66,15 @@ class TableClient:
         rsc_id: str,
         rsc_type: str,
         credential: DefaultAzureCredential,
+        max_concurrency: int = 8,
+        table_timeout: float = 60.0,
+        metadata_only: bool = False,
     ):
-        """Get schemas for all Delta tables in a Fabric lakehouse."""
+        """Get schemas for all Delta tables in a Fabric lakehouse.
+
+        Tables are read in parallel; tables that fail or time out are listed
+        at the end instead of failing the whole call.
+        """
         # Get all tables
         tables = await self.list_tables(workspace, rsc_id, rsc_type)
 
@@ -84,7 +91,13 @@ class TableClient:
             return f"No Delta tables found in {rsc_type} '{rsc_id}'."
 
         # Get schema for all tables
-        delta_tables = await get_delta_schemas(delta_format_tables, credential)
+        delta_tables, failures = await extract_delta_schemas(
+            delta_format_tables,
+            credential,
+            max_concurrency=max_concurrency,
+            table_timeout=table_timeout,
+            metadata_only=metadata_only,
+        )
 
         if not delta_tables:
             return "Could not retrieve schemas for any tables."
@@ -98,4 +111,9 @@ class TableClient:
         for table_info, schema, metadata in delta_tables:
             markdown += format_schema_to_markdown(table_info, schema, metadata)
 
+        if failures:
+            markdown += "## Skipped Tables\n\n"
+            for failure in failures:
+                markdown += f"- `{failure['table']}`: {failure['error']}\n"
+
         return markdown
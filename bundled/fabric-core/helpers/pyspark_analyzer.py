@@ -0,0 +1,765 @@
+"""
+AST-based performance analysis of PySpark notebook cells.
+
+Each cell is parsed and walked once to collect facts (reads, writes,
+actions, joins, UDFs, caching, lineage between DataFrame variables).
+Registered rules then turn those facts into findings, so adding a check
+does not add another pass over the code. DataFrame variables, their
+lineage and caching carry over from cell to cell, and lineage rules run
+over the facts of the whole notebook. Facts are cached by cell content and
+the bindings the cell starts from, and summaries by notebook content, so
+unchanged cells and notebooks are not analyzed again.
+"""
+
+import ast
+import hashlib
+import re
+import threading
+from dataclasses import dataclass, field, fields
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from cachetools import LRUCache
+
+from helpers.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+TRANSFORMATIONS = {
+    "select", "selectExpr", "withColumn", "withColumns", "withColumnRenamed",
+    "filter", "where", "join", "crossJoin", "groupBy", "groupby", "agg",
+    "orderBy", "sort", "distinct", "dropDuplicates", "union", "unionByName",
+    "drop", "limit", "repartition", "coalesce", "alias", "sample",
+}
+ACTIONS = {"show", "count", "collect", "take", "toPandas", "first", "head", "foreach", "toLocalIterator"}
+WRITE_METHODS = {"save", "saveAsTable", "insertInto", "parquet", "csv", "json", "start", "toTable"}
+# Methods that only exist on DataFrames, used to recognize frames of unknown origin
+FRAME_METHODS = {
+    "withColumn", "withColumns", "withColumnRenamed", "selectExpr", "groupBy", "groupby",
+    "agg", "orderBy", "dropDuplicates", "unionByName", "toPandas", "show", "collect",
+    "cache", "persist", "createOrReplaceTempView", "write", "writeStream", "rdd",
+    "repartition", "printSchema", "select", "filter", "where",
+}
+# Steps after which a frame is small enough to bring to the driver
+REDUCING_METHODS = {"limit", "agg", "groupBy", "groupby", "take", "head", "sample", "summary", "describe"}
+SHUFFLE_METHODS = {"join", "groupBy", "groupby", "distinct", "dropDuplicates", "orderBy", "sort", "repartition"}
+SPARK_READERS = {"read", "readStream", "table", "sql"}
+
+_SQL_QUERY = re.compile(r"^\s*(select|with)\b", re.IGNORECASE)
+_SQL_FROM = re.compile(r"\bfrom\b", re.IGNORECASE)
+_SQL_WHERE = re.compile(r"\bwhere\b", re.IGNORECASE)
+
+
+@dataclass
+class CellFacts:
+    """What one walk over a cell found; the input of every rule."""
+
+    reads: int = 0
+    writes: int = 0
+    transformations: int = 0
+    actions: int = 0
+    # (line, variable or None, used in the same expression) per table/file read
+    table_reads: List[Tuple[int, Optional[str], bool]] = field(default_factory=list)
+    sql_without_where: List[int] = field(default_factory=list)
+    collects: List[Tuple[int, str, str]] = field(default_factory=list)
+    udfs: List[Tuple[int, str, str]] = field(default_factory=list)
+    joins: List[Tuple[int, bool]] = field(default_factory=list)
+    unbounded_sorts: List[int] = field(default_factory=list)
+    shuffles: int = 0
+    frame_actions: Dict[str, List[int]] = field(default_factory=dict)
+    cached: Set[str] = field(default_factory=set)
+    filtered: Set[str] = field(default_factory=set)
+    consumed: Set[str] = field(default_factory=set)
+    parents: Dict[str, str] = field(default_factory=dict)
+    session_builders: List[int] = field(default_factory=list)
+    rdd_uses: List[int] = field(default_factory=list)
+    jdbc: List[int] = field(default_factory=list)
+    table_writes: List[Tuple[int, bool, bool]] = field(default_factory=list)
+
+    def lineage(self, name: str) -> Iterable[str]:
+        """The variable and the variables it was derived from, nearest first."""
+        seen = set()
+        while name and name not in seen:
+            seen.add(name)
+            yield name
+            name = self.parents.get(name)
+
+    @classmethod
+    def merge(cls, cells: List[Tuple[int, "CellFacts"]]) -> "CellFacts":
+        """Facts of several cells as one, with every line turned into (cell, line)."""
+        merged = cls()
+        for number, facts in cells:
+            for spec in fields(cls):
+                value = getattr(facts, spec.name)
+                target = getattr(merged, spec.name)
+                if isinstance(value, int):
+                    setattr(merged, spec.name, target + value)
+                elif isinstance(value, list):
+                    target.extend(
+                        ((number, entry[0]), *entry[1:]) if isinstance(entry, tuple) else (number, entry)
+                        for entry in value
+                    )
+                elif isinstance(value, set):
+                    target.update(value)
+                elif spec.name == "frame_actions":
+                    for name, lines in value.items():
+                        target.setdefault(name, []).extend((number, line) for line in lines)
+                else:
+                    target.update(value)
+        return merged
+
+
+@dataclass(frozen=True)
+class _Bindings:
+    """What a cell leaves behind for the next one: DataFrame variables and their lineage."""
+
+    frames: frozenset = frozenset()
+    small: frozenset = frozenset()
+    modules: frozenset = frozenset()
+    cached: frozenset = frozenset()
+    parents: Tuple[Tuple[str, str], ...] = ()
+
+    def digest(self) -> str:
+        text = repr(
+            (
+                sorted(self.frames),
+                sorted(self.small),
+                sorted(self.modules),
+                sorted(self.cached),
+                self.parents,
+            )
+        )
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _unwind(node: ast.AST) -> Tuple[Optional[ast.AST], List[Tuple[str, Optional[ast.Call]]]]:
+    """Split ``a.b(x).c.d(y)`` into its root and the steps [(b, call), (c, None), (d, call)]."""
+    steps: List[Tuple[str, Optional[ast.Call]]] = []
+    while True:
+        if isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute):
+            steps.append((node.func.attr, node))
+            node = node.func.value
+        elif isinstance(node, ast.Call) and isinstance(node.func, ast.Name):
+            steps.append((node.func.id, node))
+            node = None
+            break
+        elif isinstance(node, ast.Attribute):
+            steps.append((node.attr, None))
+            node = node.value
+        else:
+            break
+    steps.reverse()
+    return node, steps
+
+
+def _string_args(call: Optional[ast.Call]) -> List[str]:
+    if call is None:
+        return []
+    return [
+        arg.value for arg in call.args if isinstance(arg, ast.Constant) and isinstance(arg.value, str)
+    ]
+
+
+def _is_broadcast(node: ast.AST) -> bool:
+    _, steps = _unwind(node)
+    return any(name == "broadcast" for name, _ in steps) or any(
+        name == "hint" and "broadcast" in _string_args(call) for name, call in steps
+    )
+
+
+class _CellVisitor(ast.NodeVisitor):
+    """Collects CellFacts in one pass; DataFrame call chains are handled as a whole."""
+
+    def __init__(self, bindings: Optional[_Bindings] = None):
+        bindings = bindings or _Bindings()
+        self.facts = CellFacts(parents=dict(bindings.parents), cached=set(bindings.cached))
+        self.frames: Set[str] = set(bindings.frames)
+        self.small: Set[str] = set(bindings.small)
+        self.modules: Set[str] = set(bindings.modules)
+
+    def bindings(self) -> _Bindings:
+        return _Bindings(
+            frozenset(self.frames),
+            frozenset(self.small),
+            frozenset(self.modules),
+            frozenset(self.facts.cached),
+            tuple(sorted(self.facts.parents.items())),
+        )
+
+    # Imports name modules, whose attribute chains are not DataFrames
+    def visit_Import(self, node: ast.Import) -> None:
+        for alias in node.names:
+            self.modules.add((alias.asname or alias.name).split(".")[0])
+
+    def visit_ImportFrom(self, node: ast.ImportFrom) -> None:
+        for alias in node.names:
+            name = alias.asname or alias.name
+            if name in ("udf", "pandas_udf"):
+                continue
+            self.modules.add(name)
+
+    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
+        for decorator in node.decorator_list:
+            _, steps = _unwind(decorator)
+            names = [name for name, _ in steps] or (
+                [decorator.id] if isinstance(decorator, ast.Name) else []
+            )
+            for kind in ("pandas_udf", "udf"):
+                if kind in names:
+                    self.facts.udfs.append((node.lineno, kind, node.name))
+                    break
+        # Decorators were handled above
+        self.visit(node.args)
+        for statement in node.body:
+            self.visit(statement)
+
+    visit_AsyncFunctionDef = visit_FunctionDef
+
+    def visit_Assign(self, node: ast.Assign) -> None:
+        self._assign(node.targets, node.value)
+
+    def visit_AnnAssign(self, node: ast.AnnAssign) -> None:
+        if node.value is not None:
+            self._assign([node.target], node.value)
+
+    def _assign(self, targets: List[ast.expr], value: ast.expr) -> None:
+        # a, b = x, y binds element by element
+        if isinstance(value, (ast.Tuple, ast.List)) and all(
+            isinstance(target, (ast.Tuple, ast.List)) and len(target.elts) == len(value.elts)
+            for target in targets
+        ) and not any(isinstance(element, ast.Starred) for element in value.elts):
+            for index, element in enumerate(value.elts):
+                self._assign([target.elts[index] for target in targets], element)
+            return
+
+        frame = self._chain(value)
+        for target in targets:
+            self._target(target, frame)
+
+    def _target(self, target: ast.expr, frame: Optional[Dict[str, Any]]) -> None:
+        if isinstance(target, ast.Name) and frame is not None:
+            self._bind(target.id, frame)
+        elif isinstance(target, ast.Name):
+            self.frames.discard(target.id)
+        elif isinstance(target, ast.Starred):
+            self._target(target.value, None)
+        elif isinstance(target, (ast.Tuple, ast.List)):
+            # Unpacking anything else: the names no longer hold a known DataFrame
+            for element in target.elts:
+                self._target(element, None)
+        else:
+            self.visit(target)
+
+    def visit_Call(self, node: ast.Call) -> None:
+        self._chain(node)
+
+    def visit_Attribute(self, node: ast.Attribute) -> None:
+        self._chain(node)
+
+    def _bind(self, name: str, frame: Dict[str, Any]) -> None:
+        self.frames.add(name)
+        if frame["root"] is None:
+            self.facts.parents.pop(name, None)
+        elif frame["root"] != name:
+            self.facts.parents[name] = frame["root"]
+        # df = df.filter(...) keeps deriving from what df came from
+        if frame["read_index"] is not None:
+            line, _, used = self.facts.table_reads[frame["read_index"]]
+            self.facts.table_reads[frame["read_index"]] = (line, name, used)
+        if frame["cached"]:
+            self.facts.cached.add(name)
+        if frame["reduced"]:
+            self.small.add(name)
+        else:
+            self.small.discard(name)
+
+    def _chain(self, node: ast.AST) -> Optional[Dict[str, Any]]:
+        """Record one call chain; returns frame info when it evaluates to a DataFrame."""
+        root_node, steps = _unwind(node)
+        root = root_node.id if isinstance(root_node, ast.Name) else None
+        names = [name for name, _ in steps]
+
+        # Visit what the chain does not cover: its root expression and call arguments
+        if root_node is not None and root is None:
+            self.visit(root_node)
+        for _, call in steps:
+            if call is not None:
+                for arg in call.args:
+                    self.visit(arg)
+                for keyword in call.keywords:
+                    self.visit(keyword.value)
+
+        self._fabric_facts(node, root, steps)
+        if not steps:
+            # Plain alias of a DataFrame variable
+            if root in self.frames:
+                return {"root": root, "read_index": None, "cached": False, "reduced": root in self.small}
+            return None
+
+        from_spark = root == "spark" and names[0] in SPARK_READERS
+        if root is None and names == ["display"]:
+            # Fabric's display() runs the DataFrame like show()
+            argument = steps[0][1].args[0] if steps[0][1].args else None
+            if isinstance(argument, ast.Name) and argument.id in self.frames:
+                self.facts.actions += 1
+                self._consume(list(self.facts.lineage(argument.id)), node.lineno)
+            return None
+        if root == "spark" and names[:2] == ["udf", "register"]:
+            self.facts.udfs.append((node.lineno, "udf", next(iter(_string_args(steps[1][1])), "?")))
+            return None
+        if names[-1] in ("udf", "pandas_udf") and root != "spark":
+            # udf(f), F.udf(f) or functions.pandas_udf(f)
+            self.facts.udfs.append((node.lineno, names[-1], "<lambda>"))
+            return None
+        if root in self.modules and root != "spark":
+            return None
+        if not from_spark and root not in self.frames and not set(names) & FRAME_METHODS:
+            return None
+
+        frame = {"root": root if not from_spark else None, "read_index": None, "cached": False, "reduced": root in self.small}
+        lineage = [] if from_spark or root is None else list(self.facts.lineage(root))
+        if from_spark:
+            self.facts.reads += 1
+            if names[0] == "sql":
+                query = next(iter(_string_args(steps[0][1])), "")
+                if _SQL_QUERY.match(query) and _SQL_FROM.search(query) and not _SQL_WHERE.search(query):
+                    self.facts.sql_without_where.append(node.lineno)
+            else:
+                self.facts.table_reads.append((node.lineno, None, False))
+                frame["read_index"] = len(self.facts.table_reads) - 1
+
+        writing = False
+        filtered = False
+        for position, (name, call) in enumerate(steps):
+            if name in ("write", "writeStream"):
+                writing = True
+                self.facts.writes += 1
+                continue
+            if writing:
+                if name in ("saveAsTable", "save", "toTable"):
+                    formats = [
+                        value.lower()
+                        for step, step_call in steps
+                        if step == "format"
+                        for value in _string_args(step_call)
+                    ]
+                    self.facts.table_writes.append((node.lineno, "delta" in formats, "partitionBy" in names))
+                if name in WRITE_METHODS:
+                    # Writing a read straight out needs every partition; it does not count as a use
+                    self._consume(lineage, node.lineno, use=False)
+                continue
+            if name in ("cache", "persist"):
+                frame["cached"] = True
+                if position == len(steps) - 1 and root in self.frames and not from_spark:
+                    self.facts.cached.add(root)
+            elif name in ("filter", "where"):
+                filtered = True
+            elif name in REDUCING_METHODS:
+                frame["reduced"] = True
+
+            if name == "count" and ({"groupBy", "groupby"} & set(names[:position])):
+                self.facts.transformations += 1
+            elif name in ACTIONS:
+                self.facts.actions += 1
+                if name in ("collect", "toPandas", "toLocalIterator") and not frame["reduced"]:
+                    self.facts.collects.append((node.lineno, name, root or "spark"))
+                if not frame["cached"]:
+                    self._consume(lineage, node.lineno)
+            elif name in TRANSFORMATIONS:
+                self.facts.transformations += 1
+            if name in SHUFFLE_METHODS:
+                self.facts.shuffles += 1
+            if name == "join" and call is not None and call.args:
+                receiver = call.func.value if isinstance(call.func, ast.Attribute) else call
+                self.facts.joins.append(
+                    (node.lineno, _is_broadcast(call.args[0]) or _is_broadcast(receiver))
+                )
+            if name in ("orderBy", "sort") and "limit" not in names[position:]:
+                self.facts.unbounded_sorts.append(node.lineno)
+            if name in ("join", "groupBy", "groupby", "agg") or name in ACTIONS:
+                self.facts.consumed.update(lineage)
+                if frame["read_index"] is not None:
+                    line, read_name, _ = self.facts.table_reads[frame["read_index"]]
+                    self.facts.table_reads[frame["read_index"]] = (line, read_name, True)
+
+        if filtered:
+            self.facts.filtered.update(lineage)
+            if frame["read_index"] is not None:
+                del self.facts.table_reads[frame["read_index"]]
+                frame["read_index"] = None
+        return frame
+
+    def _consume(self, lineage: List[str], line: int, use: bool = True) -> None:
+        """Count an action against a variable and the uncached variables it derives from."""
+        for name in lineage:
+            self.facts.frame_actions.setdefault(name, []).append(line)
+            if use:
+                self.facts.consumed.add(name)
+            if name in self.facts.cached:
+                break
+
+    def _fabric_facts(self, node: ast.AST, root: Optional[str], steps) -> None:
+        names = [name for name, _ in steps]
+        if root == "SparkSession" and names[:1] == ["builder"]:
+            self.facts.session_builders.append(node.lineno)
+        if "rdd" in names or (root == "sc" and names[:1] != ["parallelize"]):
+            self.facts.rdd_uses.append(node.lineno)
+        if "jdbc" in names or any(
+            value.lower() == "jdbc" for name, call in steps if name == "format" for value in _string_args(call)
+        ):
+            self.facts.jdbc.append(node.lineno)
+
+
+@dataclass
+class Rule:
+    name: str
+    severity: str  # "warning" or "suggestion"
+    message: str
+    check: Callable[[CellFacts], Iterable[Tuple[Any, str]]]
+    # "cell" rules see one cell's facts; "notebook" rules see all cells merged,
+    # with (cell, line) positions, for checks that follow DataFrames across cells
+    scope: str = "cell"
+
+
+def _prepare_source(source: str) -> Tuple[Optional[str], Optional[str]]:
+    """Python code of a cell with magics blanked out, or (None, language) for non-Python cells."""
+    lines = source.splitlines()
+    first = next((line.strip() for line in lines if line.strip()), "")
+    if first.startswith("%%"):
+        language = first[2:].split()[0] if len(first) > 2 else ""
+        if language not in ("pyspark", "python"):
+            return None, language or "magic"
+    # Line magics and shell escapes are not Python; keep line numbers intact
+    cleaned = ["" if line.lstrip().startswith(("%", "!")) else line for line in lines]
+    return "\n".join(cleaned), None
+
+
+@dataclass
+class _CellAnalysis:
+    """Cached outcome of walking one cell: its facts and the bindings it leaves."""
+
+    operations: Dict[str, int]
+    shuffles: int
+    facts: CellFacts
+    bindings: _Bindings
+    status: Dict[str, str] = field(default_factory=dict)  # "skipped" or "error"
+
+
+class PySparkAnalyzer:
+    """Registry of performance rules plus caches of cell facts and notebook summaries.
+
+    Rules receive CellFacts and yield (line, detail) for each occurrence.
+    Cell facts are cached by cell source and the bindings the cell starts
+    from, so rules always run against the current rule set; registering a
+    rule only clears the notebook summaries.
+    """
+
+    def __init__(self, max_cells: int = 4096, max_notebooks: int = 1024):
+        self._rules: Dict[str, Rule] = {}
+        self._results: LRUCache = LRUCache(maxsize=max_cells)
+        self._notebooks: LRUCache = LRUCache(maxsize=max_notebooks)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.notebook_hits = 0
+        self.notebook_misses = 0
+
+    def rule(self, name: str, severity: str, message: str, scope: str = "cell"):
+        """Decorator registering a rule function under ``name``."""
+
+        def register(check: Callable[[CellFacts], Iterable[Tuple[Any, str]]]):
+            with self._lock:
+                self._rules[name] = Rule(name, severity, message, check, scope)
+                self._notebooks.clear()
+            return check
+
+        return register
+
+    @property
+    def rules(self) -> List[Rule]:
+        return list(self._rules.values())
+
+    def analyze_cell(self, source: str) -> Dict[str, Any]:
+        """Operation counts and findings for one cell analyzed on its own."""
+        analysis = self._cell(source, _Bindings())
+        return {
+            **analysis.status,
+            "operations": analysis.operations,
+            "shuffles": analysis.shuffles,
+            "findings": self._findings(self.rules, analysis.facts),
+        }
+
+    def analyze_notebook(self, sources: List[str]) -> Tuple[Dict[str, Any], bool]:
+        """Analyze a notebook's code cells; returns (summary, whether it was cached).
+
+        Cells are analyzed in order, each starting from the DataFrame bindings
+        the previous cells left. The summary has per-cell operation counts,
+        all findings with their 1-based cell number, operation totals and a
+        0-100 score that loses 10 points per distinct warning and 5 per
+        distinct suggestion. It is cached by a hash over all cell sources, so
+        a notebook whose code has not changed is not analyzed again.
+        Summaries are shared, do not modify them.
+        """
+        digest = hashlib.sha256()
+        for source in sources:
+            digest.update(source.encode("utf-8"))
+            digest.update(b"\0")
+        key = digest.hexdigest()
+        with self._lock:
+            summary = self._notebooks.get(key)
+            if summary is not None:
+                self.notebook_hits += 1
+                return summary, True
+            self.notebook_misses += 1
+
+        cell_rules = [rule for rule in self.rules if rule.scope == "cell"]
+        notebook_rules = [rule for rule in self.rules if rule.scope != "cell"]
+        cells = []
+        findings = []
+        analyzed: List[Tuple[int, CellFacts]] = []
+        totals: Dict[str, int] = {}
+        bindings = _Bindings()
+        for number, source in enumerate(sources, start=1):
+            if not source.strip():
+                continue
+            analysis = self._cell(source, bindings)
+            bindings = analysis.bindings
+            cells.append({"cell": number, "operations": analysis.operations, **analysis.status})
+            for name, count in analysis.operations.items():
+                totals[name] = totals.get(name, 0) + count
+            findings.extend(
+                {"cell": number, **finding} for finding in self._findings(cell_rules, analysis.facts)
+            )
+            analyzed.append((number, analysis.facts))
+
+        for finding in self._findings(notebook_rules, CellFacts.merge(analyzed)):
+            number, line = finding["line"]
+            findings.append({"cell": number, **finding, "line": line})
+        findings.sort(key=lambda finding: (finding["cell"], finding["line"]))
+
+        warnings = {finding["message"] for finding in findings if finding["severity"] == "warning"}
+        suggestions = {finding["message"] for finding in findings if finding["severity"] != "warning"}
+        summary = {
+            "digest": key,
+            "cells": cells,
+            "operations": totals,
+            "findings": findings,
+            "score": max(100 - len(warnings) * 10 - len(suggestions) * 5, 0),
+        }
+        with self._lock:
+            self._notebooks[key] = summary
+        return summary, False
+
+    def _cell(self, source: str, bindings: _Bindings) -> _CellAnalysis:
+        """Facts of one cell starting from ``bindings``; cached, do not modify them."""
+        digest = hashlib.sha256(source.encode("utf-8"))
+        digest.update(bindings.digest().encode("ascii"))
+        key = digest.hexdigest()
+        with self._lock:
+            analysis = self._results.get(key)
+            if analysis is not None:
+                self.hits += 1
+                return analysis
+            self.misses += 1
+
+        analysis = self._walk(source, bindings)
+        with self._lock:
+            self._results[key] = analysis
+        return analysis
+
+    @staticmethod
+    def _walk(source: str, bindings: _Bindings) -> _CellAnalysis:
+        code, language = _prepare_source(source)
+        if code is None:
+            return _CellAnalysis({}, 0, CellFacts(), bindings, {"skipped": language})
+        try:
+            tree = ast.parse(code)
+        except SyntaxError as exc:
+            return _CellAnalysis(
+                {}, 0, CellFacts(), bindings, {"error": f"line {exc.lineno}: {exc.msg}"}
+            )
+
+        visitor = _CellVisitor(bindings)
+        visitor.visit(tree)
+        facts = visitor.facts
+        operations = {
+            "DataFrame reads": facts.reads,
+            "DataFrame writes": facts.writes,
+            "Transformations": facts.transformations,
+            "Actions": facts.actions,
+        }
+        return _CellAnalysis(operations, facts.shuffles, facts, visitor.bindings())
+
+    @staticmethod
+    def _findings(rules: List[Rule], facts: CellFacts) -> List[Dict[str, Any]]:
+        findings = []
+        for rule in rules:
+            try:
+                for line, detail in rule.check(facts):
+                    findings.append(
+                        {
+                            "rule": rule.name,
+                            "severity": rule.severity,
+                            "message": rule.message,
+                            "line": line,
+                            "detail": detail,
+                        }
+                    )
+            except Exception as exc:
+                logger.warning(f"PySpark rule '{rule.name}' failed: {exc}")
+        findings.sort(key=lambda finding: finding["line"])
+        return findings
+
+    def clear(self) -> None:
+        with self._lock:
+            self._results.clear()
+            self._notebooks.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "cells": len(self._results),
+                "notebookHits": self.notebook_hits,
+                "notebookMisses": self.notebook_misses,
+                "notebooks": len(self._notebooks),
+                "rules": len(self._rules),
+            }
+
+
+pyspark_analyzer = PySparkAnalyzer()
+
+
+@pyspark_analyzer.rule(
+    "collect-large-frame",
+    "warning",
+    "⚠️ .collect()/.toPandas() pulls the whole DataFrame to the driver and can cause OOM; limit() or aggregate first",
+)
+def _collect_large_frame(facts: CellFacts):
+    for line, method, frame in facts.collects:
+        yield line, f"{frame}.{method}()"
+
+
+@pyspark_analyzer.rule(
+    "python-udf",
+    "warning",
+    "⚠️ Python UDFs move every row between the JVM and Python; prefer built-in pyspark.sql.functions",
+)
+def _python_udf(facts: CellFacts):
+    for line, kind, name in facts.udfs:
+        if kind == "udf":
+            yield line, name
+
+
+@pyspark_analyzer.rule(
+    "pandas-udf",
+    "suggestion",
+    "💡 pandas UDFs are vectorized but still leave the JVM; check for a built-in function first",
+)
+def _pandas_udf(facts: CellFacts):
+    for line, kind, name in facts.udfs:
+        if kind == "pandas_udf":
+            yield line, name
+
+
+@pyspark_analyzer.rule(
+    "repeated-actions-without-cache",
+    "warning",
+    "⚠️ DataFrame is computed by several actions without cache()/persist(); each one recomputes its full lineage",
+    scope="notebook",
+)
+def _repeated_actions(facts: CellFacts):
+    for name, lines in facts.frame_actions.items():
+        if len(lines) > 1 and name not in facts.cached:
+            yield lines[1], f"{name}: {len(lines)} actions"
+
+
+@pyspark_analyzer.rule(
+    "missing-partition-pruning",
+    "suggestion",
+    "💡 Table read without a filter; filter on partition columns right after reading so partitions are pruned",
+    scope="notebook",
+)
+def _missing_partition_pruning(facts: CellFacts):
+    for line, name, used in facts.table_reads:
+        # Reads that are only copied to a sink need every partition anyway
+        if name is None and used:
+            yield line, "inline read"
+        elif name is not None and name not in facts.filtered and name in facts.consumed:
+            yield line, name
+    for line in facts.sql_without_where:
+        yield line, "spark.sql without WHERE"
+
+
+@pyspark_analyzer.rule(
+    "shuffle-join",
+    "suggestion",
+    "💡 Join without a broadcast hint shuffles both sides; broadcast() small dimension tables",
+)
+def _shuffle_join(facts: CellFacts):
+    for line, broadcast in facts.joins:
+        if not broadcast:
+            yield line, "join"
+
+
+@pyspark_analyzer.rule(
+    "global-sort",
+    "suggestion",
+    "💡 orderBy()/sort() without limit() shuffles the whole DataFrame into one global order",
+)
+def _global_sort(facts: CellFacts):
+    for line in facts.unbounded_sorts:
+        yield line, "orderBy"
+
+
+@pyspark_analyzer.rule(
+    "spark-session-builder",
+    "warning",
+    "❌ Don't create SparkSession in Fabric - use pre-configured 'spark' variable",
+)
+def _spark_session_builder(facts: CellFacts):
+    for line in facts.session_builders:
+        yield line, "SparkSession.builder"
+
+
+@pyspark_analyzer.rule(
+    "rdd-api",
+    "warning",
+    "⚠️ RDD operations are less optimized than DataFrame operations",
+)
+def _rdd_api(facts: CellFacts):
+    for line in facts.rdd_uses:
+        yield line, "rdd"
+
+
+@pyspark_analyzer.rule(
+    "jdbc-source",
+    "suggestion",
+    "💡 Consider using Fabric's built-in connectors instead of JDBC",
+)
+def _jdbc_source(facts: CellFacts):
+    for line in facts.jdbc:
+        yield line, "jdbc"
+
+
+@pyspark_analyzer.rule(
+    "table-write-format",
+    "suggestion",
+    "💡 Specify Delta format explicitly when saving tables in Fabric",
+)
+def _table_write_format(facts: CellFacts):
+    for line, delta, _ in facts.table_writes:
+        if not delta:
+            yield line, "saveAsTable"
+
+
+@pyspark_analyzer.rule(
+    "write-without-partitioning",
+    "suggestion",
+    "💡 Consider partitionBy() when writing large tables",
+)
+def _write_without_partitioning(facts: CellFacts):
+    for line, _, partitioned in facts.table_writes:
+        if not partitioned:
+            yield line, "write"
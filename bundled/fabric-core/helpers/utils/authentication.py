@@ -1,6 +1,23 @@
+import asyncio
+import threading
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional
+
+from azure.core.credentials import AccessToken
 from azure.identity import DefaultAzureCredential
 from cachetools import TTLCache
 
+from helpers.logging_config import get_logger
+
+
+logger = get_logger(__name__)
+
+# Credentials outlive the short-lived session cache so their internal MSAL
+# cache is not thrown away every time the context TTL expires.
+_credentials: Dict[str, DefaultAzureCredential] = {}
+
 
 def get_azure_credentials(client_id: str, cache: TTLCache) -> DefaultAzureCredential:
     """
@@ -9,8 +26,153 @@ def get_azure_credentials(client_id: str, cache: TTLCache) -> DefaultAzureCreden
     """
     if f"{client_id}_creds" in cache:
         return cache[f"{client_id}_creds"]
-    # If credentials are not cached, create a new DefaultAzureCredential instance
-    # and store it in the cache.
-    else:
-        cache[f"{client_id}_creds"] = DefaultAzureCredential()
-        return cache[f"{client_id}_creds"]
+    # If credentials are not cached, reuse the long-lived instance for this client
+    # (or create one) and store it in the cache.
+    credential = _credentials.get(client_id)
+    if credential is None:
+        credential = DefaultAzureCredential()
+        _credentials[client_id] = credential
+    cache[f"{client_id}_creds"] = credential
+    return credential
+
+
+class TokenCache:
+    """Per-(credential, scope) access token cache with background refresh.
+
+    Tokens are served from memory while they are valid. Once a token is within
+    ``refresh_margin`` seconds of expiry it is still served, and a refresh is
+    started on a worker thread so callers never wait on token acquisition.
+    Cold misses for the same (credential, scope) are coalesced into one
+    ``credential.get_token`` call; async callers wait for it on a worker
+    thread (``get_access_token_async``) instead of blocking the event loop.
+    """
+
+    def __init__(self, refresh_margin: int = 300, min_validity: int = 30):
+        self.refresh_margin = refresh_margin
+        self.min_validity = min_validity
+        self._tokens: "weakref.WeakKeyDictionary[object, Dict[str, AccessToken]]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._refreshing: set = set()
+        self._lock = threading.Lock()
+        # One lock per (credential, scope) so concurrent cold misses fetch once
+        self._fetch_locks: "weakref.WeakKeyDictionary[object, Dict[str, threading.Lock]]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._executor = ThreadPoolExecutor(
+            max_workers=2, thread_name_prefix="token-refresh"
+        )
+        self.hits = 0
+        self.misses = 0
+        self.refreshes = 0
+        self.refresh_failures = 0
+
+    def get_token(self, credential, scope: str) -> str:
+        """Return a bearer token for ``scope``, fetching it only on a cold miss."""
+        return self.get_access_token(credential, scope).token
+
+    def get_access_token(self, credential, scope: str) -> AccessToken:
+        """Like get_token, but return the AccessToken so callers can see its expiry."""
+        token = self._cached(credential, scope)
+        if token is not None:
+            return token
+        return self._fetch(credential, scope)
+
+    async def get_token_async(self, credential, scope: str) -> str:
+        """get_token for async callers; a cold miss is fetched on a worker thread."""
+        return (await self.get_access_token_async(credential, scope)).token
+
+    async def get_access_token_async(self, credential, scope: str) -> AccessToken:
+        """get_access_token for async callers; a cold miss is fetched on a worker thread."""
+        token = self._cached(credential, scope)
+        if token is not None:
+            return token
+        return await asyncio.to_thread(self._fetch, credential, scope)
+
+    def _cached(self, credential, scope: str) -> Optional[AccessToken]:
+        """A valid cached token (scheduling a refresh when it is close to expiry), or None."""
+        now = time.time()
+        with self._lock:
+            token = self._tokens.get(credential, {}).get(scope)
+            if token is not None and token.expires_on - now > self.min_validity:
+                self.hits += 1
+                if token.expires_on - now <= self.refresh_margin:
+                    self._schedule_refresh(credential, scope)
+                return token
+        return None
+
+    def _fetch(self, credential, scope: str) -> AccessToken:
+        with self._lock:
+            locks = self._fetch_locks.setdefault(credential, {})
+            fetch_lock = locks.setdefault(scope, threading.Lock())
+        with fetch_lock:
+            # Another caller may have fetched it while this one waited
+            token = self._cached(credential, scope)
+            if token is not None:
+                return token
+            with self._lock:
+                self.misses += 1
+            token = credential.get_token(scope)
+            self._store(credential, scope, token)
+            return token
+
+    def _store(self, credential, scope: str, token: AccessToken) -> None:
+        with self._lock:
+            self._tokens.setdefault(credential, {})[scope] = token
+
+    def _schedule_refresh(self, credential, scope: str) -> None:
+        # Caller holds self._lock
+        key = (id(credential), scope)
+        if key in self._refreshing:
+            return
+        self._refreshing.add(key)
+        self._executor.submit(self._refresh, credential, scope, key)
+
+    def _refresh(self, credential, scope: str, key) -> None:
+        try:
+            token = credential.get_token(scope)
+            self._store(credential, scope, token)
+            with self._lock:
+                self.refreshes += 1
+            logger.debug(f"Refreshed access token for scope {scope}")
+        except Exception as exc:
+            with self._lock:
+                self.refresh_failures += 1
+            logger.warning(f"Background token refresh failed for {scope}: {exc}")
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit/miss/refresh counters."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "refreshes": self.refreshes,
+                "refreshFailures": self.refresh_failures,
+                "cachedCredentials": len(self._tokens),
+            }
+
+
+_token_cache = TokenCache()
+
+
+def get_cached_token(credential, scope: str) -> str:
+    """Get a bearer token for ``scope`` from the shared token cache."""
+    return _token_cache.get_token(credential, scope)
+
+
+async def get_cached_token_async(credential, scope: str) -> str:
+    """Like get_cached_token, without blocking the event loop on a cold miss."""
+    return await _token_cache.get_token_async(credential, scope)
+
+
+def get_cached_access_token(credential, scope: str) -> AccessToken:
+    """Get an AccessToken (token and expiry) for ``scope`` from the shared token cache."""
+    return _token_cache.get_access_token(credential, scope)
+
+
+def get_token_cache_stats() -> Dict[str, int]:
+    """Return counters for the shared token cache."""
+    return _token_cache.stats()
@@ -0,0 +1,102 @@
+import asyncio
+import threading
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Tuple
+
+from cachetools import TTLCache
+
+from helpers.utils.single_flight import SingleFlight
+
+
+class DefinitionCache(ABC):
+    """TTL cache of parsed item definitions, shared by the model and notebook caches.
+
+    Entries are keyed by (workspace, item) and served from memory until
+    ``ttl`` expires. Concurrent loads of the same item share one fetch
+    through SingleFlight, and ``write_lock`` serializes read-modify-write
+    cycles on an item. Every save starts a new generation for the item: a
+    load that began before the save neither replaces the saved definition
+    (callers get the saved one instead) nor is joined by a later reload.
+
+    Subclasses implement ``_load`` to fetch and parse one definition.
+    """
+
+    # Name of the entry count in stats()
+    _count_key = "entries"
+
+    def __init__(self, ttl: int, maxsize: int):
+        self._entries: TTLCache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._generations: Dict[Tuple[str, str], int] = {}
+        self._lock = threading.Lock()
+        self._loads = SingleFlight()
+        self._write_locks: Dict[Tuple[int, str, str], asyncio.Lock] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _key(workspace_id: str, item_id: str) -> Tuple[str, str]:
+        return str(workspace_id).lower(), str(item_id).lower()
+
+    @abstractmethod
+    async def _load(self, fabric_client, workspace_id: str, item_id: str) -> Any:
+        """Fetch and parse the definition of one item."""
+
+    def _store(self, key: Tuple[str, str], definition: Any) -> None:
+        """Cache a freshly loaded definition; called with ``_lock`` held."""
+        self._entries[key] = definition
+
+    async def get(
+        self,
+        fabric_client,
+        workspace_id: str,
+        item_id: str,
+        refresh: bool = False,
+    ) -> Any:
+        """Return the parsed definition, fetching it when not cached (or when ``refresh``)."""
+        key = self._key(workspace_id, item_id)
+        with self._lock:
+            definition = None if refresh else self._entries.get(key)
+            generation = self._generations.get(key, 0)
+        if definition is not None:
+            self.hits += 1
+            return definition
+
+        async def fetch() -> Any:
+            self.misses += 1
+            definition = await self._load(fabric_client, workspace_id, item_id)
+            with self._lock:
+                saved = self._entries.get(key)
+                if self._generations.get(key, 0) != generation and saved is not None:
+                    return saved
+                self._store(key, definition)
+            return definition
+
+        # The definition is shared by every caller, so it is not copied
+        return await self._loads.do(key + (generation,), fetch, copy_result=False)
+
+    def committed(self, workspace_id: str, item_id: str, definition: Any) -> None:
+        """Replace the cached definition with one that was just saved."""
+        key = self._key(workspace_id, item_id)
+        with self._lock:
+            self._generations[key] = self._generations.get(key, 0) + 1
+            self._entries[key] = definition
+
+    def write_lock(self, workspace_id: str, item_id: str) -> asyncio.Lock:
+        """Lock serializing read-modify-write cycles on one item."""
+        key = (id(asyncio.get_running_loop()),) + self._key(workspace_id, item_id)
+        lock = self._write_locks.get(key)
+        if lock is None:
+            lock = self._write_locks[key] = asyncio.Lock()
+        return lock
+
+    def invalidate(self, workspace_id: str, item_id: str) -> None:
+        with self._lock:
+            self._entries.pop(self._key(workspace_id, item_id), None)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                self._count_key: len(self._entries),
+            }
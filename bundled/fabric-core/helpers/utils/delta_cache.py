@@ -0,0 +1,179 @@
+import atexit
+import json
+import os
+import threading
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+from cachetools import LRUCache
+from deltalake import Schema
+
+from helpers.logging_config import get_logger
+
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class DeltaLogMetadata:
+    """Table metadata read straight from the Delta log (same fields as DeltaTable.metadata())."""
+
+    id: str
+    name: Optional[str] = None
+    description: Optional[str] = None
+    partition_columns: List[str] = field(default_factory=list)
+    created_time: Optional[int] = None
+    configuration: Dict[str, str] = field(default_factory=dict)
+
+    @classmethod
+    def from_metadata(cls, metadata: object) -> "DeltaLogMetadata":
+        """Copy the fields of a deltalake Metadata object."""
+        return cls(
+            id=str(metadata.id),
+            name=metadata.name,
+            description=metadata.description,
+            partition_columns=list(metadata.partition_columns or []),
+            created_time=metadata.created_time,
+            configuration=dict(metadata.configuration or {}),
+        )
+
+
+def split_location(location: str) -> Tuple[str, str]:
+    """Split an abfss:// table location into (file system, table path)."""
+    parsed = urlparse(location)
+    return parsed.netloc.split("@", 1)[0], parsed.path.strip("/")
+
+
+def latest_delta_version(location: str, fs_client_factory) -> int:
+    """Return the latest committed version of a Delta table with one _delta_log listing."""
+    file_system, table_path = split_location(location)
+    fs_client = fs_client_factory(file_system)
+    latest = -1
+    for entry in fs_client.get_paths(path=f"{table_path}/_delta_log", recursive=False):
+        name = entry.name.rsplit("/", 1)[-1]
+        stem = name.split(".", 1)[0]
+        if stem.isdigit() and (name.endswith(".json") or ".checkpoint." in name):
+            latest = max(latest, int(stem))
+    if latest < 0:
+        raise ValueError(f"No Delta commits found for {location}")
+    return latest
+
+
+class DeltaMetadataCache:
+    """LRU cache of Delta schema, metadata and history keyed by (location, version).
+
+    A Delta version is immutable, so entries never go stale; a new commit simply
+    produces a new key. Optionally persisted as JSON so restarts stay warm.
+    """
+
+    def __init__(self, maxsize: int = 1024, persist_path: Optional[str] = None):
+        self._entries: LRUCache = LRUCache(maxsize=maxsize)
+        self._lock = threading.Lock()
+        self._persist_path = persist_path
+        self._dirty = False
+        self.hits = 0
+        self.misses = 0
+        if persist_path:
+            self._load()
+
+    @staticmethod
+    def _key(location: str, version: int) -> Tuple[str, int]:
+        return location.rstrip("/"), int(version)
+
+    def get(self, location: str, version: int) -> Optional[Tuple[Schema, DeltaLogMetadata]]:
+        with self._lock:
+            entry = self._entries.get(self._key(location, version))
+            if entry is None or "schema" not in entry:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return Schema.from_json(entry["schema"]), DeltaLogMetadata(**entry["metadata"])
+
+    def put(self, location: str, version: int, schema: Schema, metadata: object) -> None:
+        if not isinstance(metadata, DeltaLogMetadata):
+            metadata = DeltaLogMetadata.from_metadata(metadata)
+        with self._lock:
+            entry = self._entries.get(self._key(location, version)) or {}
+            entry["schema"] = schema.to_json()
+            entry["metadata"] = asdict(metadata)
+            self._entries[self._key(location, version)] = entry
+            self._dirty = True
+
+    def get_history(self, location: str, version: int, limit: int) -> Optional[List[Dict[str, Any]]]:
+        """Return cached history when at least ``limit`` entries were fetched for this version."""
+        with self._lock:
+            entry = self._entries.get(self._key(location, version)) or {}
+            history = entry.get("history")
+            if history is None or (len(history) < limit and not entry.get("historyComplete")):
+                self.misses += 1
+                return None
+            self.hits += 1
+            return history[:limit]
+
+    def put_history(self, location: str, version: int, history: List[Dict[str, Any]], limit: int) -> None:
+        with self._lock:
+            entry = self._entries.get(self._key(location, version)) or {}
+            if len(history) >= len(entry.get("history") or []):
+                entry["history"] = history
+                entry["historyComplete"] = len(history) < limit
+            self._entries[self._key(location, version)] = entry
+            self._dirty = True
+
+    def _load(self) -> None:
+        try:
+            with open(self._persist_path, "r", encoding="utf-8") as f:
+                for item in json.load(f):
+                    self._entries[(item["location"], item["version"])] = item["entry"]
+            logger.info(f"Loaded {len(self._entries)} Delta metadata entries from {self._persist_path}")
+        except FileNotFoundError:
+            pass
+        except Exception as exc:
+            # A corrupt cache file must never break schema lookups
+            logger.warning(f"Ignoring unreadable Delta cache file {self._persist_path}: {exc}")
+
+    def flush(self) -> None:
+        """Write the cache to ``persist_path`` if it changed."""
+        if not self._persist_path:
+            return
+        with self._lock:
+            if not self._dirty:
+                return
+            items = [
+                {"location": location, "version": version, "entry": entry}
+                for (location, version), entry in self._entries.items()
+            ]
+            self._dirty = False
+        tmp_path = f"{self._persist_path}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(items, f, default=str)
+            os.replace(tmp_path, self._persist_path)
+        except OSError as exc:
+            logger.warning(f"Failed to persist Delta cache to {self._persist_path}: {exc}")
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "entries": len(self._entries),
+                "persistPath": self._persist_path,
+            }
+
+
+delta_cache = DeltaMetadataCache()
+
+
+def configure_delta_cache(maxsize: int = 1024, persist_path: Optional[str] = None) -> None:
+    """Replace the shared cache, e.g. to enable persistence at startup."""
+    global delta_cache
+    delta_cache.flush()
+    delta_cache = DeltaMetadataCache(maxsize=maxsize, persist_path=persist_path)
+
+
+def get_delta_cache() -> DeltaMetadataCache:
+    return delta_cache
+
+
+atexit.register(lambda: delta_cache.flush())
@@ -0,0 +1,125 @@
+import asyncio
+import concurrent.futures
+from typing import Dict, Set, Tuple, Union
+
+import httpx
+import requests
+from pydantic import BaseModel
+from requests.adapters import HTTPAdapter
+
+from helpers.logging_config import get_logger
+
+
+logger = get_logger(__name__)
+
+
+class HttpPoolConfig(BaseModel):
+    """Configuration for the process-wide HTTP connection pools"""
+
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry: float = 60.0  # idle seconds before a pooled connection is evicted
+    http2: bool = True
+    timeout: float = 120.0
+
+
+_config = HttpPoolConfig()
+# One AsyncClient per (scheme, host, port); the loop is stored alongside because
+# httpx connections cannot be shared between event loops.
+_async_clients: Dict[Tuple[str, str, int], Tuple[httpx.AsyncClient, asyncio.AbstractEventLoop]] = {}
+# aclose() tasks of replaced clients, kept referenced until they finish
+_closing: Set[Union[asyncio.Future, concurrent.futures.Future]] = set()
+# Blocking sessions for SDKs that run in worker threads (e.g. azure-storage for OneLake DFS).
+_sync_sessions: Dict[Tuple[str, str, int], requests.Session] = {}
+
+
+def _host_key(url: str) -> Tuple[str, str, int]:
+    parsed = httpx.URL(url)
+    port = parsed.port or (443 if parsed.scheme == "https" else 80)
+    return parsed.scheme, parsed.host, port
+
+
+def _http2_available() -> bool:
+    if not _config.http2:
+        return False
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _close_async_client(client: httpx.AsyncClient, loop: asyncio.AbstractEventLoop) -> None:
+    """Close a pooled client on the event loop that owns its connections."""
+    if client.is_closed or loop.is_closed():
+        # A closed loop cannot run aclose(); its sockets are released with it
+        return
+    try:
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        running = None
+    if running is loop:
+        future = loop.create_task(client.aclose())
+    elif loop.is_running():
+        future = asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+    else:
+        loop.run_until_complete(client.aclose())
+        return
+    _closing.add(future)
+    future.add_done_callback(_closing.discard)
+
+
+def configure_http_pool(config: HttpPoolConfig) -> None:
+    """Replace the pool configuration. Pools created afterwards use the new settings."""
+    global _config
+    _config = config
+    for client, loop in list(_async_clients.values()):
+        _close_async_client(client, loop)
+    _async_clients.clear()
+    for session in _sync_sessions.values():
+        session.close()
+    _sync_sessions.clear()
+
+
+def get_http_client(url: str) -> httpx.AsyncClient:
+    """Return the shared keep-alive AsyncClient for the host of ``url``."""
+    key = _host_key(url)
+    loop = asyncio.get_running_loop()
+    entry = _async_clients.get(key)
+    if entry is not None:
+        client, client_loop = entry
+        if client_loop is loop and not client.is_closed:
+            return client
+        # Created on another (or a finished) event loop; its connections cannot be reused here
+        _close_async_client(client, client_loop)
+
+    http2 = _http2_available()
+    client = httpx.AsyncClient(
+        http2=http2,
+        limits=httpx.Limits(
+            max_connections=_config.max_connections,
+            max_keepalive_connections=_config.max_keepalive_connections,
+            keepalive_expiry=_config.keepalive_expiry,
+        ),
+        timeout=_config.timeout,
+        follow_redirects=True,
+    )
+    _async_clients[key] = (client, loop)
+    logger.debug(f"Created pooled HTTP client for {key[1]} (http2={http2})")
+    return client
+
+
+def get_sync_session(url: str) -> requests.Session:
+    """Return the shared keep-alive requests.Session for the host of ``url``."""
+    key = _host_key(url)
+    session = _sync_sessions.get(key)
+    if session is None:
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=_config.max_connections,
+        )
+        session.mount(f"{key[0]}://", adapter)
+        _sync_sessions[key] = session
+        logger.debug(f"Created pooled HTTP session for {key[1]}")
+    return session
@@ -0,0 +1,359 @@
+import asyncio
+import re
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+import httpx
+from cachetools import TTLCache
+from pydantic import BaseModel
+
+from helpers.logging_config import get_logger
+from helpers.utils.http_pool import get_http_client
+from helpers.utils.rate_limiter import fabric_rate_limiter, retry_after_seconds
+
+
+logger = get_logger(__name__)
+
+_SUCCEEDED = {"succeeded", "completed"}
+_FAILED = {"failed", "canceled", "cancelled", "deduped"}
+# Fabric operation URLs whose result is served from {operation}/result
+_OPERATION_URL = re.compile(r"/operations/[0-9a-fA-F-]{36}/?$")
+
+
+class LroConfig(BaseModel):
+    """Polling policy for long-running operations"""
+
+    max_interval: float = 30.0  # upper bound for the backoff between polls
+    backoff_factor: float = 1.5  # interval growth while the status is unchanged
+    max_poll_errors: int = 5  # consecutive transport/5xx errors before giving up
+    retention: int = 3600  # seconds a finished operation stays queryable
+    max_operations: int = 1024
+
+
+def _timestamp(value: float) -> str:
+    return datetime.fromtimestamp(value, tz=timezone.utc).isoformat()
+
+
+class LroOperation:
+    """Handle for one long-running operation tracked by the LroManager."""
+
+    def __init__(
+        self,
+        op_url: str,
+        result_url: Optional[str],
+        label: str,
+        poll_headers: Callable[[], Awaitable[Dict[str, str]]],
+        result_headers: Callable[[], Awaitable[Dict[str, str]]],
+        interval: float,
+        operation_id: Optional[str] = None,
+        on_done: Optional[Callable[[], None]] = None,
+    ):
+        self.id = operation_id or str(uuid.uuid4())
+        self.op_url = op_url
+        self.result_url = result_url
+        self.label = label
+        self.poll_headers = poll_headers
+        self.result_headers = result_headers
+        self.on_done = on_done
+        self.initial_interval = max(interval, 0.5)
+        self.interval = self.initial_interval
+        self.status = "Running"
+        self.percent_complete: Optional[float] = None
+        self.result: Any = None
+        self.error: Optional[str] = None
+        self.done = False
+        self.polls = 0
+        self.poll_errors = 0
+        self.created = time.time()
+        self.updated = self.created
+        self.next_poll = 0.0
+        self.future: Optional[asyncio.Future] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        handle = {
+            "operationId": self.id,
+            "operation": self.label,
+            "status": self.status,
+            "done": self.done,
+            "percentComplete": self.percent_complete,
+            "polls": self.polls,
+            "createdAt": _timestamp(self.created),
+            "updatedAt": _timestamp(self.updated),
+            "elapsedSeconds": round(self.updated - self.created, 1),
+        }
+        if self.done:
+            handle["result"] = self.result
+        if self.error:
+            handle["error"] = self.error
+        return handle
+
+
+class LroManager:
+    """Polls every pending Operation-Location from a single scheduler task.
+
+    Due polls run as tasks of their own, so a slow poll or result fetch never
+    holds up the other operations, and an unexpected error fails only the
+    operation it came from.
+
+    Each operation is re-polled on its own schedule: the server's Retry-After
+    when it sends one, otherwise an interval that starts at the caller's poll
+    interval and grows by ``backoff_factor`` while the status does not change.
+    Callers get an LroOperation handle back immediately and may await it with
+    wait(); finished operations stay queryable for ``retention`` seconds.
+    """
+
+    def __init__(self, config: Optional[LroConfig] = None):
+        self.config = config or LroConfig()
+        self._active: Dict[str, LroOperation] = {}
+        self._finished: TTLCache = TTLCache(
+            maxsize=self.config.max_operations, ttl=self.config.retention
+        )
+        self._task: Optional[asyncio.Task] = None
+        self._polling: Dict[str, asyncio.Task] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self.started = 0
+        self.polls = 0
+        self.retry_after_polls = 0
+
+    def start(
+        self,
+        response: httpx.Response,
+        poll_headers: Callable[[], Awaitable[Dict[str, str]]],
+        result_headers: Optional[Callable[[], Awaitable[Dict[str, str]]]] = None,
+        poll_interval: float = 2.0,
+        label: str = "",
+        on_done: Optional[Callable[[], None]] = None,
+    ) -> Optional[LroOperation]:
+        """Track the operation announced by a 202 response, or return None if it has no poll URL."""
+        # Fabric APIs use two headers:
+        # - Operation-Location: URL to poll for operation status
+        # - Location: URL to GET the actual result after operation completes
+        # If only Location exists, it is used for polling (legacy pattern).
+        op_location = response.headers.get("Operation-Location")
+        location = response.headers.get("Location")
+        op_url = op_location or location
+        if not op_url:
+            return None
+        result_url = location if op_location and location and op_location != location else None
+
+        operation = LroOperation(
+            op_url=op_url,
+            result_url=result_url,
+            label=label,
+            poll_headers=poll_headers,
+            result_headers=result_headers or poll_headers,
+            interval=poll_interval,
+            operation_id=response.headers.get("x-ms-operation-id"),
+            on_done=on_done,
+        )
+        retry_after = retry_after_seconds(response)
+        self._ensure_running()
+        operation.next_poll = self._loop.time() + (
+            retry_after if retry_after is not None else operation.interval
+        )
+        operation.future = self._loop.create_future()
+        self._active[operation.id] = operation
+        self.started += 1
+        self._wakeup.set()
+        logger.info(f"LRO: Tracking {label or op_url} as operation {operation.id}")
+        return operation
+
+    def get(self, operation_id: str) -> Optional[LroOperation]:
+        return self._active.get(operation_id) or self._finished.get(operation_id)
+
+    async def wait(self, operation_id: str, timeout: Optional[float] = None) -> LroOperation:
+        """Wait up to ``timeout`` seconds for an operation; returns its handle either way."""
+        operation = self.get(operation_id)
+        if operation is None:
+            raise ValueError(f"Unknown or expired operation '{operation_id}'.")
+        if not operation.done:
+            try:
+                await asyncio.wait_for(asyncio.shield(operation.future), timeout=timeout)
+            except asyncio.TimeoutError:
+                pass
+        return operation
+
+    def _ensure_running(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Futures and the poller are bound to a loop; rebind pending operations
+            self._loop = loop
+            self._wakeup = asyncio.Event()
+            self._task = None
+            self._polling = {}
+            for operation in self._active.values():
+                operation.future = loop.create_future()
+        if self._task is None or self._task.done():
+            self._task = loop.create_task(self._run())
+
+    async def _run(self) -> None:
+        while self._active:
+            now = self._loop.time()
+            pending = []
+            for operation in list(self._active.values()):
+                if operation.id in self._polling:
+                    continue
+                if operation.next_poll <= now:
+                    self._polling[operation.id] = self._loop.create_task(
+                        self._poll_task(operation)
+                    )
+                else:
+                    pending.append(operation.next_poll)
+            # Woken by new operations and finished polls, or when the next poll is due
+            timeout = min(pending) - now if pending else None
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                pass
+        self._task = None
+
+    async def _poll_task(self, operation: LroOperation) -> None:
+        try:
+            await self._poll(operation)
+        except Exception as exc:
+            logger.error(f"LRO: Polling operation {operation.id} failed: {exc}")
+            if not operation.done:
+                self._finish(operation, "Failed", error=f"Polling failed: {exc}")
+        finally:
+            self._polling.pop(operation.id, None)
+            self._wakeup.set()
+
+    def _schedule(self, operation: LroOperation, retry_after: Optional[float]) -> None:
+        if retry_after is not None:
+            self.retry_after_polls += 1
+            delay = retry_after
+        else:
+            delay = operation.interval
+            operation.interval = min(
+                operation.interval * self.config.backoff_factor, self.config.max_interval
+            )
+        operation.next_poll = self._loop.time() + delay
+
+    async def _poll(self, operation: LroOperation) -> None:
+        operation.polls += 1
+        self.polls += 1
+        try:
+            await fabric_rate_limiter.acquire(operation.op_url)
+            response = await get_http_client(operation.op_url).get(
+                operation.op_url, headers=await operation.poll_headers(), timeout=60
+            )
+            fabric_rate_limiter.record(operation.op_url, response)
+        except httpx.HTTPError as exc:
+            self._poll_failed(operation, f"Poll request failed: {exc}", None)
+            return
+        except Exception as exc:
+            self._finish(operation, "Failed", error=f"Poll request failed: {exc}")
+            return
+
+        retry_after = retry_after_seconds(response)
+        if response.status_code == 429 or response.status_code >= 500:
+            self._poll_failed(operation, f"Poll returned {response.status_code}", retry_after)
+            return
+        if response.status_code not in (200, 201, 202):
+            logger.error(f"LRO: Poll of {operation.id} failed with status {response.status_code}")
+            self._finish(
+                operation,
+                "Failed",
+                error=f"Poll failed with status {response.status_code}: {response.text[:500]}",
+            )
+            return
+        operation.poll_errors = 0
+
+        try:
+            poll_data = response.json() if response.text else {}
+        except ValueError:
+            poll_data = {}
+        status = poll_data.get("status") or poll_data.get("operationStatus")
+
+        # A 200 without a status field is the finished result itself
+        # (Location URL returns actual content when operation completes)
+        if response.status_code == 200 and status is None:
+            self._finish(operation, "Succeeded", result=poll_data)
+        elif str(status).lower() in _SUCCEEDED:
+            result = await self._fetch_result(operation, poll_data)
+            self._finish(operation, status, result=result)
+        elif str(status).lower() in _FAILED:
+            error = poll_data.get("error") or poll_data.get("failureReason")
+            logger.error(f"LRO: Operation {operation.id} ended with status {status}")
+            self._finish(operation, status, result=poll_data, error=str(error) if error else None)
+        else:
+            if status and status != operation.status:
+                # Progress resets the backoff so state changes are noticed quickly
+                operation.interval = operation.initial_interval
+                operation.status = status
+            operation.percent_complete = poll_data.get("percentComplete")
+            operation.updated = time.time()
+            logger.debug(f"LRO: Operation {operation.id} is {operation.status}")
+            self._schedule(operation, retry_after)
+
+    def _poll_failed(
+        self, operation: LroOperation, message: str, retry_after: Optional[float]
+    ) -> None:
+        operation.poll_errors += 1
+        if operation.poll_errors >= self.config.max_poll_errors:
+            self._finish(operation, "Failed", error=message)
+            return
+        logger.warning(f"LRO: {message} for operation {operation.id}, retrying")
+        self._schedule(operation, retry_after)
+
+    async def _fetch_result(self, operation: LroOperation, poll_data: Dict[str, Any]) -> Any:
+        result_url = operation.result_url
+        if result_url is None and _OPERATION_URL.search(httpx.URL(operation.op_url).path):
+            result_url = operation.op_url.rstrip("/") + "/result"
+        if result_url:
+            try:
+                response = await get_http_client(result_url).get(
+                    result_url, headers=await operation.result_headers()
+                )
+                if response.status_code == 200 and response.text:
+                    return response.json()
+                logger.debug(f"LRO: Result fetch returned {response.status_code}")
+            except Exception as exc:
+                logger.warning(f"LRO: Failed to fetch result: {exc}")
+
+        # Extract resource details from the polling response
+        resource = (
+            poll_data.get("resource") or poll_data.get("result") or poll_data.get("item")
+        )
+        if resource and isinstance(resource, dict):
+            return resource
+        return poll_data
+
+    def _finish(
+        self,
+        operation: LroOperation,
+        status: str,
+        result: Any = None,
+        error: Optional[str] = None,
+    ) -> None:
+        operation.status = status
+        operation.result = result
+        operation.error = error
+        operation.done = True
+        operation.updated = time.time()
+        self._active.pop(operation.id, None)
+        self._finished[operation.id] = operation
+        if operation.on_done is not None:
+            try:
+                operation.on_done()
+            except Exception as exc:
+                logger.warning(f"LRO: Completion callback failed for {operation.id}: {exc}")
+        if operation.future is not None and not operation.future.done():
+            operation.future.set_result(None)
+        logger.info(f"LRO: Operation {operation.id} finished with status {status}")
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "active": len(self._active),
+            "finished": len(self._finished),
+            "started": self.started,
+            "polls": self.polls,
+            "retryAfterPolls": self.retry_after_polls,
+        }
+
+
+lro_manager = LroManager()
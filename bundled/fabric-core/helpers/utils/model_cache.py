@@ -0,0 +1,170 @@
+import asyncio
+import base64
+import copy
+import json
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from helpers.logging_config import get_logger
+from helpers.utils.definition_cache import DefinitionCache
+
+
+logger = get_logger(__name__)
+
+
+class ModelDefinition:
+    """Parsed model.bim of one semantic model, indexed by table and measure name.
+
+    The indexes point into the parsed TMSL, so edits made through the index
+    are what ``to_parts()`` serializes back for updateDefinition.
+    """
+
+    def __init__(self, parts: List[Dict[str, Any]], bim_index: int, model_bim: Dict[str, Any]):
+        self.parts = parts
+        self.bim_index = bim_index
+        self.model_bim = model_bim
+        self.loaded = time.time()
+        self.reindex()
+
+    @classmethod
+    def from_response(cls, response: Any) -> "ModelDefinition":
+        """Parse a getDefinition response; raises ValueError when model.bim is missing."""
+        if not isinstance(response, dict) or "definition" not in response:
+            raise ValueError("Failed to retrieve model definition")
+        parts = response["definition"].get("parts", [])
+        for index, part in enumerate(parts):
+            if part.get("path") == "model.bim":
+                payload = part.get("payload")
+                if isinstance(payload, str):
+                    if part.get("payloadType") == "InlineBase64":
+                        payload = base64.b64decode(payload)
+                    payload = json.loads(payload)
+                return cls(parts, index, payload or {})
+        raise ValueError("model.bim not found in definition")
+
+    @property
+    def model(self) -> Dict[str, Any]:
+        return self.model_bim.setdefault("model", {})
+
+    def reindex(self) -> None:
+        self.tables: Dict[str, Dict[str, Any]] = {}
+        self.measures: Dict[str, Tuple[str, Dict[str, Any]]] = {}
+        for table in self.model.get("tables", []):
+            self.tables[table.get("name")] = table
+            for measure in table.get("measures", []):
+                self.measures[measure.get("name")] = (table.get("name"), measure)
+
+    def find_measure(self, name: str) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """(table name, measure) for a measure name, or None."""
+        return self.measures.get(name)
+
+    def add_measure(self, table_name: str, measure: Dict[str, Any]) -> None:
+        self.tables[table_name].setdefault("measures", []).append(measure)
+        self.measures[measure["name"]] = (table_name, measure)
+
+    def rename_measure(self, name: str, new_name: str) -> None:
+        table_name, measure = self.measures.pop(name)
+        measure["name"] = new_name
+        self.measures[new_name] = (table_name, measure)
+
+    def remove_measure(self, name: str) -> Tuple[str, Dict[str, Any]]:
+        table_name, measure = self.measures.pop(name)
+        measures = self.tables[table_name].get("measures", [])
+        measures[:] = [entry for entry in measures if entry is not measure]
+        return table_name, measure
+
+    def to_parts(self) -> List[Dict[str, Any]]:
+        """Definition parts for updateDefinition, with model.bim re-serialized."""
+        part = dict(self.parts[self.bim_index])
+        payload = json.dumps(self.model_bim)
+        if part.get("payloadType") == "InlineBase64":
+            payload = base64.b64encode(payload.encode("utf-8")).decode("ascii")
+        part["payload"] = payload
+        parts = list(self.parts)
+        parts[self.bim_index] = part
+        return parts
+
+    def copy(self) -> "ModelDefinition":
+        """A deep copy to edit, leaving this definition as readers see it."""
+        return ModelDefinition(list(self.parts), self.bim_index, copy.deepcopy(self.model_bim))
+
+    def commit(self) -> None:
+        """Record that the current state has been saved with updateDefinition."""
+        self.parts = self.to_parts()
+        self.loaded = time.time()
+
+    def schema(self) -> Dict[str, Any]:
+        """Tables with columns and measures, all measures, and relationships."""
+        tables = []
+        measures = []
+        for table in self.model.get("tables", []):
+            table_info = {
+                "name": table.get("name"),
+                "isHidden": table.get("isHidden", False),
+                "columns": [
+                    {
+                        "name": column.get("name"),
+                        "dataType": column.get("dataType"),
+                        "isHidden": column.get("isHidden", False),
+                        "sourceColumn": column.get("sourceColumn"),
+                    }
+                    for column in table.get("columns", [])
+                ],
+                "measures": [],
+            }
+            for measure in table.get("measures", []):
+                measure_info = describe_measure(table.get("name"), measure)
+                table_info["measures"].append(measure_info)
+                measures.append(measure_info)
+            tables.append(table_info)
+
+        relationships = [
+            {
+                "name": rel.get("name"),
+                "fromTable": rel.get("fromTable"),
+                "fromColumn": rel.get("fromColumn"),
+                "toTable": rel.get("toTable"),
+                "toColumn": rel.get("toColumn"),
+                "crossFilteringBehavior": rel.get("crossFilteringBehavior"),
+            }
+            for rel in self.model.get("relationships", [])
+        ]
+        return {"tables": tables, "relationships": relationships, "measures": measures}
+
+
+def describe_measure(table_name: str, measure: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "name": measure.get("name"),
+        "expression": measure.get("expression"),
+        "formatString": measure.get("formatString"),
+        "isHidden": measure.get("isHidden", False),
+        "table": table_name,
+    }
+
+
+class ModelDefinitionCache(DefinitionCache):
+    """Parsed semantic model definitions shared by the model tools.
+
+    getDefinition is a long-running call and model.bim can be tens of MB, so
+    each model is fetched and parsed once and then served from memory until
+    ``ttl`` expires (Fabric exposes no cheap definition version to validate
+    against). Writes reload the definition, edit a copy of it and swap the
+    copy in with ``committed`` once updateDefinition succeeds, so readers
+    never see unsaved edits; a failed write drops the cached definition.
+    """
+
+    _count_key = "models"
+
+    def __init__(self, ttl: int = 600, max_models: int = 16):
+        super().__init__(ttl=ttl, maxsize=max_models)
+
+    async def _load(self, fabric_client, workspace_id: str, model_id: str) -> ModelDefinition:
+        response = await fabric_client._make_request(
+            endpoint=f"workspaces/{workspace_id}/semanticModels/{model_id}/getDefinition?format=TMSL",
+            method="post",
+            lro=True,
+        )
+        return await asyncio.to_thread(ModelDefinition.from_response, response)
+
+
+model_definitions = ModelDefinitionCache()
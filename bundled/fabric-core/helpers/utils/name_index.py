@@ -0,0 +1,213 @@
+import base64
+import json
+import re
+import threading
+from typing import Any, Dict, Iterable, List, Optional
+
+from cachetools import TTLCache
+
+
+# Fabric API paths whose successful writes change workspace or item names.
+_WORKSPACE_PATH = re.compile(r"/v1/workspaces(?:/(?P<workspace_id>[0-9a-fA-F-]{36}))?/?$")
+_ITEM_PATH = re.compile(
+    r"/v1/workspaces/(?P<workspace_id>[0-9a-fA-F-]{36})/(?P<collection>[A-Za-z]+)(?:/(?P<item_id>[0-9a-fA-F-]{36}))?/?$"
+)
+
+
+def tenant_from_token(token: str) -> str:
+    """Extract the tenant ID (``tid`` claim) from a bearer token, or "default"."""
+    try:
+        payload = token.split(".")[1]
+        payload += "=" * (-len(payload) % 4)
+        claims = json.loads(base64.urlsafe_b64decode(payload))
+        return str(claims.get("tid") or "default")
+    except Exception:
+        return "default"
+
+
+class _Listing:
+    """Name and ID lookups over one listing of workspaces or items."""
+
+    def __init__(self, entries: Iterable[Dict[str, Any]] = (), complete: bool = False):
+        # Only a complete listing can answer "no such name" or detect duplicates
+        self.complete = complete
+        self.by_id: Dict[str, Dict[str, Any]] = {}
+        self.by_name: Dict[str, List[Dict[str, Any]]] = {}
+        for entry in entries:
+            self.add(entry)
+
+    def add(self, entry: Dict[str, Any]) -> None:
+        if not isinstance(entry, dict) or not entry.get("id"):
+            return
+        entry_id = str(entry["id"]).lower()
+        previous = self.by_id.get(entry_id)
+        if previous is not None:
+            self.by_name.get(previous.get("displayName"), []).remove(previous)
+        self.by_id[entry_id] = entry
+        self.by_name.setdefault(entry.get("displayName"), []).append(entry)
+
+    def find_by_id(self, entry_id: str) -> Optional[Dict[str, Any]]:
+        return self.by_id.get(str(entry_id).lower())
+
+    def find_by_name(
+        self,
+        name: str,
+        type: Optional[str] = None,
+        case_sensitive: bool = True,
+    ) -> List[Dict[str, Any]]:
+        if case_sensitive:
+            candidates = self.by_name.get(name, [])
+        else:
+            candidates = [
+                entry
+                for display_name, entries in self.by_name.items()
+                if str(display_name).lower() == name.lower()
+                for entry in entries
+            ]
+        if type is None:
+            return list(candidates)
+        return [e for e in candidates if str(e.get("type", "")).lower() == type.lower()]
+
+
+class NameIndex:
+    """Shared name<->ID index for workspaces (per tenant) and items (per workspace).
+
+    Entries expire after ``ttl`` seconds. A name miss is answered by one full
+    paginated listing, which warms every entry of that workspace (or tenant) at
+    once. Writes through the Fabric API invalidate the affected index.
+    """
+
+    def __init__(self, ttl: int = 300, maxsize: int = 1024):
+        self._workspaces: TTLCache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._items: TTLCache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def _count(self, found: bool) -> None:
+        if found:
+            self.hits += 1
+        else:
+            self.misses += 1
+
+    def store_workspaces(self, tenant: str, workspaces: Iterable[Dict[str, Any]]) -> None:
+        """Replace the workspace index for ``tenant`` with a full listing."""
+        with self._lock:
+            self._workspaces[tenant] = _Listing(workspaces, complete=True)
+
+    def add_workspace(self, tenant: str, workspace: Dict[str, Any]) -> None:
+        """Record a single workspace fetched by ID."""
+        with self._lock:
+            listing = self._workspaces.get(tenant)
+            if listing is None:
+                listing = self._workspaces[tenant] = _Listing()
+            listing.add(workspace)
+
+    def find_workspace_by_id(self, tenant: str, workspace_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            listing = self._workspaces.get(tenant)
+            entry = listing.find_by_id(workspace_id) if listing else None
+            self._count(entry is not None)
+            return entry
+
+    def find_workspaces_by_name(
+        self, tenant: str, name: str, case_sensitive: bool = True
+    ) -> List[Dict[str, Any]]:
+        with self._lock:
+            listing = self._workspaces.get(tenant)
+            matches = (
+                listing.find_by_name(name, case_sensitive=case_sensitive)
+                if listing and listing.complete
+                else []
+            )
+            self._count(bool(matches))
+            return matches
+
+    def store_items(self, tenant: str, workspace_id: str, items: Iterable[Dict[str, Any]]) -> None:
+        """Replace the item index of a workspace with a full listing."""
+        with self._lock:
+            self._items[(tenant, str(workspace_id).lower())] = _Listing(items, complete=True)
+
+    def add_item(self, tenant: str, workspace_id: str, item: Dict[str, Any]) -> None:
+        """Record a single item fetched by ID."""
+        key = (tenant, str(workspace_id).lower())
+        with self._lock:
+            listing = self._items.get(key)
+            if listing is None:
+                listing = self._items[key] = _Listing()
+            listing.add(item)
+
+    def find_item_by_id(
+        self, tenant: str, workspace_id: str, item_id: str
+    ) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            listing = self._items.get((tenant, str(workspace_id).lower()))
+            entry = listing.find_by_id(item_id) if listing else None
+            self._count(entry is not None)
+            return entry
+
+    def find_items_by_name(
+        self,
+        tenant: str,
+        workspace_id: str,
+        name: str,
+        type: Optional[str] = None,
+        case_sensitive: bool = True,
+    ) -> List[Dict[str, Any]]:
+        with self._lock:
+            listing = self._items.get((tenant, str(workspace_id).lower()))
+            matches = (
+                listing.find_by_name(name, type=type, case_sensitive=case_sensitive)
+                if listing and listing.complete
+                else []
+            )
+            self._count(bool(matches))
+            return matches
+
+    def invalidate_workspaces(self, tenant: str) -> None:
+        with self._lock:
+            self._workspaces.pop(tenant, None)
+            self.invalidations += 1
+
+    def invalidate_items(self, tenant: str, workspace_id: str) -> None:
+        with self._lock:
+            self._items.pop((tenant, str(workspace_id).lower()), None)
+            self.invalidations += 1
+
+    def invalidate_for_write(self, tenant: str, method: str, url_path: str) -> None:
+        """Drop index entries that a successful POST/PATCH/DELETE may have changed."""
+        method = method.upper()
+        if method not in ("POST", "PATCH", "PUT", "DELETE"):
+            return
+        workspace_match = _WORKSPACE_PATH.search(url_path)
+        if workspace_match:
+            self.invalidate_workspaces(tenant)
+            if workspace_match.group("workspace_id") and method == "DELETE":
+                self.invalidate_items(tenant, workspace_match.group("workspace_id"))
+            return
+        item_match = _ITEM_PATH.search(url_path)
+        if item_match:
+            creating = method == "POST" and not item_match.group("item_id")
+            modifying = method != "POST" and item_match.group("item_id")
+            if creating or modifying:
+                self.invalidate_items(tenant, item_match.group("workspace_id"))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._workspaces.clear()
+            self._items.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit/miss counters and index sizes."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "invalidations": self.invalidations,
+                "workspaceIndexes": len(self._workspaces),
+                "itemIndexes": len(self._items),
+            }
+
+
+name_index = NameIndex()
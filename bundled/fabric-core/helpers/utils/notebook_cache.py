@@ -0,0 +1,193 @@
+import asyncio
+import base64
+import copy
+import hashlib
+import json
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from helpers.logging_config import get_logger
+from helpers.utils.definition_cache import DefinitionCache
+
+
+logger = get_logger(__name__)
+
+# Text parts returned when a notebook has no ipynb part
+_SOURCE_EXTENSIONS = (".py", ".sql", ".scala")
+
+
+def _empty_notebook() -> Dict[str, Any]:
+    return {"cells": [], "metadata": {}, "nbformat": 4, "nbformat_minor": 5}
+
+
+def _decode_part(part: Dict[str, Any]) -> str:
+    payload = part.get("payload") or ""
+    try:
+        return base64.b64decode(payload).decode("utf-8")
+    except Exception:
+        return payload  # not base64 or already plain text
+
+
+def new_cell(source: Any, cell_type: str = "code") -> Dict[str, Any]:
+    """An ipynb cell; string sources are split into lines the way Jupyter stores them."""
+    cell = {
+        "cell_type": cell_type,
+        "source": source.splitlines(keepends=True) if isinstance(source, str) else list(source or []),
+        "metadata": {},
+    }
+    if cell_type == "code":
+        cell["execution_count"] = None
+        cell["outputs"] = []
+    return cell
+
+
+def cell_source(cell: Dict[str, Any]) -> str:
+    """Cell source as one string; ipynb line lists already carry their newlines."""
+    source = cell.get("source", "")
+    return "".join(source) if isinstance(source, list) else str(source)
+
+
+class NotebookDefinition:
+    """Parsed ipynb of one notebook plus the version it was loaded or saved at.
+
+    ``version`` goes up whenever the content changes, whether through a save
+    from these tools or an edit made elsewhere that a reload picks up, so it
+    can be passed back to detect concurrent changes.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str],
+        notebook: Optional[Dict[str, Any]],
+        text: Optional[str] = None,
+    ):
+        self.path = path
+        self.notebook = notebook
+        self.version = 0
+        self.loaded = time.time()
+        self._text = text
+        self._digest: Optional[str] = None
+
+    @classmethod
+    def from_response(cls, response: Any) -> "NotebookDefinition":
+        """Parse a getDefinition response; raises ValueError when it carries no definition."""
+        if not isinstance(response, dict) or "definition" not in response:
+            detail = json.dumps(response, default=str)[:500]
+            raise ValueError(f"Notebook definition is not available: {detail}")
+        parts = response["definition"].get("parts") or []
+
+        for part in parts:
+            path = str(part.get("path", ""))
+            if path.endswith(".ipynb") and part.get("payload"):
+                text = _decode_part(part)
+                return cls(path, json.loads(text), text)
+
+        # Notebooks without an ipynb part are read-only here
+        for part in parts:
+            path = str(part.get("path", ""))
+            if path.endswith(_SOURCE_EXTENSIONS) and part.get("payload"):
+                return cls(None, None, _decode_part(part))
+
+        if not parts:
+            # New notebooks come back without parts
+            return cls(None, _empty_notebook())
+        return cls(None, None, json.dumps(response["definition"]))
+
+    @property
+    def editable(self) -> bool:
+        return self.notebook is not None
+
+    @property
+    def cells(self) -> List[Dict[str, Any]]:
+        if self.notebook is None:
+            raise ValueError("Notebook definition has no ipynb part to edit.")
+        return self.notebook.setdefault("cells", [])
+
+    def content(self) -> str:
+        """The notebook as text: the ipynb JSON, or the source part for non-ipynb notebooks."""
+        if self._text is None:
+            self._text = json.dumps(self.notebook)
+        return self._text
+
+    def digest(self) -> str:
+        """Hash of the content, independent of how the ipynb JSON was formatted."""
+        if self._digest is None:
+            if self.notebook is not None:
+                text = json.dumps(self.notebook, sort_keys=True)
+            else:
+                text = self.content()
+            self._digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        return self._digest
+
+    def to_parts(self, notebook: Dict[str, Any], default_path: str) -> List[Dict[str, Any]]:
+        """The ipynb part for updateDefinition, serialized from ``notebook``."""
+        payload = json.dumps(notebook)
+        return [
+            {
+                "path": self.path or default_path,
+                "payload": base64.b64encode(payload.encode("utf-8")).decode("ascii"),
+                "payloadType": "InlineBase64",
+            }
+        ]
+
+    def copy_notebook(self) -> Dict[str, Any]:
+        """A deep copy of the notebook to edit before saving."""
+        return copy.deepcopy(self.notebook if self.notebook is not None else _empty_notebook())
+
+    def commit(self, notebook: Dict[str, Any], path: str) -> None:
+        """Record that ``notebook`` has been saved with updateDefinition."""
+        self.notebook = notebook
+        self.path = self.path or path
+        self._text = None
+        self._digest = None
+        self.version += 1
+        self.loaded = time.time()
+
+
+class NotebookDefinitionCache(DefinitionCache):
+    """Parsed notebook definitions shared by the notebook tools.
+
+    Each notebook is fetched with getDefinition once and served from memory
+    until ``ttl`` expires. Saves through the tools replace the cached copy,
+    so reading, patching and analyzing a notebook in a row costs a single
+    download. Versions survive expiry: a reload with unchanged content keeps
+    the version and changed content gets the next one.
+    """
+
+    _count_key = "notebooks"
+
+    def __init__(self, ttl: int = 300, max_notebooks: int = 64):
+        super().__init__(ttl=ttl, maxsize=max_notebooks)
+        self._versions: Dict[Tuple[str, str], Tuple[int, str]] = {}
+
+    async def _load(self, fabric_client, workspace_id: str, notebook_id: str) -> NotebookDefinition:
+        response = await fabric_client._make_request(
+            endpoint=f"workspaces/{workspace_id}/notebooks/{notebook_id}/getDefinition?format=ipynb",
+            method="post",
+            params={},
+            lro=True,
+            lro_timeout=60,
+        )
+        definition = await asyncio.to_thread(NotebookDefinition.from_response, response)
+        definition.digest()  # computed here rather than under the cache lock
+        return definition
+
+    def _store(self, key: Tuple[str, str], definition: NotebookDefinition) -> None:
+        version, known_digest = self._versions.get(key, (0, None))
+        if known_digest is not None and known_digest != definition.digest():
+            version += 1
+        definition.version = version
+        self._versions[key] = (version, definition.digest())
+        super()._store(key, definition)
+
+    def committed(self, workspace_id: str, notebook_id: str, definition: NotebookDefinition) -> None:
+        """Record the version of a definition that was just saved."""
+        with self._lock:
+            self._versions[self._key(workspace_id, notebook_id)] = (
+                definition.version,
+                definition.digest(),
+            )
+        super().committed(workspace_id, notebook_id, definition)
+
+
+notebook_definitions = NotebookDefinitionCache()
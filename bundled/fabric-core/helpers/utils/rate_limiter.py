@@ -0,0 +1,173 @@
+import asyncio
+import re
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+import httpx
+from cachetools import LRUCache
+from pydantic import BaseModel
+
+from helpers.logging_config import get_logger
+
+
+logger = get_logger(__name__)
+
+_WORKSPACE_ID = re.compile(r"/workspaces/([0-9a-fA-F-]{36})")
+
+
+class RateLimitConfig(BaseModel):
+    """Client-side request pacing for one API host or workspace"""
+
+    initial_rate: float = 20.0  # requests per second before any feedback
+    min_rate: float = 0.5
+    max_rate: float = 100.0
+    burst: float = 10.0  # requests that may start back to back
+    additive_increase: float = 0.1  # rate added per successful request
+    decrease_factor: float = 0.5  # rate multiplier on 429/503
+    default_retry_after: float = 5.0  # pause when a 429 carries no Retry-After
+    throttle_budget: float = 300.0  # seconds a request may spend waiting out 429s
+    min_throttle_wait: float = 1.0  # least a 429 retry waits (and costs), even at Retry-After: 0
+    max_buckets: int = 1024
+
+
+def retry_after_seconds(response: httpx.Response, default: Optional[float] = None) -> Optional[float]:
+    """Parse Retry-After as seconds or an HTTP date; ``default`` when absent or invalid."""
+    value = response.headers.get("Retry-After")
+    if value is None:
+        return default
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return default
+
+
+class _Bucket:
+    """Token bucket whose refill rate follows AIMD feedback."""
+
+    def __init__(self, config: RateLimitConfig):
+        self.config = config
+        self.rate = config.initial_rate
+        self.tokens = config.burst
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self.waiting = 0
+        self.requests = 0
+        self.throttles = 0
+        self.queued_seconds = 0.0
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.config.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    async def acquire(self) -> None:
+        started = time.monotonic()
+        self.waiting += 1
+        try:
+            while True:
+                now = time.monotonic()
+                self._refill(now)
+                if now < self.blocked_until:
+                    await asyncio.sleep(self.blocked_until - now)
+                    continue
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    self.requests += 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+        finally:
+            self.waiting -= 1
+            self.queued_seconds += time.monotonic() - started
+
+    def on_success(self) -> None:
+        self.rate = min(self.config.max_rate, self.rate + self.config.additive_increase)
+
+    def on_throttle(self, retry_after: Optional[float]) -> None:
+        now = time.monotonic()
+        self.throttles += 1
+        # Requests already in flight when the throttle began report it too;
+        # count that burst as one congestion signal, not one per response.
+        if now >= self.blocked_until:
+            self.rate = max(self.config.min_rate, self.rate * self.config.decrease_factor)
+        self.tokens = 0.0
+        if retry_after:
+            self.blocked_until = max(self.blocked_until, now + retry_after)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "rate": round(self.rate, 2),
+            "queueDepth": self.waiting,
+            "requests": self.requests,
+            "throttles": self.throttles,
+            "queuedSeconds": round(self.queued_seconds, 1),
+            "blockedForSeconds": round(max(self.blocked_until - time.monotonic(), 0.0), 1),
+        }
+
+
+class AdaptiveRateLimiter:
+    """Shared request pacing per API host and per Fabric workspace.
+
+    Every request waits for a token from its host bucket and, when the URL
+    names a workspace, from that workspace's bucket. Buckets refill at a rate
+    that grows additively with each success and halves on 429/503; a
+    Retry-After pauses the whole bucket, so concurrent callers queue behind
+    the throttle instead of hitting it again.
+    """
+
+    def __init__(self, config: Optional[RateLimitConfig] = None):
+        self.configure(config or RateLimitConfig())
+
+    def configure(self, config: RateLimitConfig) -> None:
+        self.config = config
+        self._buckets: LRUCache = LRUCache(maxsize=config.max_buckets)
+
+    def _keys(self, url: str) -> List[Tuple[str, str]]:
+        parsed = httpx.URL(url)
+        keys = [("host", parsed.host)]
+        match = _WORKSPACE_ID.search(parsed.path)
+        if match:
+            keys.append(("workspace", match.group(1).lower()))
+        return keys
+
+    def _bucket(self, key: Tuple[str, str]) -> _Bucket:
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = _Bucket(self.config)
+        return bucket
+
+    async def acquire(self, url: str) -> None:
+        """Wait until a request to ``url`` may be sent."""
+        for key in self._keys(url):
+            await self._bucket(key).acquire()
+
+    def record(self, url: str, response: httpx.Response) -> None:
+        """Feed a response back into the buckets that paced it."""
+        if response.status_code in (429, 503):
+            retry_after = retry_after_seconds(
+                response,
+                self.config.default_retry_after if response.status_code == 429 else None,
+            )
+            for key in self._keys(url):
+                self._bucket(key).on_throttle(retry_after)
+            logger.warning(
+                f"Throttled ({response.status_code}) by {httpx.URL(url).host}; "
+                f"pausing {retry_after or 0:.1f}s and slowing to "
+                f"{self._bucket(self._keys(url)[0]).rate:.2f} req/s"
+            )
+            return
+        for key in self._keys(url):
+            self._bucket(key).on_success()
+
+    def stats(self) -> Dict[str, Any]:
+        hosts: Dict[str, Any] = {}
+        workspaces: Dict[str, Any] = {}
+        for (kind, name), bucket in list(self._buckets.items()):
+            (hosts if kind == "host" else workspaces)[name] = bucket.stats()
+        return {"hosts": hosts, "workspaces": workspaces}
+
+
+fabric_rate_limiter = AdaptiveRateLimiter()
@@ -0,0 +1,149 @@
+import copy
+import json
+import re
+import threading
+import time
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+from cachetools import TTLCache
+
+from helpers.logging_config import get_logger
+
+
+logger = get_logger(__name__)
+
+# Quoted literals and bracketed identifiers, whose whitespace is significant
+_QUOTED = re.compile(r"('(?:[^']|'')*'|\"(?:[^\"]|\"\")*\"|\[[^\]]*\])")
+_READ_ONLY = re.compile(r"^\s*(select|with)\b", re.IGNORECASE)
+
+
+def normalize_query(query: str) -> str:
+    """Collapse whitespace outside quoted literals and drop a trailing semicolon."""
+    parts = _QUOTED.split(query.strip())
+    for index in range(0, len(parts), 2):
+        parts[index] = re.sub(r"\s+", " ", parts[index])
+    return "".join(parts).strip().rstrip(";").strip()
+
+
+def is_read_only_sql(query: str) -> bool:
+    """True for plain SELECT / WITH ... SELECT statements, the only SQL worth caching."""
+    return bool(_READ_ONLY.match(query)) and not re.search(
+        r"\b(into|insert|update|delete|merge|drop|alter|create|exec|execute)\b",
+        query,
+        re.IGNORECASE,
+    )
+
+
+class _Entry:
+    def __init__(self, value: Any, size: int, seconds: Optional[float]):
+        self.value = value
+        self.size = size
+        self.seconds = seconds
+        self.stored = time.time()
+
+
+class QueryResultCache:
+    """TTL cache of query results bounded by their total serialized size.
+
+    Keys are (source, normalized query, max_rows, encoding, version), where
+    source identifies the SQL endpoint or semantic model, encoding is the
+    response format the result was stored in and version optionally pins the
+    data the result was computed from (such as a model's last refresh). Least recently used results are evicted
+    once ``max_bytes`` is exceeded; results larger than that are not cached.
+    """
+
+    def __init__(self, ttl: int = 300, max_bytes: int = 64 * 1024 * 1024):
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._entries: TTLCache = TTLCache(
+            maxsize=max_bytes, ttl=ttl, getsizeof=lambda entry: entry.size
+        )
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def _key(
+        source: Hashable, query: str, max_rows: Optional[int], encoding: str, version: Hashable
+    ) -> Tuple:
+        return source, normalize_query(query), max_rows, encoding, version
+
+    def get(
+        self,
+        source: Hashable,
+        query: str,
+        max_rows: Optional[int] = None,
+        encoding: str = "rows",
+        version: Hashable = None,
+    ) -> Optional[Tuple[Any, Dict[str, Any]]]:
+        """Return (a copy of the cached value, cache metadata) or None."""
+        with self._lock:
+            entry = self._entries.get(self._key(source, query, max_rows, encoding, version))
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return copy.deepcopy(entry.value), self._metadata(entry, hit=True)
+
+    def put(
+        self,
+        source: Hashable,
+        query: str,
+        max_rows: Optional[int],
+        value: Any,
+        seconds: Optional[float] = None,
+        encoding: str = "rows",
+        version: Hashable = None,
+    ) -> Dict[str, Any]:
+        """Store a result and return the cache metadata for a fresh (missed) result."""
+        size = len(json.dumps(value, default=str))
+        entry = _Entry(copy.deepcopy(value), size, seconds)
+        with self._lock:
+            try:
+                self._entries[self._key(source, query, max_rows, encoding, version)] = entry
+            except ValueError:
+                logger.debug(f"Result of {size} bytes exceeds the cache size; not cached")
+        return self._metadata(entry, hit=False)
+
+    def invalidate(self, source: Optional[Hashable] = None) -> int:
+        """Drop the cached results of one source (or all); returns how many were dropped."""
+        with self._lock:
+            keys = [key for key in self._entries.keys() if source is None or key[0] == source]
+            for key in keys:
+                self._entries.pop(key, None)
+            if keys:
+                self.invalidations += 1
+        return len(keys)
+
+    def _metadata(self, entry: _Entry, hit: bool) -> Dict[str, Any]:
+        metadata = {
+            "hit": hit,
+            "ageSeconds": round(time.time() - entry.stored, 1),
+            "ttlSeconds": self.ttl,
+        }
+        if entry.seconds is not None:
+            metadata["originalSeconds"] = round(entry.seconds, 3)
+        return metadata
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "invalidations": self.invalidations,
+                "entries": len(self._entries),
+                "bytes": self._entries.currsize,
+                "maxBytes": self.max_bytes,
+            }
+
+
+query_result_cache = QueryResultCache()
+
+
+def sql_source(server: str, database: str) -> Tuple[str, str, str]:
+    return "sql", server.lower(), database.lower()
+
+
+def dax_source(workspace_id: str, dataset_id: str) -> Tuple[str, str, str]:
+    return "dax", str(workspace_id).lower(), str(dataset_id).lower()
@@ -0,0 +1,60 @@
+import asyncio
+import copy
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple
+
+
+class SingleFlight:
+    """Collapse concurrent identical calls into one upstream call.
+
+    The first caller for a key starts the call; callers that arrive while it
+    is in flight wait for the same result or the same exception. The shared
+    task keeps a private snapshot of the result and every caller, the first
+    one included, gets its own deep copy of it, so nobody can mutate data
+    another caller has yet to copy. With ``copy_result=False`` all callers
+    get the very same object instead, for results that are shared read-only
+    (such as the entries of a cache). Nothing is cached once the call finishes.
+    """
+
+    def __init__(self):
+        self._inflight: Dict[Tuple[int, Hashable], asyncio.Task] = {}
+        self.calls = 0
+        self.coalesced = 0
+
+    async def do(
+        self, key: Hashable, call: Callable[[], Awaitable[Any]], copy_result: bool = True
+    ) -> Any:
+        loop = asyncio.get_running_loop()
+        # Tasks cannot be awaited from another event loop
+        flight_key = (id(loop), key)
+        task = self._inflight.get(flight_key)
+        if task is not None:
+            self.coalesced += 1
+        else:
+            self.calls += 1
+            task = loop.create_task(self._snapshot(call) if copy_result else call())
+            self._inflight[flight_key] = task
+            task.add_done_callback(lambda done: self._land(flight_key, done))
+        # shield: a cancelled waiter must not cancel the shared call
+        result = await asyncio.shield(task)
+        return copy.deepcopy(result) if copy_result else result
+
+    @staticmethod
+    async def _snapshot(call: Callable[[], Awaitable[Any]]) -> Any:
+        return copy.deepcopy(await call())
+
+    def _land(self, flight_key: Tuple[int, Hashable], task: asyncio.Task) -> None:
+        if self._inflight.get(flight_key) is task:
+            del self._inflight[flight_key]
+        if not task.cancelled():
+            # Mark the exception retrieved even if every waiter was cancelled
+            task.exception()
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "calls": self.calls,
+            "coalesced": self.coalesced,
+            "inFlight": len(self._inflight),
+        }
+
+
+fabric_get_flights = SingleFlight()
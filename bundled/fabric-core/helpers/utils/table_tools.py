@@ -1,56 +1,204 @@
-from typing import Dict, List, Tuple, Optional
+from typing import Any, Dict, List, Tuple, Optional
+from azure.core.exceptions import ResourceNotFoundError
 from azure.identity import DefaultAzureCredential
-from deltalake import DeltaTable
+from concurrent.futures import ThreadPoolExecutor
+from deltalake import DeltaTable, Schema
 from helpers.logging_config import get_logger
+from helpers.utils.authentication import get_cached_token_async
+from helpers.utils.delta_cache import (
+    DeltaLogMetadata,
+    get_delta_cache,
+    latest_delta_version,
+    split_location,
+)
 import asyncio
+import json
 
 logger = get_logger(__name__)
 
+# Shared by all schema extractions; per-call concurrency is limited separately
+_schema_executor = ThreadPoolExecutor(max_workers=32, thread_name_prefix="delta-schema")
 
-async def get_delta_schemas(
-    tables: List[Dict], credential: DefaultAzureCredential
-) -> List[Tuple[Dict, object, object]]:
-    """Get schema and metadata for each Delta table"""
-    delta_tables = []
+
+def _read_json(fs_client, path: str) -> Optional[str]:
+    try:
+        return fs_client.get_file_client(path).download_file().readall().decode("utf-8")
+    except ResourceNotFoundError:
+        return None
+
+
+def read_delta_log_metadata(
+    location: str, onelake_client
+) -> Tuple[Schema, DeltaLogMetadata, int]:
+    """Read the schema, metadata and version of a Delta table from its _delta_log only.
+
+    Uses the latest checkpoint (fetching only its metaData column) plus the
+    JSON commits after it, without loading the table's file list.
+    ``onelake_client`` is the OneLakeClient to read with; checkpoints are read
+    through its ranged reader.
+    """
+    import pyarrow.parquet as pq
+
+    file_system, table_path = split_location(location)
+    log_path = f"{table_path}/_delta_log"
+    fs_client = onelake_client._get_file_system_client(file_system)
+
+    meta_data: Optional[Dict[str, Any]] = None
+    checkpoint_version = -1
+
+    last_checkpoint = _read_json(fs_client, f"{log_path}/_last_checkpoint")
+    if last_checkpoint:
+        checkpoint = json.loads(last_checkpoint)
+        checkpoint_version = int(checkpoint["version"])
+        parts = checkpoint.get("parts")
+        if parts:
+            checkpoint_files = [
+                f"{log_path}/{checkpoint_version:020d}.checkpoint.{part:010d}.{parts:010d}.parquet"
+                for part in range(1, parts + 1)
+            ]
+        else:
+            checkpoint_files = [f"{log_path}/{checkpoint_version:020d}.checkpoint.parquet"]
+        for checkpoint_file in checkpoint_files:
+            reader = onelake_client.open_range_reader(
+                fs_client.get_file_client(checkpoint_file), checkpoint_file
+            )
+            column = pq.ParquetFile(reader).read(columns=["metaData"]).column("metaData")
+            for value in column.to_pylist():
+                if value:
+                    meta_data = value
+                    break
+            if meta_data:
+                break
+
+    commits = []
+    for entry in fs_client.get_paths(path=log_path, recursive=False):
+        name = entry.name.rsplit("/", 1)[-1]
+        stem = name[: -len(".json")]
+        if name.endswith(".json") and stem.isdigit() and int(stem) > checkpoint_version:
+            commits.append((int(stem), entry.name))
+    version = max([checkpoint_version] + [commit_version for commit_version, _ in commits])
+    for _, commit_path in sorted(commits):
+        # A commit can disappear between the listing and the read (log cleanup)
+        for line in (_read_json(fs_client, commit_path) or "").splitlines():
+            if '"metaData"' in line:
+                meta_data = json.loads(line)["metaData"]
+
+    if not meta_data:
+        raise ValueError(f"No metaData action found in {log_path}")
+
+    metadata = DeltaLogMetadata(
+        id=meta_data.get("id"),
+        name=meta_data.get("name"),
+        description=meta_data.get("description"),
+        partition_columns=list(meta_data.get("partitionColumns") or []),
+        created_time=meta_data.get("createdTime"),
+        configuration=dict(meta_data.get("configuration") or {}),
+    )
+    return Schema.from_json(meta_data["schemaString"]), metadata, version
+
+
+async def extract_delta_schemas(
+    tables: List[Dict],
+    credential: DefaultAzureCredential,
+    max_concurrency: int = 8,
+    table_timeout: float = 60.0,
+    metadata_only: bool = False,
+) -> Tuple[List[Tuple[Dict, object, object]], List[Dict[str, str]]]:
+    """Get schema and metadata for each Delta table in parallel.
+
+    Tables are loaded on worker threads, at most ``max_concurrency`` at a
+    time. A table that fails or exceeds ``table_timeout`` seconds is reported
+    in the second list instead of failing the whole call; storage requests
+    are given the same timeout so abandoned workers finish too. With
+    ``metadata_only`` only the _delta_log is read (see read_delta_log_metadata).
+    """
     logger.info(f"Starting schema extraction for {len(tables)} tables")
 
     # Get token for Azure Storage (not Fabric API)
-    token = credential.get_token("https://storage.azure.com/.default").token
-    storage_options = {"bearer_token": token, "use_fabric_endpoint": "true"}
-
-    for table in tables:
-        task = asyncio.create_task(get_delta_table(table, storage_options))
-        delta_tables.append(task)
-        logger.debug(f"Created task for table: {table['name']}")
-    # Wait for all tasks to complete
-    delta_tables = await asyncio.gather(*delta_tables)
-    logger.info(f"Completed schema extraction for {len(delta_tables)} tables")
-    # Filter out None values
-    delta_tables = [dt for dt in delta_tables if dt is not None]
-    return delta_tables
-
-
-async def get_delta_table(
-    table: Dict, storage_options: Optional[Dict] = None
-) -> Optional[Tuple[Dict, object, object]]:
-    """Get Delta table schema and metadata"""
-    logger.debug(f"Processing table: {table['name']}")
-
-    # Check if the table is a Delta table
-
-    if table["format"].lower() == "delta":
-        try:
-            table_path = table["location"]
-            logger.debug(f"Processing Delta table: {table['name']} at {table_path}")
+    token = await get_cached_token_async(credential, "https://storage.azure.com/.default")
+    storage_options = {
+        "bearer_token": token,
+        "use_fabric_endpoint": "true",
+        "timeout": f"{max(1, int(table_timeout))}s",
+    }
+    from helpers.clients.onelake_client import OneLakeClient
+
+    onelake_client = OneLakeClient(credential, timeout=table_timeout)
 
-            # Create DeltaTable instance with storage options
-            delta_table = DeltaTable(table_path, storage_options=storage_options)
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+    loop = asyncio.get_running_loop()
 
-            # Get both schema and metadata
-            result = (table, delta_table.schema(), delta_table.metadata())
-            logger.info(f"Processed table: {table['name']}")
-            return result
+    def _release(_future) -> None:
+        if not loop.is_closed():
+            loop.call_soon_threadsafe(semaphore.release)
 
+    async def _load(table: Dict):
+        await semaphore.acquire()
+        try:
+            future = _schema_executor.submit(
+                _cached_schema, table, storage_options, onelake_client, metadata_only
+            )
+        except BaseException:
+            semaphore.release()
+            raise
+        # A timed-out worker keeps running, so its slot is only freed when it finishes
+        future.add_done_callback(_release)
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), timeout=table_timeout)
+        except asyncio.TimeoutError:
+            logger.error(f"Timed out reading schema for table {table['name']}")
+            return {"table": table["name"], "error": f"Timed out after {table_timeout}s"}
         except Exception as e:
             logger.error(f"Could not process table {table['name']}: {str(e)}")
-            return None
+            return {"table": table["name"], "error": str(e)}
+
+    delta_tables = [t for t in tables if t.get("format", "").lower() == "delta"]
+    outcomes = await asyncio.gather(*(_load(table) for table in delta_tables))
+
+    get_delta_cache().flush()
+
+    results = [o for o in outcomes if isinstance(o, tuple)]
+    failures = [o for o in outcomes if isinstance(o, dict)]
+    logger.info(
+        f"Completed schema extraction: {len(results)} succeeded, {len(failures)} failed"
+    )
+    return results, failures
+
+
+async def get_delta_schemas(
+    tables: List[Dict], credential: DefaultAzureCredential, **kwargs
+) -> List[Tuple[Dict, object, object]]:
+    """Get schema and metadata for each Delta table, skipping tables that fail"""
+    results, _ = await extract_delta_schemas(tables, credential, **kwargs)
+    return results
+
+
+def _cached_schema(
+    table: Dict, storage_options: Optional[Dict], onelake_client, metadata_only: bool
+) -> Tuple[Dict, object, object]:
+    """Serve a table's schema from the version-keyed cache, loading it on a miss."""
+    location = table["location"]
+    cache = get_delta_cache()
+    try:
+        cached = cache.get(
+            location, latest_delta_version(location, onelake_client._get_file_system_client)
+        )
+    except Exception as e:
+        logger.debug(f"Latest version check failed for {table['name']}: {e}")
+        cached = None
+    if cached is not None:
+        return (table, *cached)
+
+    if metadata_only:
+        logger.debug(f"Reading _delta_log of {table['name']} at {location}")
+        schema, metadata, version = read_delta_log_metadata(location, onelake_client)
+    else:
+        logger.debug(f"Processing Delta table: {table['name']} at {location}")
+        delta_table = DeltaTable(location, storage_options=storage_options)
+        schema = delta_table.schema()
+        metadata = DeltaLogMetadata.from_metadata(delta_table.metadata())
+        version = delta_table.version()
+    cache.put(location, version, schema, metadata)
+    logger.info(f"Processed table: {table['name']}")
+    return table, schema, metadata
+
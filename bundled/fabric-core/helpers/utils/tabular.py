@@ -0,0 +1,50 @@
+import base64
+import io
+from typing import Any, Dict, List
+
+import polars as pl
+
+
+# "rows" is the default: one JSON object per row
+TABULAR_FORMATS = ("rows", "columnar", "arrow-ipc-base64", "csv")
+
+
+def check_format(format: str) -> str:
+    """Return the normalized format name, or raise ValueError for an unknown one."""
+    normalized = (format or "rows").lower()
+    if normalized not in TABULAR_FORMATS:
+        raise ValueError(
+            f"format must be one of {', '.join(repr(name) for name in TABULAR_FORMATS)}."
+        )
+    return normalized
+
+
+def encode_frame(df: pl.DataFrame, format: str = "rows") -> Dict[str, Any]:
+    """Encode a result frame for a tool response.
+
+    "rows" returns a list of row objects. The compact formats name each column
+    once: "columnar" returns one value list per column, "csv" a CSV document
+    with a header, and "arrow-ipc-base64" a base64 Arrow IPC stream that keeps
+    column types.
+    """
+    format = check_format(format)
+    if format == "rows":
+        return {"rows": df.to_dicts()}
+
+    encoded: Dict[str, Any] = {"format": format, "columns": df.columns}
+    if format == "columnar":
+        encoded["data"] = [df.get_column(name).to_list() for name in df.columns]
+    elif format == "csv":
+        encoded["csv"] = df.write_csv()
+    else:
+        buffer = io.BytesIO()
+        df.write_ipc_stream(buffer)
+        encoded["arrow"] = base64.b64encode(buffer.getvalue()).decode("ascii")
+    return encoded
+
+
+def frame_from_records(records: List[Dict[str, Any]]) -> pl.DataFrame:
+    """Build a frame from row objects, typing each column from all of its values."""
+    if not records:
+        return pl.DataFrame()
+    return pl.from_dicts(records, infer_schema_length=None)
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Benchmark pyspark_analyzer.analyze_notebook on a corpus of large notebooks.
+
+The corpus is either generated (PySpark cells mixing reads, joins, actions,
+UDFs, magics and writes, unique per notebook) or loaded from the .ipynb files
+under a directory. Three passes are timed over the whole corpus:
+
+    cold    caches cleared, every cell parsed and walked
+    warm    unchanged notebooks, served from the notebook summary cache
+    edited  one cell appended per notebook; earlier cells hit the cell cache
+
+The default corpus fits the analyzer's default cell cache (4096 cells); a
+larger one evicts cells before the edited pass and shows as misses there.
+
+Usage:
+    python scripts/benchmark_pyspark_analyzer.py
+    python scripts/benchmark_pyspark_analyzer.py --notebooks 500 --cells 80
+    python scripts/benchmark_pyspark_analyzer.py --dir ./notebooks
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Callable, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from helpers.pyspark_analyzer import pyspark_analyzer  # noqa: E402
+from helpers.utils.notebook_cache import cell_source  # noqa: E402
+
+
+CELL_TEMPLATES = [
+    "df_{n}_{i} = spark.read.format('delta').load('Tables/sales_{i}')\n"
+    "df_{n}_{i} = df_{n}_{i}.filter(df_{n}_{i}.year == 2024).select('id', 'amount', 'region')\n",
+    "dim_{n}_{i} = spark.table('dim_region_{i}')\n"
+    "joined_{n}_{i} = df_{n}_{p}.join(dim_{n}_{i}, 'region').groupBy('region').agg({{'amount': 'sum'}})\n"
+    "joined_{n}_{i}.show()\n",
+    "from pyspark.sql.functions import udf\n"
+    "@udf('string')\n"
+    "def label_{n}_{i}(value):\n"
+    "    return 'high' if value > {i} else 'low'\n"
+    "df_{n}_{i} = df_{n}_{p}.withColumn('label', label_{n}_{i}('amount'))\n",
+    "rows_{n}_{i} = df_{n}_{p}.collect()\n"
+    "total_{n}_{i} = df_{n}_{p}.count()\n"
+    "print(len(rows_{n}_{i}), total_{n}_{i})\n",
+    "%%sql\nSELECT region, SUM(amount) FROM sales_{i} GROUP BY region\n",
+    "df_{n}_{p}.cache()\n"
+    "summary_{n}_{i} = df_{n}_{p}.orderBy('amount').limit({i}).toPandas()\n",
+    "%pip install some-package=={i}.0\n"
+    "result_{n}_{i} = spark.sql('SELECT * FROM staging_{i}')\n"
+    "result_{n}_{i}.write.mode('overwrite').saveAsTable('curated_{i}')\n",
+]
+
+
+def generate_corpus(notebooks: int, cells: int) -> List[List[str]]:
+    corpus = []
+    for n in range(notebooks):
+        sources = []
+        for i in range(cells):
+            # Cells refer back to the DataFrame read a few cells earlier
+            previous = max(i - i % len(CELL_TEMPLATES), 0)
+            template = CELL_TEMPLATES[i % len(CELL_TEMPLATES)]
+            sources.append(template.format(n=n, i=i, p=previous))
+        corpus.append(sources)
+    return corpus
+
+
+def load_corpus(directory: str) -> List[List[str]]:
+    corpus = []
+    for path in sorted(Path(directory).rglob("*.ipynb")):
+        with open(path, "r", encoding="utf-8") as f:
+            notebook = json.load(f)
+        sources = [cell_source(cell) for cell in notebook.get("cells", []) if cell.get("cell_type") == "code"]
+        if sources:
+            corpus.append(sources)
+    return corpus
+
+
+def timed_pass(corpus: List[List[str]], prepare: Callable[[List[str]], List[str]] = list) -> List[float]:
+    timings = []
+    for sources in corpus:
+        sources = prepare(sources)
+        started = time.perf_counter()
+        pyspark_analyzer.analyze_notebook(sources)
+        timings.append(time.perf_counter() - started)
+    return timings
+
+
+def report(label: str, timings: List[float]) -> None:
+    ordered = sorted(timings)
+    p95 = ordered[min(int(len(ordered) * 0.95), len(ordered) - 1)]
+    print(
+        f"{label:<7} total {sum(timings) * 1000:9.1f} ms   "
+        f"mean {statistics.mean(timings) * 1000:8.3f} ms   "
+        f"p95 {p95 * 1000:8.3f} ms"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark cold and warm analyze_notebook timings")
+    parser.add_argument("--dir", help="load .ipynb files under this directory instead of generating a corpus")
+    parser.add_argument("--notebooks", type=int, default=60, help="generated notebooks (default: 60)")
+    parser.add_argument("--cells", type=int, default=60, help="code cells per generated notebook (default: 60)")
+    args = parser.parse_args()
+
+    corpus = load_corpus(args.dir) if args.dir else generate_corpus(args.notebooks, args.cells)
+    if not corpus:
+        print("No code cells found.")
+        sys.exit(1)
+    cells = sum(len(sources) for sources in corpus)
+    print(f"{len(corpus)} notebooks, {cells} code cells, {len(pyspark_analyzer.rules)} rules")
+
+    pyspark_analyzer.clear()
+    cold = timed_pass(corpus)
+    warm = timed_pass(corpus)
+    edited = timed_pass(corpus, lambda sources: sources + ["df_edit = spark.table('edited')\ndf_edit.show()\n"])
+
+    report("cold", cold)
+    report("warm", warm)
+    report("edited", edited)
+    print(f"warm speedup {sum(cold) / max(sum(warm), 1e-9):.0f}x, edited {sum(cold) / max(sum(edited), 1e-9):.1f}x")
+    print(f"cache: {pyspark_analyzer.stats()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Load test for concurrent item listings against a local stub of the Fabric API.
+
+Starts a threaded HTTP server that answers GET /v1/workspaces/<id>/items after
+a fixed delay, points FabricApiClient at it with a fake credential and runs
+N listings at once, the way the list_items tool streams them. Each listing
+targets its own workspace so request coalescing cannot hide serialized I/O.
+
+With a non-blocking transport the listings overlap, so the run must finish
+well under N x delay; the script exits non-zero when it does not.
+
+Usage:
+    python scripts/load_test_list_items.py
+    python scripts/load_test_list_items.py --calls 50 --delay 0.5
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import threading
+import time
+import uuid
+from contextlib import aclosing
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from azure.core.credentials import AccessToken
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from helpers.clients.fabric_client import FabricApiClient, FabricApiConfig  # noqa: E402
+
+
+class FakeCredential:
+    """Credential that hands out a dummy token without contacting Entra ID."""
+
+    def get_token(self, *scopes, **kwargs) -> AccessToken:
+        return AccessToken("load-test-token", int(time.time()) + 3600)
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    delay = 0.5
+    requests = 0
+    lock = threading.Lock()
+
+    def do_GET(self):
+        with StubHandler.lock:
+            StubHandler.requests += 1
+        time.sleep(self.delay)
+        workspace_id = self.path.split("/")[3]
+        body = json.dumps(
+            {
+                "value": [
+                    {
+                        "id": str(uuid.uuid4()),
+                        "displayName": f"Item {i}",
+                        "type": "Lakehouse",
+                        "workspaceId": workspace_id,
+                    }
+                    for i in range(5)
+                ]
+            }
+        ).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+async def list_items(client: FabricApiClient, workspace_id: str, top: int = 100) -> list:
+    """Same streaming loop as tools.items.list_items, without the MCP context."""
+    items = []
+    async with aclosing(client.iter_items(workspace_id, params={"$top": top})) as stream:
+        async for item in stream:
+            items.append(item)
+            if len(items) >= top:
+                break
+    return items
+
+
+async def run(base_url: str, calls: int) -> float:
+    client = FabricApiClient(credential=FakeCredential(), config=FabricApiConfig(base_url=base_url))
+    workspaces = [str(uuid.uuid4()) for _ in range(calls)]
+    started = time.perf_counter()
+    results = await asyncio.gather(*(list_items(client, ws) for ws in workspaces))
+    elapsed = time.perf_counter() - started
+    assert all(len(items) == 5 for items in results), "unexpected listing size"
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Concurrent list_items load test against a stub server")
+    parser.add_argument("--calls", type=int, default=20, help="concurrent listings (default: 20)")
+    parser.add_argument("--delay", type=float, default=0.5, help="stub response delay in seconds (default: 0.5)")
+    parser.add_argument(
+        "--max-fraction",
+        type=float,
+        default=0.25,
+        help="fail when elapsed exceeds this fraction of calls x delay (default: 0.25)",
+    )
+    args = parser.parse_args()
+
+    StubHandler.delay = args.delay
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}/v1"
+
+    try:
+        elapsed = asyncio.run(run(base_url, args.calls))
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    serial = args.calls * args.delay
+    limit = serial * args.max_fraction
+    print(f"{args.calls} concurrent listings, {StubHandler.requests} upstream requests")
+    print(f"elapsed {elapsed:.2f}s, serial would be {serial:.2f}s, limit {limit:.2f}s")
+    if elapsed > limit:
+        print("FAIL: listings did not overlap")
+        sys.exit(1)
+    print("OK")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,6 +7,7 @@ from tools.table import (
     get_lakehouse_table_schema,
     get_all_lakehouse_schemas,
     table_preview,
+    table_preview_batch,
     table_schema,
     describe_history,
     optimize_delta,
@@ -21,6 +22,7 @@ from tools.semantic_model import (
     create_measure,
     update_measure,
     delete_measure,
+    apply_measure_changes,
     analyze_dax_query,
 )
 from tools.report import (
@@ -36,10 +38,12 @@ from tools.notebook import (
     generate_pyspark_code,
     validate_pyspark_code,
     update_notebook_cell,
+    patch_notebook_cells,
     create_fabric_notebook,
     generate_fabric_code,
     validate_fabric_code,
     analyze_notebook_performance,
+    audit_workspace_notebooks,
     run_notebook_job,
     get_run_status,
     cancel_notebook_job,
@@ -53,6 +57,7 @@ from tools.items import (
 from tools.onelake import (
     onelake_ls,
     onelake_read,
+    onelake_parquet_metadata,
     onelake_write,
     onelake_rm,
     onelake_create_shortcut,
@@ -123,6 +128,8 @@ from tools.connection import (
     list_supported_connection_types,
 )
 from tools.admin import list_tenant_settings
+from tools.diagnostics import get_server_stats
+from tools.operations import get_operation, wait_operation
 from tools.item_definition import (
     export_item_definition,
     import_item,
@@ -164,6 +171,7 @@ __all__ = [
     "get_lakehouse_table_schema",
     "get_all_lakehouse_schemas",
     "table_preview",
+    "table_preview_batch",
     "table_schema",
     "describe_history",
     "optimize_delta",
@@ -176,6 +184,7 @@ __all__ = [
     "create_measure",
     "update_measure",
     "delete_measure",
+    "apply_measure_changes",
     "analyze_dax_query",
     "list_reports",
     "get_report",
@@ -211,10 +220,12 @@ __all__ = [
     "generate_pyspark_code",
     "validate_pyspark_code",
     "update_notebook_cell",
+    "patch_notebook_cells",
     "create_fabric_notebook",
     "generate_fabric_code",
     "validate_fabric_code",
     "analyze_notebook_performance",
+    "audit_workspace_notebooks",
     "run_notebook_job",
     "get_run_status",
     "cancel_notebook_job",
@@ -224,6 +235,7 @@ __all__ = [
     "set_permissions",
     "onelake_ls",
     "onelake_read",
+    "onelake_parquet_metadata",
     "onelake_write",
     "onelake_rm",
     "onelake_create_shortcut",
@@ -265,6 +277,9 @@ __all__ = [
     "delete_connection",
     "list_supported_connection_types",
     "list_tenant_settings",
+    "get_server_stats",
+    "get_operation",
+    "wait_operation",
     "lakehouse_load_table",
     "export_item_definition",
     "import_item",
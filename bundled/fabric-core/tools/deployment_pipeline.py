@@ -295,12 +295,14 @@ async def deploy_stage_content(
     target_stage_id: str,
     items: Optional[str] = None,
     note: Optional[str] = None,
+    wait: bool = True,
     ctx: Context = None,
 ) -> Dict[str, Any]:
     """Deploy content from one pipeline stage to another.
 
-    This is a long-running operation (LRO). The tool waits for completion
-    before returning. Deployment can take several minutes for large workspaces.
+    This is a long-running operation (LRO). By default the tool waits for
+    completion before returning. Deployment can take several minutes for large
+    workspaces; pass wait=False to get an operation handle back immediately.
 
     Args:
         pipeline_id: ID of the deployment pipeline
@@ -309,6 +311,8 @@ async def deploy_stage_content(
         items: Optional comma-separated list of item objectIds to deploy selectively.
                If not provided, all items in the source stage are deployed.
         note: Optional deployment note / comment
+        wait: Wait for the operation to finish (default True). With False an operation
+            handle is returned immediately; follow it with wait_operation/get_operation.
         ctx: Context object containing client information
 
     Returns:
@@ -340,6 +344,7 @@ async def deploy_stage_content(
             lro=True,
             lro_poll_interval=5,
             lro_timeout=600,
+            lro_wait=wait,
         )
 
         return response if isinstance(response, dict) else {"result": response}
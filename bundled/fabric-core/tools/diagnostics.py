@@ -0,0 +1,48 @@
+from typing import Any, Dict
+
+from mcp.server.fastmcp import Context
+
+from helpers.clients.sql_client import sql_engines
+from helpers.logging_config import get_logger
+from helpers.pyspark_analyzer import pyspark_analyzer
+from helpers.utils.authentication import get_token_cache_stats
+from helpers.utils.context import mcp
+from helpers.utils.delta_cache import get_delta_cache
+from helpers.utils.lro import lro_manager
+from helpers.utils.model_cache import model_definitions
+from helpers.utils.name_index import name_index
+from helpers.utils.notebook_cache import notebook_definitions
+from helpers.utils.rate_limiter import fabric_rate_limiter
+from helpers.utils.result_cache import query_result_cache
+from helpers.utils.single_flight import fabric_get_flights
+
+
+logger = get_logger(__name__)
+
+
+@mcp.tool()
+async def get_server_stats(
+    ctx: Context = None,
+) -> Dict[str, Any]:
+    """Report server-side cache and connection counters.
+
+    Useful for checking whether repeated tool calls are being served from
+    the in-process caches instead of going back to the Fabric APIs.
+    """
+    try:
+        return {
+            "tokenCache": get_token_cache_stats(),
+            "nameIndex": name_index.stats(),
+            "sqlPool": sql_engines.stats(),
+            "deltaCache": get_delta_cache().stats(),
+            "lro": lro_manager.stats(),
+            "coalescedGets": fabric_get_flights.stats(),
+            "rateLimiter": fabric_rate_limiter.stats(),
+            "resultCache": query_result_cache.stats(),
+            "modelDefinitions": model_definitions.stats(),
+            "notebookDefinitions": notebook_definitions.stats(),
+            "pysparkAnalyzer": pyspark_analyzer.stats(),
+        }
+    except Exception as exc:
+        logger.error("Error collecting server stats: %s", exc)
+        return {"error": str(exc)}
@@ -254,16 +254,20 @@ async def delete_environment(
 async def publish_environment(
     environment_id: str,
     workspace: Optional[str] = None,
+    wait: bool = True,
     ctx: Context = None,
 ) -> Dict[str, Any]:
     """Publish a staged environment, making its configuration live.
 
-    This is a long-running operation (LRO). The tool waits for completion
-    before returning. Publishing can take several minutes.
+    This is a long-running operation (LRO). By default the tool waits for
+    completion before returning. Publishing can take several minutes; pass
+    wait=False to get an operation handle back immediately.
 
     Args:
         environment_id: ID of the environment to publish.
         workspace: Workspace name or ID. Uses active workspace if not provided.
+        wait: Wait for the operation to finish (default True). With False an operation
+            handle is returned immediately; follow it with wait_operation/get_operation.
         ctx: Context object containing client information.
 
     Returns:
@@ -286,6 +290,7 @@ async def publish_environment(
             lro=True,
             lro_poll_interval=10,
             lro_timeout=600,
+            lro_wait=wait,
         )
 
         return response if isinstance(response, dict) else {"result": response}
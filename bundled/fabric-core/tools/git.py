@@ -219,6 +219,7 @@ async def git_commit_to_git(
     comment: Optional[str] = None,
     workspace_head: Optional[str] = None,
     items: Optional[str] = None,
+    wait: bool = True,
     ctx: Context = None,
 ) -> Dict[str, Any]:
     """Commit workspace changes to the connected Git repository.
@@ -229,6 +230,8 @@ async def git_commit_to_git(
         comment: Optional commit message (max 300 characters)
         workspace_head: Full SHA hash of workspace head from git_get_status (recommended)
         items: Comma-separated object IDs to commit (required when mode is "Selective")
+        wait: Wait for the operation to finish (default True). With False an operation
+            handle is returned immediately; follow it with wait_operation/get_operation.
         ctx: Context object containing client information
     Returns:
         Dict with commit result or error.
@@ -268,6 +271,7 @@ async def git_commit_to_git(
             lro=True,
             lro_poll_interval=5,
             lro_timeout=600,
+            lro_wait=wait,
         )
 
         return {"workspace": ws, "mode": mode, "result": response}
@@ -283,6 +287,7 @@ async def git_update_from_git(
     workspace_head: Optional[str] = None,
     conflict_resolution_policy: Optional[str] = None,
     allow_override_items: bool = True,
+    wait: bool = True,
     ctx: Context = None,
 ) -> Dict[str, Any]:
     """Pull changes from the Git repository into the Fabric workspace.
@@ -293,6 +298,8 @@ async def git_update_from_git(
         workspace_head: Full SHA hash of current workspace head (optional, for conflict detection)
         conflict_resolution_policy: "PreferRemote" or "PreferWorkspace" (optional)
         allow_override_items: Whether to allow overriding workspace items (default True)
+        wait: Wait for the operation to finish (default True). With False an operation
+            handle is returned immediately; follow it with wait_operation/get_operation.
         ctx: Context object containing client information
     Returns:
         Dict with update result or error.
@@ -334,6 +341,7 @@ async def git_update_from_git(
             lro=True,
             lro_poll_interval=5,
             lro_timeout=600,
+            lro_wait=wait,
         )
 
         return {"workspace": ws, "remoteCommitHash": remote_commit_hash, "result": response}
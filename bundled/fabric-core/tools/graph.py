@@ -3,10 +3,9 @@ import json
 import os
 from typing import Any, Dict, Optional, Tuple
 
-import requests
-
 from helpers.logging_config import get_logger
-from helpers.utils.authentication import get_azure_credentials
+from helpers.utils.http_pool import get_http_client
+from helpers.utils.authentication import get_azure_credentials, get_cached_token_async
 from helpers.utils.context import mcp, __ctx_cache
 from mcp.server.fastmcp import Context
 
@@ -38,24 +37,24 @@ def _normalise_channel_message_content(
     return normalised_type, content
 
 
-def _graph_headers(ctx: Context) -> Dict[str, str]:
+async def _graph_headers(ctx: Context) -> Dict[str, str]:
     credential = get_azure_credentials(ctx.client_id, __ctx_cache)
-    token = credential.get_token("https://graph.microsoft.com/.default")
+    token = await get_cached_token_async(credential, "https://graph.microsoft.com/.default")
     return {
-        "Authorization": f"Bearer {token.token}",
+        "Authorization": f"Bearer {token}",
         "Content-Type": "application/json",
         "Accept": "application/json",
     }
 
 
-def _graph_request(
+async def _graph_request(
     ctx: Context,
     method: str,
     url: str,
     payload: Optional[Dict[str, Any]] = None,
 ) -> Dict[str, Any]:
-    headers = _graph_headers(ctx)
-    response = requests.request(
+    headers = await _graph_headers(ctx)
+    response = await get_http_client(url).request(
         method=method.upper(),
         url=url,
         headers=headers,
@@ -90,7 +89,7 @@ async def graph_user(email: str, ctx: Context) -> Dict[str, Any]:
             url = "https://graph.microsoft.com/v1.0/me"
         else:
             url = f"https://graph.microsoft.com/v1.0/users/{email}"
-        return _graph_request(ctx, "get", url)
+        return await _graph_request(ctx, "get", url)
     except Exception as exc:
         logger.error("Error retrieving Graph user: %s", exc)
         return {"error": str(exc)}
@@ -148,7 +147,7 @@ async def graph_mail(
             "message": message,
             "saveToSentItems": True,
         }
-        return _graph_request(ctx, "post", url, payload)
+        return await _graph_request(ctx, "post", url, payload)
     except Exception as exc:
         logger.error("Error sending Graph mail: %s", exc)
         return {"error": str(exc)}
@@ -185,7 +184,7 @@ async def graph_teams_message(
                 "content": message_body,
             }
         }
-        return _graph_request(ctx, "post", url, payload)
+        return await _graph_request(ctx, "post", url, payload)
     except Exception as exc:
         logger.error("Error posting Teams message: %s", exc)
         return {"error": str(exc)}
@@ -216,7 +215,7 @@ async def graph_drive(
             else:
                 url = f"https://graph.microsoft.com/v1.0/drives/{drive_id}/root/children"
 
-        return _graph_request(ctx, "get", url)
+        return await _graph_request(ctx, "get", url)
     except Exception as exc:
         logger.error("Error listing drive items: %s", exc)
         return {"error": str(exc)}
@@ -236,7 +235,7 @@ async def list_teams(
         if ctx is None:
             raise ValueError("Context (ctx) must be provided.")
         url = "https://graph.microsoft.com/v1.0/me/joinedTeams"
-        return _graph_request(ctx, "get", url)
+        return await _graph_request(ctx, "get", url)
     except Exception as exc:
         logger.error("Error listing teams: %s", exc)
         return {"error": str(exc)}
@@ -259,7 +258,7 @@ async def list_channels(
         if ctx is None:
             raise ValueError("Context (ctx) must be provided.")
         url = f"https://graph.microsoft.com/v1.0/teams/{team_id}/channels"
-        return _graph_request(ctx, "get", url)
+        return await _graph_request(ctx, "get", url)
     except Exception as exc:
         logger.error("Error listing channels: %s", exc)
         return {"error": str(exc)}
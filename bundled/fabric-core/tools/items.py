@@ -1,3 +1,4 @@
+from contextlib import aclosing
 from typing import Any, Dict, List, Optional
 
 from mcp.server.fastmcp import Context
@@ -85,7 +86,13 @@ async def list_items(
         if skip:
             params["$skip"] = max(skip, 0)
 
-        items = await fabric_client.get_items(ws_id, item_type=type, params=params)
+        # Stream the listing and stop once a full page of results is collected
+        items = []
+        async with aclosing(fabric_client.iter_items(ws_id, item_type=type, params=params)) as stream:
+            async for item in stream:
+                items.append(item)
+                if top and len(items) >= top:
+                    break
 
         if not items:
             return "No items found for the specified criteria."
@@ -212,6 +212,7 @@ async def lakehouse_table_maintenance(
     v_order: bool = True,
     z_order_by: Optional[str] = None,
     vacuum_retention: Optional[str] = None,
+    wait: bool = True,
     ctx: Context = None,
 ) -> Dict[str, Any]:
     """Run Fabric-native table maintenance job (optimize + vacuum) on a lakehouse delta table.
@@ -228,6 +229,8 @@ async def lakehouse_table_maintenance(
         z_order_by: Comma-separated column names for Z-Order optimization (optional)
         vacuum_retention: Retention period in "d.hh:mm:ss" format, e.g. "7.00:00:00" for 7 days (optional).
                          If not provided, only optimize runs (no vacuum).
+        wait: Wait for the operation to finish (default True). With False an operation
+            handle is returned immediately; follow it with wait_operation/get_operation.
         ctx: Context object containing client information
 
     Returns:
@@ -280,6 +283,7 @@ async def lakehouse_table_maintenance(
             lro=True,
             lro_poll_interval=5,
             lro_timeout=600,
+            lro_wait=wait,
         )
 
         if isinstance(response, dict):
@@ -307,6 +311,7 @@ async def lakehouse_load_table(
     recursive: bool = False,
     lakehouse: Optional[str] = None,
     workspace: Optional[str] = None,
+    wait: bool = True,
     ctx: Context = None,
 ) -> Dict[str, Any]:
     """Load data from OneLake Files into a lakehouse delta table via the official Fabric API.
@@ -326,6 +331,8 @@ async def lakehouse_load_table(
         recursive: Search subfolders when path_type is "Folder"
         lakehouse: Name or ID of the lakehouse (optional, uses active)
         workspace: Name or ID of the workspace (optional, uses active)
+        wait: Wait for the operation to finish (default True). With False an operation
+            handle is returned immediately; follow it with wait_operation/get_operation.
         ctx: Context object containing client information
 
     Returns:
@@ -378,6 +385,7 @@ async def lakehouse_load_table(
             lro=True,
             lro_poll_interval=5,
             lro_timeout=600,
+            lro_wait=wait,
         )
 
         return {
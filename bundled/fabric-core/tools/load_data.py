@@ -1,16 +1,183 @@
 from helpers.utils.context import mcp, __ctx_cache
 from mcp.server.fastmcp import Context
-from helpers.utils.authentication import get_azure_credentials
+from helpers.utils.authentication import get_azure_credentials, get_cached_token_async
+from helpers.utils.http_pool import get_http_client
 from helpers.clients import FabricApiClient
 from helpers.logging_config import get_logger
 import asyncio
+import io
+import queue
 import tempfile
 import os
-import requests
-from typing import Optional
+import time
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
 
 logger = get_logger(__name__)
 
+_DOWNLOAD_CHUNK_BYTES = 1024 * 1024
+# Downloaded chunks buffered ahead of the parser; bounds memory for CSV loads
+_MAX_BUFFERED_CHUNKS = 16
+_CSV_BLOCK_BYTES = 16 * 1024 * 1024
+# Rows handed to SQLClient.load_data per call when loading a warehouse
+_WAREHOUSE_CHUNK_ROWS = 500_000
+
+
+class _DownloadPipe(io.RawIOBase):
+    """Blocking file object fed with downloaded chunks from the event loop.
+
+    The downloader blocks once ``_MAX_BUFFERED_CHUNKS`` are waiting, so the
+    parser (running in a worker thread) sets the pace and memory stays bounded.
+    """
+
+    def __init__(self):
+        self._queue: "queue.Queue" = queue.Queue(maxsize=_MAX_BUFFERED_CHUNKS)
+        self._pending = b""
+        self._eof = False
+        self._reader_closed = False
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        while not self._pending and not self._eof:
+            item = self._queue.get()
+            if item is None:
+                self._eof = True
+            elif isinstance(item, BaseException):
+                raise item
+            else:
+                self._pending = item
+        size = min(len(buffer), len(self._pending))
+        buffer[:size] = self._pending[:size]
+        self._pending = self._pending[size:]
+        return size
+
+    def feed(self, item) -> bool:
+        """Queue a chunk, None for end of data, or an exception. False once the reader is gone."""
+        while not self._reader_closed:
+            try:
+                self._queue.put(item, timeout=0.5)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def close(self) -> None:
+        self._reader_closed = True
+        super().close()
+
+
+async def _pump(response, pipe: _DownloadPipe) -> None:
+    try:
+        async for chunk in response.aiter_bytes(_DOWNLOAD_CHUNK_BYTES):
+            if not await asyncio.to_thread(pipe.feed, chunk):
+                return
+        await asyncio.to_thread(pipe.feed, None)
+    except Exception as exc:
+        await asyncio.to_thread(pipe.feed, exc)
+
+
+def _counted(reader) -> Tuple[Any, Dict[str, int]]:
+    """Wrap a RecordBatchReader so the rows passing through it are counted."""
+    import pyarrow as pa
+
+    counter = {"rows": 0}
+
+    def _batches() -> Iterator[Any]:
+        for batch in reader:
+            counter["rows"] += batch.num_rows
+            yield batch
+
+    return pa.RecordBatchReader.from_batches(reader.schema, _batches()), counter
+
+
+async def _stream_csv(response, sink: Callable[[Any], Dict[str, Any]]) -> Tuple[int, Dict[str, Any]]:
+    """Parse the CSV body incrementally while it downloads and feed batches to ``sink``."""
+    import pyarrow.csv as pcsv
+
+    pipe = _DownloadPipe()
+    pump = asyncio.create_task(_pump(response, pipe))
+
+    def _consume():
+        reader = pcsv.open_csv(
+            pipe, read_options=pcsv.ReadOptions(block_size=_CSV_BLOCK_BYTES)
+        )
+        counted, counter = _counted(reader)
+        return counter, sink(counted)
+
+    try:
+        counter, details = await asyncio.to_thread(_consume)
+    finally:
+        pipe.close()
+        await pump
+    return counter["rows"], details
+
+
+async def _stream_parquet(response, sink: Callable[[Any], Dict[str, Any]]) -> Tuple[int, Dict[str, Any]]:
+    """Spool the Parquet body to disk in chunks, then feed it to ``sink`` row group by row group."""
+    import pyarrow.parquet as pq
+
+    # Parquet keeps its metadata in the footer, so the file must be complete
+    # before it can be read; only the download itself is streamed.
+    with tempfile.NamedTemporaryFile(delete=False, suffix=".parquet") as tmp_file:
+        tmp_path = tmp_file.name
+        async for chunk in response.aiter_bytes(_DOWNLOAD_CHUNK_BYTES):
+            await asyncio.to_thread(tmp_file.write, chunk)
+
+    def _consume():
+        import pyarrow as pa
+
+        parquet_file = pq.ParquetFile(tmp_path)
+        reader = pa.RecordBatchReader.from_batches(
+            parquet_file.schema_arrow, parquet_file.iter_batches()
+        )
+        counted, counter = _counted(reader)
+        return counter, sink(counted)
+
+    try:
+        counter, details = await asyncio.to_thread(_consume)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return counter["rows"], details
+
+
+def _write_warehouse(
+    reader,
+    sql_client,
+    destination_table: str,
+    mode: str,
+    load_method: str,
+    staging,
+) -> Dict[str, Any]:
+    """Load a RecordBatchReader into a warehouse table in bounded chunks."""
+    import pyarrow as pa
+    import polars as pl
+
+    started = time.perf_counter()
+    if_exists = "replace" if mode == "overwrite" else "append"
+    pending, pending_rows, chunks = [], 0, 0
+
+    def _flush():
+        nonlocal if_exists, pending, pending_rows, chunks
+        df = pl.from_arrow(pa.Table.from_batches(pending, schema=reader.schema))
+        stats = sql_client.load_data(
+            df, destination_table, if_exists, load_method, staging=staging
+        )
+        chunks += stats["chunks"]
+        if_exists = "append"
+        pending, pending_rows = [], 0
+
+    for batch in reader:
+        pending.append(batch)
+        pending_rows += batch.num_rows
+        if pending_rows >= _WAREHOUSE_CHUNK_ROWS:
+            _flush()
+    if pending or if_exists != "append":
+        _flush()
+
+    return {"method": load_method, "chunks": chunks, "seconds": time.perf_counter() - started}
+
 
 @mcp.tool()
 async def load_data_from_url(
@@ -19,40 +186,46 @@ async def load_data_from_url(
     workspace: Optional[str] = None,
     lakehouse: Optional[str] = None,
     warehouse: Optional[str] = None,
+    mode: str = "overwrite",
+    target_file_size_mb: Optional[int] = None,
+    load_method: str = "executemany",
+    staging_lakehouse: Optional[str] = None,
     ctx: Context = None,
 ) -> str:
     """Load data from a URL into a delta table in a lakehouse via OneLake.
 
+    The download is streamed: CSV is parsed block by block while it arrives and
+    Parquet is read row group by row group, and record batches are written as
+    they are produced, so memory stays bounded for multi-GB sources.
+
     Args:
         url: The URL to download data from (CSV or Parquet supported).
         destination_table: The name of the table to load data into.
         workspace: Name or ID of the workspace (optional).
         lakehouse: Name or ID of the lakehouse (optional).
         warehouse: Name or ID of the warehouse (optional, uses SQL for warehouses).
+        mode: "overwrite" (replace table and schema) or "append".
+        target_file_size_mb: Target size of the Delta data files written (lakehouse only).
+        load_method: Warehouse bulk load method: "executemany" (batched inserts,
+            committed per chunk) or "copy_into" (stage Parquet in a lakehouse, then COPY INTO).
+        staging_lakehouse: Lakehouse used to stage files for load_method="copy_into"
+            (defaults to the context lakehouse).
         ctx: Context object containing client information.
     Returns:
         A string confirming the data load or an error message.
     """
     try:
-        # Download the file
-        response = requests.get(url, timeout=120)
-        if response.status_code != 200:
-            return f"Failed to download file from URL: {url}"
         file_ext = url.split("?")[0].split(".")[-1].lower()
         if file_ext not in ("csv", "parquet"):
             return f"Unsupported file type: {file_ext}. Only CSV and Parquet are supported."
-        with tempfile.NamedTemporaryFile(
-            delete=False, suffix=f".{file_ext}"
-        ) as tmp_file:
-            tmp_file.write(response.content)
-            tmp_path = tmp_file.name
+        if mode not in ("overwrite", "append"):
+            return "mode must be 'overwrite' or 'append'."
 
         credential = get_azure_credentials(ctx.client_id, __ctx_cache)
         fabric_client = FabricApiClient(credential)
 
         workspace_ref = workspace or __ctx_cache.get(f"{ctx.client_id}_workspace")
         if not workspace_ref:
-            os.remove(tmp_path)
             return "Workspace not set. Please set a workspace using set_workspace."
 
         resource_type = None
@@ -74,79 +247,100 @@ async def load_data_from_url(
                 resource_type = "warehouse"
                 resource_ref = ctx_warehouse
             else:
-                os.remove(tmp_path)
                 return "Either lakehouse or warehouse must be specified or set via set_lakehouse/set_warehouse."
 
-        try:
-            import pyarrow as pa
-            import pyarrow.csv as pcsv
-            import pyarrow.parquet as pq
-            from deltalake import write_deltalake
-
-            if file_ext == "csv":
-                table = pcsv.read_csv(tmp_path)
-            else:
-                table = pq.read_table(tmp_path)
+        # Resolve the destination before downloading anything
+        _, workspace_id = await fabric_client.resolve_workspace_name_and_id(
+            workspace_ref
+        )
 
-            row_count = table.num_rows
+        if resource_type == "lakehouse":
+            from deltalake import write_deltalake
 
-            # Resolve workspace and lakehouse IDs
-            _, workspace_id = await fabric_client.resolve_workspace_name_and_id(
-                workspace_ref
+            _, lakehouse_id = await fabric_client.resolve_item_name_and_id(
+                item=resource_ref, type="Lakehouse", workspace=workspace_id
             )
 
-            if resource_type == "lakehouse":
-                _, lakehouse_id = await fabric_client.resolve_item_name_and_id(
-                    item=resource_ref, type="Lakehouse", workspace=workspace_id
-                )
+            # Write directly to OneLake as delta table
+            table_path = (
+                f"abfss://{workspace_id}@onelake.dfs.fabric.microsoft.com"
+                f"/{lakehouse_id}/Tables/{destination_table}"
+            )
+            token = await get_cached_token_async(
+                credential, "https://storage.azure.com/.default"
+            )
+            storage_options = {
+                "bearer_token": token,
+                "use_fabric_endpoint": "true",
+            }
+            target_file_size = (
+                target_file_size_mb * 1024 * 1024 if target_file_size_mb else None
+            )
 
-                # Write directly to OneLake as delta table
-                table_path = (
-                    f"abfss://{workspace_id}@onelake.dfs.fabric.microsoft.com"
-                    f"/{lakehouse_id}/Tables/{destination_table}"
-                )
-                token = credential.get_token(
-                    "https://storage.azure.com/.default"
-                ).token
-                storage_options = {
-                    "bearer_token": token,
-                    "use_fabric_endpoint": "true",
-                }
-
-                await asyncio.to_thread(
-                    write_deltalake,
+            def sink(reader) -> Dict[str, Any]:
+                write_deltalake(
                     table_path,
-                    table,
-                    mode="overwrite",
-                    schema_mode="overwrite",
+                    reader,
+                    mode=mode,
+                    schema_mode="overwrite" if mode == "overwrite" else None,
                     storage_options=storage_options,
+                    target_file_size=target_file_size,
                 )
-            else:
-                # Warehouse: use SQL endpoint (warehouses support DDL)
-                from helpers.clients import get_sql_endpoint
-                from helpers.clients.sql_client import SQLClient
-                import polars as pl
-
-                _, endpoint = await get_sql_endpoint(
-                    workspace=workspace_ref,
-                    warehouse=resource_ref,
-                    type="warehouse",
-                    credential=credential,
-                )
-                if not endpoint:
-                    return f"Unable to resolve SQL endpoint for warehouse '{resource_ref}'."
+                return {}
+        else:
+            # Warehouse: use SQL endpoint (warehouses support DDL)
+            from helpers.clients import get_sql_endpoint
+            from helpers.clients.sql_client import SQLClient
+
+            _, endpoint = await get_sql_endpoint(
+                workspace=workspace_ref,
+                warehouse=resource_ref,
+                type="warehouse",
+                credential=credential,
+            )
+            if not endpoint:
+                return f"Unable to resolve SQL endpoint for warehouse '{resource_ref}'."
 
-                df = pl.from_arrow(table)
-                sql_client = SQLClient(
-                    endpoint["server"], endpoint["database"], credential
+            staging = None
+            if load_method == "copy_into":
+                from helpers.clients import OneLakeClient
+
+                staging_ref = staging_lakehouse or __ctx_cache.get(
+                    f"{ctx.client_id}_lakehouse"
+                )
+                if not staging_ref:
+                    return "A staging_lakehouse is required for load_method='copy_into'."
+                _, staging_lakehouse_id = await fabric_client.resolve_item_name_and_id(
+                    item=staging_ref, type="Lakehouse", workspace=workspace_id
                 )
-                await asyncio.to_thread(
-                    sql_client.load_data, df, destination_table, "replace"
+                staging = (OneLakeClient(credential), workspace_id, staging_lakehouse_id)
+
+            sql_client = SQLClient(
+                endpoint["server"], endpoint["database"], credential
+            )
+
+            def sink(reader) -> Dict[str, Any]:
+                return _write_warehouse(
+                    reader, sql_client, destination_table, mode, load_method, staging
                 )
 
-            return f"Loaded {row_count} rows from {url} into table '{destination_table}' in {resource_type} '{resource_ref}'."
-        finally:
-            if os.path.exists(tmp_path):
-                os.remove(tmp_path)
+        started = time.perf_counter()
+        async with get_http_client(url).stream("GET", url, timeout=120) as response:
+            if response.status_code != 200:
+                return f"Failed to download file from URL: {url}"
+            if file_ext == "csv":
+                row_count, details = await _stream_csv(response, sink)
+            else:
+                row_count, details = await _stream_parquet(response, sink)
+        seconds = time.perf_counter() - started
+        rows_per_second = round(row_count / seconds, 1) if seconds > 0 else None
+
+        message = (
+            f"Loaded {row_count} rows from {url} into table '{destination_table}' "
+            f"in {resource_type} '{resource_ref}' ({mode})"
+        )
+        if details.get("method"):
+            message += f" via {details['method']}"
+        return f"{message} in {seconds:.1f}s ({rows_per_second} rows/s)."
     except Exception as e:
         return f"Error loading data: {str(e)}"
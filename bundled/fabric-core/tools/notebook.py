@@ -1,18 +1,27 @@
 from helpers.utils.context import mcp, __ctx_cache
 from mcp.server.fastmcp import Context
-from helpers.utils.authentication import get_azure_credentials
+from helpers.utils.authentication import get_azure_credentials, get_cached_token_async
 from helpers.clients import (
     FabricApiClient,
     NotebookClient,
 )
 import json
 from helpers.logging_config import get_logger
-from helpers.utils.validators import _is_valid_uuid
+from helpers.utils.http_pool import get_http_client
+from helpers.pyspark_analyzer import pyspark_analyzer
+from helpers.utils.notebook_cache import (
+    NotebookDefinition,
+    cell_source,
+    new_cell,
+    notebook_definitions,
+)
 
 
-from typing import Optional, Dict, List, Any
-import base64
+from typing import Optional, Dict, List, Any, Tuple
+import asyncio
+import fnmatch
 import re
+import time
 
 
 async def _resolve_notebook_context(
@@ -61,6 +70,82 @@ async def _resolve_notebook_context(
     }
 
 
+async def _load_notebook(
+    ctx: Context,
+    workspace: Optional[str],
+    notebook: Optional[str],
+    refresh: bool = False,
+) -> Tuple[Dict[str, Any], NotebookDefinition]:
+    """Resolve a notebook and return its context with the cached definition."""
+    context = await _resolve_notebook_context(ctx, workspace, notebook)
+    definition = await notebook_definitions.get(
+        context["fabric_client"],
+        context["workspace_id"],
+        context["notebook_id"],
+        refresh=refresh,
+    )
+    return context, definition
+
+
+async def _load_for_edit(context: Dict[str, Any]) -> NotebookDefinition:
+    """Reload the definition before an edit; call with the notebook's write lock held.
+
+    Edits never start from a stale cached copy, so changes made elsewhere (in
+    the Fabric UI, say) are not overwritten, and a reload that finds changed
+    content moves the notebook to a new version for expected_version checks.
+    """
+    return await notebook_definitions.get(
+        context["fabric_client"],
+        context["workspace_id"],
+        context["notebook_id"],
+        refresh=True,
+    )
+
+
+async def _save_notebook(
+    context: Dict[str, Any],
+    definition: NotebookDefinition,
+    notebook_data: Dict[str, Any],
+) -> None:
+    """Save an edited notebook with one updateDefinition call and commit it to the cache.
+
+    A failed update drops the cached definition, since the notebook may or may
+    not have been written.
+    """
+    fabric_client = context["fabric_client"]
+    workspace_id = context["workspace_id"]
+    notebook_id = context["notebook_id"]
+    default_path = f"{context['notebook_name'] or 'notebook'}.ipynb"
+    payload = {
+        "definition": {
+            "format": "ipynb",
+            "parts": definition.to_parts(notebook_data, default_path),
+        }
+    }
+
+    try:
+        try:
+            await fabric_client._make_request(
+                endpoint=f"workspaces/{workspace_id}/notebooks/{notebook_id}/updateDefinition",
+                method="post",
+                params=payload,
+                lro=True,
+            )
+        except Exception:
+            # Fallback to items endpoint
+            await fabric_client._make_request(
+                endpoint=f"workspaces/{workspace_id}/items/{notebook_id}/updateDefinition",
+                method="post",
+                params=payload,
+                lro=True,
+            )
+    except BaseException:
+        notebook_definitions.invalidate(workspace_id, notebook_id)
+        raise
+    definition.commit(notebook_data, default_path)
+    notebook_definitions.committed(workspace_id, notebook_id, definition)
+
+
 @mcp.tool()
 async def run_notebook_job(
     workspace: Optional[str] = None,
@@ -70,8 +155,6 @@ async def run_notebook_job(
     ctx: Context = None,
 ) -> Dict[str, Any]:
     """Submit a notebook job run with optional parameters and configuration."""
-    import requests as http_requests
-
     try:
         context = await _resolve_notebook_context(ctx, workspace, notebook)
 
@@ -86,12 +169,14 @@ async def run_notebook_job(
             f"/items/{context['notebook_id']}"
             f"/jobs/instances?jobType=RunNotebook"
         )
-        token = context["credential"].get_token(
-            "https://api.fabric.microsoft.com/.default"
-        ).token
+        token = await get_cached_token_async(
+            context["credential"], "https://api.fabric.microsoft.com/.default"
+        )
         headers = {"Authorization": f"Bearer {token}"}
 
-        resp = http_requests.post(url, headers=headers, json=payload, timeout=60)
+        resp = await get_http_client(url).post(
+            url, headers=headers, json=payload, timeout=60
+        )
 
         if resp.status_code not in (200, 201, 202):
             raise ValueError(
@@ -281,103 +366,25 @@ async def create_notebook(
 async def get_notebook_content(
     workspace: str, 
     notebook_id: str, 
+    refresh: bool = False,
     ctx: Context = None
 ) -> str:
     """Get the content of a specific notebook in a Fabric workspace.
 
+    Definitions are cached per notebook and kept current by the notebook edit tools.
+
     Args:
         workspace: Name or ID of the workspace
         notebook_id: ID or name of the notebook
+        refresh: Fetch the definition again instead of using the cached copy (default: False)
         ctx: Context object containing client information
     Returns:
         A string containing the notebook content in JSON format or an error message.
     """
     try:
-        if ctx is None:
-            raise ValueError("Context (ctx) must be provided.")
-
-        # Prefer the official GetDefinition API which returns definition.parts with the ipynb payload
-        fabric_client = FabricApiClient(get_azure_credentials(ctx.client_id, __ctx_cache))
-        import requests as http_requests
-        import time as _time
-
-        # Resolve workspace to ID
-        (workspace_name, workspace_id) = await fabric_client.resolve_workspace_name_and_id(workspace)
-
-        # Resolve notebook name to ID if needed
-        resolved_id = notebook_id
-        if not _is_valid_uuid(notebook_id):
-            notebooks = await fabric_client.get_notebooks(workspace_id)
-            for nb in notebooks:
-                if nb.get("displayName") == notebook_id:
-                    resolved_id = nb["id"]
-                    break
-            else:
-                return f"Could not find notebook '{notebook_id}' in workspace '{workspace_name}'"
+        _, definition = await _load_notebook(ctx, workspace, notebook_id, refresh=refresh)
+        return definition.content()
 
-        # getDefinition is an LRO: POST → poll Location → GET {operation}/result
-        notebook = None
-        try:
-            url = fabric_client._build_url(f"workspaces/{workspace_id}/notebooks/{resolved_id}/getDefinition?format=ipynb")
-            resp = http_requests.post(url, headers=fabric_client._get_headers(), json={}, timeout=60)
-            if resp.status_code == 202:
-                op_url = resp.headers.get("Location") or resp.headers.get("Operation-Location")
-                if op_url:
-                    for _ in range(30):
-                        _time.sleep(2)
-                        poll = http_requests.get(op_url, headers=fabric_client._get_headers(), timeout=60)
-                        if poll.json().get("status") in ("Succeeded", "succeeded"):
-                            result = http_requests.get(op_url + "/result", headers=fabric_client._get_headers(), timeout=60)
-                            if result.status_code == 200:
-                                notebook = result.json()
-                            break
-            elif resp.status_code == 200:
-                notebook = resp.json()
-        except Exception as e:
-            logger.warning(f"getDefinition failed: {e}")
-            notebook = None
-
-        if not isinstance(notebook, dict):
-            return f"Unexpected response when fetching notebook definition: type={type(notebook).__name__}, value={str(notebook)[:500]}"
-
-        definition = notebook.get("definition") or {}
-        parts = definition.get("parts") or []
-
-        # Try common cases: ipynb, py, sql, scala
-        preferred_exts = (".ipynb", ".py", ".sql", ".scala")
-
-        def decode_if_base64(payload: str) -> str:
-            try:
-                return base64.b64decode(payload).decode("utf-8")
-            except Exception:
-                return payload  # not base64 or already plain text
-
-        # First pass: return the ipynb if present
-        for part in parts:
-            if str(part.get("path", "")).endswith(".ipynb") and part.get("payload"):
-                return decode_if_base64(part["payload"])
-
-        # Second pass: return the first supported text part
-        for part in parts:
-            path = str(part.get("path", ""))
-            if path.endswith(preferred_exts) and part.get("payload"):
-                return decode_if_base64(part["payload"])
-
-        # Fallback: if no parts found, the notebook may be empty or newly created
-        # Return a minimal valid notebook structure
-        if not parts:
-            logger.info(f"No content parts found in notebook '{notebook_id}'. Returning empty notebook structure.")
-            empty_notebook = {
-                "cells": [],
-                "metadata": {},
-                "nbformat": 4,
-                "nbformat_minor": 5
-            }
-            return json.dumps(empty_notebook)
-        
-        # If we have parts but couldn't decode any, return the raw definition for diagnostics
-        return json.dumps(definition)
-        
     except Exception as e:
         logger.error(f"Error getting notebook content: {str(e)}")
         return f"Error getting notebook content: {str(e)}"
@@ -1102,6 +1109,13 @@ async def validate_pyspark_code(
         logger.error(f"Error validating PySpark code: {str(e)}")
         return f"Error validating PySpark code: {str(e)}"
 
+def _backup_notebook(ctx: Context, notebook_id: str, definition: NotebookDefinition) -> None:
+    """Keep the content before an edit so restore_notebook can put it back."""
+    backup_key = f"{ctx.client_id}_notebook_backup_{notebook_id}"
+    __ctx_cache[backup_key] = definition.content()
+    logger.info(f"Cached backup of notebook '{notebook_id}' ({len(definition.cells)} cells)")
+
+
 @mcp.tool()
 async def update_notebook_cell(
     workspace: str,
@@ -1124,120 +1138,197 @@ async def update_notebook_cell(
         A string confirming the update or an error message.
     """
     try:
-        if ctx is None:
-            raise ValueError("Context (ctx) must be provided.")
+        context = await _resolve_notebook_context(ctx, workspace, notebook_id)
 
-        # Get current notebook content
-        current_content = await get_notebook_content(workspace, notebook_id, ctx)
+        async with notebook_definitions.write_lock(context["workspace_id"], context["notebook_id"]):
+            definition = await _load_for_edit(context)
+            if not definition.editable:
+                return "Cannot update notebook: existing content is not valid JSON. Aborting to prevent data loss."
 
-        if not current_content or current_content.startswith("Error") or current_content.startswith("Could not") or current_content.startswith("Unexpected"):
-            return f"Cannot update notebook: failed to read existing content. Aborting to prevent data loss. Details: {current_content}"
+            _backup_notebook(ctx, notebook_id, definition)
 
-        notebook_data = None
-        try:
-            notebook_data = json.loads(current_content)
-        except json.JSONDecodeError:
-            return f"Cannot update notebook: existing content is not valid JSON. Aborting to prevent data loss."
+            notebook_data = definition.copy_notebook()
+            cells = notebook_data.setdefault("cells", [])
+            cell = new_cell(cell_content, cell_type)
 
-        if not isinstance(notebook_data.get("cells"), list):
-            return f"Cannot update notebook: no valid cells found in existing notebook. Aborting to prevent data loss."
+            # If cell_index is beyond current cells, pad with empty cells up to that index
+            if cell_index >= len(cells):
+                while len(cells) < cell_index:
+                    cells.append(new_cell([]))
+                cells.append(cell)
+                logger.info(f"Added cell at index {cell_index} (notebook now has {len(cells)} cells)")
+            else:
+                logger.info(f"Updating existing cell at index {cell_index}")
+                cells[cell_index] = cell
 
-        # Cache original notebook content before modifying
-        backup_key = f"{ctx.client_id}_notebook_backup_{notebook_id}"
-        __ctx_cache[backup_key] = current_content
-        logger.info(f"Cached backup of notebook '{notebook_id}' ({len(notebook_data['cells'])} cells)")
+            await _save_notebook(context, definition, notebook_data)
 
-        cells = notebook_data["cells"]
-        
-        # Create new cell object
-        new_cell = {
-            "cell_type": cell_type,
-            "source": cell_content.splitlines(keepends=True) if isinstance(cell_content, str) else cell_content,
-            "execution_count": None,
-            "outputs": [],
-            "metadata": {}
-        }
-        
-        # If cell_index is beyond current cells, pad with empty cells up to that index
-        if cell_index >= len(cells):
-            while len(cells) < cell_index:
-                cells.append({"cell_type": "code", "source": [], "execution_count": None, "outputs": [], "metadata": {}})
-            cells.append(new_cell)
-            logger.info(f"Added cell at index {cell_index} (notebook now has {len(cells)} cells)")
-        else:
-            # Update existing cell
-            logger.info(f"Updating existing cell at index {cell_index}")
-            cells[cell_index] = new_cell
-        
-        # Update the notebook
-        updated_content = json.dumps(notebook_data, indent=2)
-        
-        # Build updateDefinition payload
-        fabric_client = FabricApiClient(get_azure_credentials(ctx.client_id, __ctx_cache))
-        (workspace_name, workspace_id) = await fabric_client.resolve_workspace_name_and_id(workspace)
-
-        # Resolve notebook name to ID if needed
-        resolved_id = notebook_id
-        display_name = notebook_id
-        if not _is_valid_uuid(notebook_id):
-            notebooks = await fabric_client.get_notebooks(workspace_id)
-            for nb in notebooks:
-                if nb.get("displayName") == notebook_id:
-                    resolved_id = nb["id"]
-                    display_name = nb["displayName"]
-                    break
+        return f"Cell {cell_index} updated successfully."
+
+    except Exception as e:
+        logger.error(f"Error updating notebook cell: {str(e)}")
+        return f"Error updating notebook cell: {str(e)}"
+
+
+_CELL_OPERATIONS = ("insert", "replace", "delete")
+
+
+def _check_cell_operations(
+    cell_count: int, operations: List[Dict[str, Any]]
+) -> List[Dict[str, Any]]:
+    """Validate a batch of cell operations in order, without touching the notebook.
+
+    Each index refers to the notebook as the earlier operations leave it, so
+    e.g. two inserts at index 0 end up in reverse order.
+    """
+    count = cell_count
+    results = []
+    for position, operation in enumerate(operations):
+        op = str(operation.get("op", "")).lower()
+        index = operation.get("index")
+        result: Dict[str, Any] = {"position": position, "op": op, "index": index}
+        error = None
+        if op not in _CELL_OPERATIONS:
+            error = f"op must be one of {', '.join(_CELL_OPERATIONS)}"
+        elif index is not None and (isinstance(index, bool) or not isinstance(index, int)):
+            error = "index must be an integer"
+        elif operation.get("cell_type", "code") not in ("code", "markdown", "raw"):
+            error = "cell_type must be 'code', 'markdown' or 'raw'"
+        elif op == "insert":
+            if index is None:
+                index = result["index"] = count
+            if not 0 <= index <= count:
+                error = f"insert index must be between 0 and {count}"
+            elif operation.get("source") is None:
+                error = "source is required"
             else:
-                return f"Could not find notebook '{notebook_id}' in workspace '{workspace_name}'"
+                count += 1
+        elif index is None or not 0 <= index < count:
+            error = f"index must be between 0 and {count - 1}" if count else "notebook has no cells"
+        elif op == "replace":
+            if operation.get("source") is None:
+                error = "source is required"
         else:
-            try:
-                item_meta = await fabric_client.get_item(
-                    item_id=resolved_id,
-                    workspace_id=workspace_id,
-                    item_type="notebook",
-                )
-                display_name = item_meta.get("displayName") or "notebook"
-            except Exception:
-                display_name = "notebook"
+            count -= 1
 
-        ipynb_path = f"{display_name}.ipynb"
-        payload = {
-            "definition": {
-                "format": "ipynb",
-                "parts": [
-                    {
-                        "path": ipynb_path,
-                        "payload": base64.b64encode(updated_content.encode("utf-8")).decode("utf-8"),
-                        "payloadType": "InlineBase64",
-                    }
-                ],
-            }
+        if error:
+            result.update({"status": "error", "error": error})
+        else:
+            result["status"] = "ok"
+        results.append(result)
+    return results
+
+
+def _apply_cell_operation(cells: List[Dict[str, Any]], operation: Dict[str, Any], index: int) -> None:
+    """Apply one validated operation to the cell list."""
+    op = operation["op"].lower()
+    if op == "delete":
+        del cells[index]
+    elif op == "insert":
+        cells.insert(index, new_cell(operation["source"], operation.get("cell_type", "code")))
+    else:
+        previous = cells[index]
+        cell = new_cell(
+            operation["source"],
+            operation.get("cell_type") or previous.get("cell_type", "code"),
+        )
+        # Fabric keeps e.g. the cell language in the cell metadata
+        cell["metadata"] = previous.get("metadata", {})
+        cells[index] = cell
+
+
+@mcp.tool()
+async def patch_notebook_cells(
+    workspace: str,
+    notebook_id: str,
+    operations: List[Dict[str, Any]],
+    expected_version: Optional[int] = None,
+    dry_run: bool = False,
+    ctx: Context = None,
+) -> Dict[str, Any]:
+    """Insert, replace and delete several notebook cells with one updateDefinition call.
+
+    All operations are validated first, in order, against the notebook as the
+    earlier operations leave it. If any operation is invalid nothing is
+    written; otherwise they are applied together and saved in a single update.
+    The notebook is always reloaded first, so edits made elsewhere since it
+    was cached are kept and show up as a new version.
+
+    Args:
+        workspace: Name or ID of the workspace
+        notebook_id: ID or name of the notebook
+        operations: List of operations, each a dict with "op" ("insert", "replace"
+            or "delete") and "index" (0-based; insert appends when omitted), plus
+            "source" (string or list of lines) and optional "cell_type" ("code",
+            "markdown" or "raw") for insert and replace.
+        expected_version: Only write if the notebook is still at this version,
+            as returned by a previous call (optional)
+        dry_run: Only validate the operations (default: False)
+        ctx: Context object containing client information
+    Returns:
+        A dictionary with overall success, the notebook version and a result per operation.
+    """
+    try:
+        if not operations:
+            return {"error": "No operations given."}
+
+        context = await _resolve_notebook_context(ctx, workspace, notebook_id)
+
+        async with notebook_definitions.write_lock(context["workspace_id"], context["notebook_id"]):
+            definition = await _load_for_edit(context)
+            if not definition.editable:
+                return {"error": "Notebook definition has no ipynb part to edit."}
+            if expected_version is not None and expected_version != definition.version:
+                return {
+                    "success": False,
+                    "applied": 0,
+                    "message": (
+                        f"Notebook is at version {definition.version}, not {expected_version}; "
+                        "nothing was written"
+                    ),
+                    "notebook": context["notebook_name"],
+                    "version": definition.version,
+                }
+
+            results = _check_cell_operations(len(definition.cells), operations)
+            failed = [result for result in results if result["status"] == "error"]
+            if failed or dry_run:
+                return {
+                    "success": not failed,
+                    "applied": 0,
+                    "message": (
+                        f"{len(failed)} of {len(operations)} operations are invalid; nothing was written"
+                        if failed
+                        else f"All {len(operations)} operations are valid (dry run)"
+                    ),
+                    "notebook": context["notebook_name"],
+                    "version": definition.version,
+                    "results": results,
+                }
+
+            _backup_notebook(ctx, notebook_id, definition)
+            notebook_data = definition.copy_notebook()
+            cells = notebook_data.setdefault("cells", [])
+            for operation, result in zip(operations, results):
+                _apply_cell_operation(cells, operation, result["index"])
+            await _save_notebook(context, definition, notebook_data)
+
+        logger.info(f"Applied {len(operations)} cell operations to notebook '{context['notebook_name']}'")
+
+        return {
+            "success": True,
+            "applied": len(operations),
+            "message": f"Applied {len(operations)} cell operations in one update",
+            "notebook": context["notebook_name"],
+            "version": definition.version,
+            "cells": len(cells),
+            "results": results,
         }
 
-        # Use notebooks endpoint with LRO
-        try:
-            await fabric_client._make_request(
-                endpoint=f"workspaces/{workspace_id}/notebooks/{resolved_id}/updateDefinition",
-                method="post",
-                params=payload,
-                lro=True,
-            )
-            return f"Cell {cell_index} updated successfully."
-        except Exception as inner_exc:
-            # Fallback to items endpoint
-            try:
-                await fabric_client._make_request(
-                    endpoint=f"workspaces/{workspace_id}/items/{resolved_id}/updateDefinition",
-                    method="post",
-                    params=payload,
-                    lro=True,
-                )
-                return f"Cell {cell_index} updated successfully."
-            except Exception as fallback_exc:
-                raise fallback_exc
-        
-    except Exception as e:
-        logger.error(f"Error updating notebook cell: {str(e)}")
-        return f"Error updating notebook cell: {str(e)}"
+    except Exception as exc:
+        logger.error(f"Error patching notebook cells: {exc}")
+        return {"error": str(exc)}
+
 
 @mcp.tool()
 async def restore_notebook(
@@ -1245,7 +1336,7 @@ async def restore_notebook(
     notebook_id: str,
     ctx: Context = None,
 ) -> str:
-    """Restore a notebook to its state before the last update_notebook_cell call.
+    """Restore a notebook to its state before the last update_notebook_cell or patch_notebook_cells call.
 
     Args:
         workspace: Name or ID of the workspace
@@ -1264,65 +1355,15 @@ async def restore_notebook(
         if not backup_content:
             return f"No backup found for notebook '{notebook_id}'. Restore only works within the same session after an update_notebook_cell call."
 
-        # Resolve workspace and notebook
-        fabric_client = FabricApiClient(get_azure_credentials(ctx.client_id, __ctx_cache))
-        (workspace_name, workspace_id) = await fabric_client.resolve_workspace_name_and_id(workspace)
-
-        resolved_id = notebook_id
-        display_name = notebook_id
-        if not _is_valid_uuid(notebook_id):
-            notebooks = await fabric_client.get_notebooks(workspace_id)
-            for nb in notebooks:
-                if nb.get("displayName") == notebook_id:
-                    resolved_id = nb["id"]
-                    display_name = nb["displayName"]
-                    break
-            else:
-                return f"Could not find notebook '{notebook_id}' in workspace '{workspace_name}'"
-        else:
-            try:
-                item_meta = await fabric_client.get_item(
-                    item_id=resolved_id,
-                    workspace_id=workspace_id,
-                    item_type="notebook",
-                )
-                display_name = item_meta.get("displayName") or "notebook"
-            except Exception:
-                display_name = "notebook"
-
-        ipynb_path = f"{display_name}.ipynb"
-        payload = {
-            "definition": {
-                "format": "ipynb",
-                "parts": [
-                    {
-                        "path": ipynb_path,
-                        "payload": base64.b64encode(backup_content.encode("utf-8")).decode("utf-8"),
-                        "payloadType": "InlineBase64",
-                    }
-                ],
-            }
-        }
-
-        try:
-            await fabric_client._make_request(
-                endpoint=f"workspaces/{workspace_id}/notebooks/{resolved_id}/updateDefinition",
-                method="post",
-                params=payload,
-                lro=True,
-            )
-        except Exception:
-            await fabric_client._make_request(
-                endpoint=f"workspaces/{workspace_id}/items/{resolved_id}/updateDefinition",
-                method="post",
-                params=payload,
-                lro=True,
-            )
+        context = await _resolve_notebook_context(ctx, workspace, notebook_id)
+        async with notebook_definitions.write_lock(context["workspace_id"], context["notebook_id"]):
+            definition = await _load_for_edit(context)
+            await _save_notebook(context, definition, json.loads(backup_content))
 
         # Clear the backup after successful restore
         del __ctx_cache[backup_key]
         logger.info(f"Restored notebook '{notebook_id}' from backup")
-        return f"Notebook '{display_name}' restored to its previous state."
+        return f"Notebook '{context['notebook_name']}' restored to its previous state."
 
     except Exception as e:
         logger.error(f"Error restoring notebook: {str(e)}")
@@ -1550,68 +1591,49 @@ async def analyze_notebook_performance(
         A string containing performance analysis and optimization recommendations.
     """
     try:
-        if ctx is None:
-            raise ValueError("Context (ctx) must be provided.")
-
-        # Get notebook content
-        notebook_content = await get_notebook_content(workspace, notebook_id, ctx)
-        
-        if notebook_content.startswith("Error"):
-            return notebook_content
-        
-        # Parse notebook and extract code cells
-        notebook_data = json.loads(notebook_content)
-        cells = notebook_data.get("cells", [])
+        # Parsed notebook shared with the other notebook tools
+        _, definition = await _load_notebook(ctx, workspace, notebook_id)
+        cells = definition.cells
         
         code_cells = [cell for cell in cells if cell.get("cell_type") == "code"]
         
         if not code_cells:
             return "No code cells found in the notebook."
         
-        # Analyze each code cell
+        # Unchanged notebooks and cells come from the analyzer's cache
+        summary, _ = await asyncio.to_thread(
+            pyspark_analyzer.analyze_notebook, [cell_source(cell) for cell in code_cells]
+        )
+
         analysis_results = []
-        total_operations = 0
-        performance_issues = []
-        optimization_opportunities = []
-        
-        from helpers.pyspark_helpers import PySparkValidator
-        validator = PySparkValidator()
-        
-        for i, cell in enumerate(code_cells):
-            cell_source = "\n".join(cell.get("source", []))
-            
-            if not cell_source.strip():
-                continue
-                
-            analysis_results.append(f"### Cell {i + 1}")
-            
-            # Count operations
-            operations = [
-                ("DataFrame reads", cell_source.count("spark.read") + cell_source.count("spark.table")),
-                ("DataFrame writes", cell_source.count(".write.")),
-                ("Transformations", cell_source.count(".withColumn") + cell_source.count(".select") + cell_source.count(".filter")),
-                ("Actions", cell_source.count(".show()") + cell_source.count(".count()") + cell_source.count(".collect()"))
-            ]
-            
-            for op_name, count in operations:
+        for cell in summary["cells"]:
+            analysis_results.append(f"### Cell {cell['cell']}")
+            if cell.get("skipped"):
+                analysis_results.append(f"- Skipped ({cell['skipped']} cell)")
+            elif cell.get("error"):
+                analysis_results.append(f"- Could not parse: {cell['error']}")
+            for op_name, count in cell["operations"].items():
                 if count > 0:
                     analysis_results.append(f"- {op_name}: {count}")
-                    total_operations += count
-            
-            # Check for performance patterns
-            perf_results = validator.check_performance_patterns(cell_source)
-            performance_issues.extend(perf_results["warnings"])
-            optimization_opportunities.extend(perf_results["optimizations"])
-            
-            # Fabric-specific analysis
-            fabric_results = validator.validate_fabric_compatibility(cell_source)
-            optimization_opportunities.extend(fabric_results["suggestions"])
-        
+
+        # message -> locations, in order of first occurrence
+        performance_issues: Dict[str, List[str]] = {}
+        optimization_opportunities: Dict[str, List[str]] = {}
+        for finding in summary["findings"]:
+            target = (
+                performance_issues
+                if finding["severity"] == "warning"
+                else optimization_opportunities
+            )
+            target.setdefault(finding["message"], []).append(
+                f"cell {finding['cell']} line {finding['line']}: {finding['detail']}"
+            )
+
         # Generate comprehensive report
         report = f"# Notebook Performance Analysis Report\n\n"
         report += f"**Notebook:** {notebook_id}\n"
         report += f"**Total Code Cells:** {len(code_cells)}\n"
-        report += f"**Total Operations:** {total_operations}\n\n"
+        report += f"**Total Operations:** {sum(summary['operations'].values())}\n\n"
         
         if analysis_results:
             report += "## Cell-by-Cell Analysis\n"
@@ -1619,21 +1641,17 @@ async def analyze_notebook_performance(
         
         if performance_issues:
             report += "## Performance Issues Found\n"
-            for issue in set(performance_issues):  # Remove duplicates
-                report += f"- {issue}\n"
+            for issue, locations in performance_issues.items():
+                report += f"- {issue} ({'; '.join(locations)})\n"
             report += "\n"
         
         if optimization_opportunities:
             report += "## Optimization Opportunities\n"
-            for opportunity in set(optimization_opportunities):  # Remove duplicates
-                report += f"- {opportunity}\n"
+            for opportunity, locations in optimization_opportunities.items():
+                report += f"- {opportunity} ({'; '.join(locations)})\n"
             report += "\n"
         
-        # Performance score calculation
-        score = 100
-        score -= len(set(performance_issues)) * 10  # -10 points per unique issue
-        score -= len(set(optimization_opportunities)) * 5  # -5 points per optimization opportunity
-        score = max(score, 0)  # Ensure score doesn't go negative
+        score = summary["score"]
         
         report += f"## Performance Score: {score}/100\n\n"
         
@@ -1651,3 +1669,156 @@ async def analyze_notebook_performance(
     except Exception as e:
         logger.error(f"Error analyzing notebook performance: {str(e)}")
         return f"Error analyzing notebook performance: {str(e)}"
+
+
+@mcp.tool()
+async def audit_workspace_notebooks(
+    workspace: Optional[str] = None,
+    name_pattern: Optional[str] = None,
+    notebooks: Optional[List[str]] = None,
+    max_concurrency: int = 8,
+    refresh: bool = False,
+    top: int = 20,
+    ctx: Context = None,
+) -> Dict[str, Any]:
+    """Analyze the notebooks of a workspace for performance anti-patterns in one pass.
+
+    Definitions are fetched concurrently (paced by the shared rate limiter)
+    and analyzed with the same rules as analyze_notebook_performance.
+    Notebooks whose code is unchanged since an earlier run reuse their
+    cached analysis.
+
+    Args:
+        workspace: Name or ID of the workspace (optional, uses active)
+        name_pattern: Only audit notebooks whose name matches this glob, e.g. "etl_*" (optional)
+        notebooks: Only audit these notebook names or IDs (optional)
+        max_concurrency: Number of notebook definitions fetched at the same time
+        refresh: Fetch definitions again instead of using cached copies (default: False)
+        top: Number of worst-scoring notebooks to list
+        ctx: Context object containing client information
+    Returns:
+        Anti-patterns ranked by how many notebooks they affect, the worst
+        notebooks by score, and notebooks that failed or were skipped.
+    """
+    try:
+        started = time.perf_counter()
+        context = await _resolve_notebook_context(ctx, workspace, None, require_notebook=False)
+        fabric_client = context["fabric_client"]
+        workspace_id = context["workspace_id"]
+
+        items = await fabric_client.get_notebooks(workspace_id)
+        failed: List[Dict[str, Any]] = []
+        if notebooks:
+            wanted = {str(ref).lower(): ref for ref in notebooks}
+            matched = [
+                item
+                for item in items
+                if str(item.get("displayName", "")).lower() in wanted
+                or str(item.get("id", "")).lower() in wanted
+            ]
+            found = {str(item.get(key, "")).lower() for item in matched for key in ("displayName", "id")}
+            failed.extend(
+                {"notebook": ref, "error": "Notebook not found"}
+                for key, ref in wanted.items()
+                if key not in found
+            )
+            items = matched
+        if name_pattern:
+            items = [
+                item
+                for item in items
+                if fnmatch.fnmatch(str(item.get("displayName", "")).lower(), name_pattern.lower())
+            ]
+
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        audited: List[Dict[str, Any]] = []
+        skipped: List[Dict[str, Any]] = []
+
+        async def _audit(item: Dict[str, Any]) -> None:
+            name = item.get("displayName")
+            try:
+                async with semaphore:
+                    definition = await notebook_definitions.get(
+                        fabric_client, workspace_id, item["id"], refresh=refresh
+                    )
+                if not definition.editable:
+                    skipped.append({"notebook": name, "id": item["id"], "reason": "no ipynb content"})
+                    return
+                sources = [
+                    cell_source(cell)
+                    for cell in definition.cells
+                    if cell.get("cell_type") == "code"
+                ]
+                summary, cached = await asyncio.to_thread(pyspark_analyzer.analyze_notebook, sources)
+                audited.append({"notebook": name, "id": item["id"], "summary": summary, "cached": cached})
+            except Exception as exc:
+                logger.error(f"Error auditing notebook '{name}': {exc}")
+                failed.append({"notebook": name, "id": item.get("id"), "error": str(exc)})
+
+        await asyncio.gather(*(_audit(item) for item in items))
+
+        # Rank anti-patterns by how many notebooks they affect, warnings first
+        patterns: Dict[str, Dict[str, Any]] = {}
+        for entry in audited:
+            for finding in entry["summary"]["findings"]:
+                pattern = patterns.setdefault(
+                    finding["rule"],
+                    {
+                        "rule": finding["rule"],
+                        "severity": finding["severity"],
+                        "message": finding["message"],
+                        "occurrences": 0,
+                        "notebooks": set(),
+                        "examples": [],
+                    },
+                )
+                pattern["occurrences"] += 1
+                pattern["notebooks"].add(entry["id"])
+                if len(pattern["examples"]) < 3:
+                    pattern["examples"].append(
+                        f"{entry['notebook']} cell {finding['cell']} line {finding['line']}: {finding['detail']}"
+                    )
+        anti_patterns = sorted(
+            ({**pattern, "notebooks": len(pattern["notebooks"])} for pattern in patterns.values()),
+            key=lambda pattern: (
+                pattern["severity"] != "warning",
+                -pattern["notebooks"],
+                -pattern["occurrences"],
+            ),
+        )
+
+        ranked = sorted(
+            audited,
+            key=lambda entry: (entry["summary"]["score"], -len(entry["summary"]["findings"])),
+        )
+        worst = []
+        for entry in ranked[: max(0, top)]:
+            findings = entry["summary"]["findings"]
+            worst.append(
+                {
+                    "notebook": entry["notebook"],
+                    "id": entry["id"],
+                    "score": entry["summary"]["score"],
+                    "warnings": sum(1 for finding in findings if finding["severity"] == "warning"),
+                    "suggestions": sum(1 for finding in findings if finding["severity"] != "warning"),
+                    "rules": list(dict.fromkeys(finding["rule"] for finding in findings)),
+                }
+            )
+
+        scores = [entry["summary"]["score"] for entry in audited]
+        return {
+            "workspace": context["workspace_name"],
+            "notebooks": len(items),
+            "analyzed": len(audited),
+            "unchanged": sum(1 for entry in audited if entry["cached"]),
+            "averageScore": round(sum(scores) / len(scores), 1) if scores else None,
+            "antiPatterns": anti_patterns,
+            "worstNotebooks": worst,
+            "skipped": skipped,
+            "failed": failed,
+            "seconds": round(time.perf_counter() - started, 3),
+        }
+
+    except Exception as exc:
+        logger.error(f"Error auditing workspace notebooks: {exc}")
+        return {"error": str(exc)}
@@ -11,6 +11,11 @@ from helpers.utils.context import mcp, __ctx_cache
 
 logger = get_logger(__name__)
 
+# Default cap on bytes returned by onelake_read
+_DEFAULT_READ_BYTES = 1024 * 1024
+# Default page size for onelake_ls
+_DEFAULT_LIST_ENTRIES = 1000
+
 
 async def _resolve_lakehouse_context(
     ctx: Context,
@@ -52,9 +57,32 @@ async def onelake_ls(
     lakehouse: str,
     path: Optional[str] = None,
     workspace: Optional[str] = None,
+    recursive: bool = False,
+    pattern: Optional[str] = None,
+    prefix: Optional[str] = None,
+    max_entries: int = _DEFAULT_LIST_ENTRIES,
+    continuation_token: Optional[str] = None,
+    summarize: bool = False,
+    use_cache: bool = False,
     ctx: Context = None,
 ) -> Dict[str, Any]:
-    """List files and folders within a OneLake lakehouse path."""
+    """List files and folders within a OneLake lakehouse path.
+
+    Args:
+        lakehouse: Name or ID of the lakehouse.
+        path: Directory to list (default "Files"; "Tables" lists tables).
+        workspace: Name or ID of the workspace (optional, uses active).
+        recursive: Include everything below path, not just direct children.
+        pattern: Glob matched against each entry's path below path (e.g. "*.parquet", "2024/*/*.csv").
+        prefix: Keep entries whose path below path starts with this.
+        max_entries: Maximum entries returned; pass continuationToken back to get the rest.
+        continuation_token: Token from a previous call to continue that listing.
+        summarize: Return file/directory counts and bytes, in total and per
+            subdirectory, instead of entries. Walks the whole tree below path.
+        use_cache: Reuse listings fetched in the last few seconds. Writes and
+            deletes through onelake_write/onelake_rm drop them.
+        ctx: Context object containing client information.
+    """
 
     try:
         credential, workspace_id, lakehouse_id = await _resolve_lakehouse_context(
@@ -84,12 +112,34 @@ async def onelake_ls(
             }
 
         client = OneLakeClient(credential)
-        entries = await client.list_directory(workspace_id, lakehouse_id, path)
+        if summarize:
+            summary = await client.summarize_directory(
+                workspace_id, lakehouse_id, path, pattern=pattern, prefix=prefix, use_cache=use_cache
+            )
+            return {
+                "workspaceId": workspace_id,
+                "lakehouseId": lakehouse_id,
+                "path": path or "Files",
+                "summary": summary,
+            }
+
+        listing = await client.list_directory(
+            workspace_id,
+            lakehouse_id,
+            path,
+            recursive=recursive,
+            pattern=pattern,
+            prefix=prefix,
+            max_entries=max(max_entries, 1),
+            continuation_token=continuation_token,
+            use_cache=use_cache,
+        )
         return {
             "workspaceId": workspace_id,
             "lakehouseId": lakehouse_id,
             "path": path or "Files",
-            "entries": entries,
+            "entries": listing["entries"],
+            "continuationToken": listing["continuationToken"],
         }
     except Exception as exc:
         logger.error("OneLake list failed: %s", exc)
@@ -101,21 +151,59 @@ async def onelake_read(
     lakehouse: str,
     path: str,
     workspace: Optional[str] = None,
+    offset: int = 0,
+    length: Optional[int] = None,
+    max_bytes: int = _DEFAULT_READ_BYTES,
     ctx: Context = None,
 ) -> Dict[str, Any]:
-    """Read file contents from OneLake."""
+    """Read file contents from OneLake.
+
+    Reads at most max_bytes bytes (default 1 MiB) starting at offset, or
+    length bytes when that is smaller. truncated=true means the file or
+    requested range continues; pass nextOffset as offset to read on. Use
+    onelake_parquet_metadata to inspect Parquet files instead of reading them.
+    """
 
     try:
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be positive.")
         credential, workspace_id, lakehouse_id = await _resolve_lakehouse_context(
             ctx, workspace, lakehouse
         )
         client = OneLakeClient(credential)
-        return await client.read_file(workspace_id, lakehouse_id, path)
+        return await client.read_file(
+            workspace_id, lakehouse_id, path, offset=offset, length=length, max_bytes=max_bytes
+        )
     except Exception as exc:
         logger.error("OneLake read failed: %s", exc)
         return {"error": str(exc)}
 
 
+@mcp.tool()
+async def onelake_parquet_metadata(
+    lakehouse: str,
+    path: str,
+    workspace: Optional[str] = None,
+    ctx: Context = None,
+) -> Dict[str, Any]:
+    """Describe a Parquet file in OneLake from its footer.
+
+    Returns the schema, row count and per-row-group column statistics
+    (compression, sizes, null counts, min/max). Only the footer is
+    downloaded, so this is cheap even for multi-gigabyte files.
+    """
+
+    try:
+        credential, workspace_id, lakehouse_id = await _resolve_lakehouse_context(
+            ctx, workspace, lakehouse
+        )
+        client = OneLakeClient(credential)
+        return await client.read_parquet_metadata(workspace_id, lakehouse_id, path)
+    except Exception as exc:
+        logger.error("OneLake Parquet metadata read failed: %s", exc)
+        return {"error": str(exc)}
+
+
 @mcp.tool()
 async def onelake_write(
     lakehouse: str,
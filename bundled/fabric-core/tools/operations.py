@@ -0,0 +1,60 @@
+from typing import Any, Dict
+
+from mcp.server.fastmcp import Context
+
+from helpers.logging_config import get_logger
+from helpers.utils.context import mcp
+from helpers.utils.lro import lro_manager
+
+
+logger = get_logger(__name__)
+
+
+@mcp.tool()
+async def get_operation(
+    operation_id: str,
+    ctx: Context = None,
+) -> Dict[str, Any]:
+    """Get the current state of a long-running operation without waiting.
+
+    Operation handles are returned by tools called with wait=False, or when a
+    long-running call outlives its timeout.
+
+    Args:
+        operation_id: ID from the operation handle ("operationId").
+        ctx: MCP context
+    Returns:
+        The operation handle: status, percentComplete, polls, and the result once done.
+    """
+    try:
+        operation = lro_manager.get(operation_id)
+        if operation is None:
+            raise ValueError(f"Unknown or expired operation '{operation_id}'.")
+        return operation.to_dict()
+    except Exception as exc:
+        logger.error("Failed to get operation '%s': %s", operation_id, exc)
+        return {"error": str(exc)}
+
+
+@mcp.tool()
+async def wait_operation(
+    operation_id: str,
+    timeout: int = 300,
+    ctx: Context = None,
+) -> Dict[str, Any]:
+    """Wait for a long-running operation to finish.
+
+    Args:
+        operation_id: ID from the operation handle ("operationId").
+        timeout: Maximum seconds to wait. The handle is returned with done=false
+            if the operation is still running when the timeout expires.
+        ctx: MCP context
+    Returns:
+        The operation handle, including the result once done.
+    """
+    try:
+        operation = await lro_manager.wait(operation_id, timeout=max(timeout, 0))
+        return operation.to_dict()
+    except Exception as exc:
+        logger.error("Failed to wait for operation '%s': %s", operation_id, exc)
+        return {"error": str(exc)}
@@ -1,10 +1,11 @@
 from typing import Any, Dict, Optional
 
-from helpers.clients import FabricApiClient
+from helpers.clients import FabricApiClient, SemanticModelClient
 from helpers.logging_config import get_logger
 from helpers.utils import _is_valid_uuid
 from helpers.utils.authentication import get_azure_credentials
 from helpers.utils.context import mcp, __ctx_cache
+from helpers.utils.tabular import check_format, encode_frame, frame_from_records
 from mcp.server.fastmcp import Context
 
 
@@ -72,6 +73,15 @@ async def _resolve_item(
     return context
 
 
+def _encode_dax_tables(response: Dict[str, Any], format: str) -> None:
+    """Re-encode the row objects of every executeQueries result table in place."""
+    for result in response.get("results") or []:
+        result["tables"] = [
+            encode_frame(frame_from_records(table.get("rows") or []), format)
+            for table in result.get("tables") or []
+        ]
+
+
 @mcp.tool()
 async def semantic_model_refresh(
     workspace: Optional[str] = None,
@@ -96,6 +106,10 @@ async def semantic_model_refresh(
         retry_count: Number of retries on transient failures
         apply_refresh_policy: Apply incremental refresh policy (True/False)
         ctx: FastMCP context
+
+    Refreshes run asynchronously. Cached DAX results are keyed by the model's
+    last completed refresh, so they go stale when this refresh finishes, and
+    dax_query does not use the cache while it is running.
     """
     try:
         context = await _resolve_item(ctx, workspace, model, "SemanticModel")
@@ -131,20 +145,38 @@ async def dax_query(
     dataset: str,
     query: str,
     workspace: Optional[str] = None,
+    use_cache: bool = False,
+    invalidate_cache: bool = False,
+    format: str = "rows",
     ctx: Context = None,
 ) -> Dict[str, Any]:
+    """Run a DAX query against a semantic model.
+
+    With use_cache=True, the response may come from a short-lived result
+    cache keyed by model and normalized query text, and carries "cache"
+    metadata (hit, ageSeconds). Results are keyed by the model's last completed
+    refresh, so they are not reused across refreshes, and the cache is skipped
+    while a refresh is running. invalidate_cache=True drops them explicitly.
+
+    format="rows" returns the executeQueries response as is. "columnar",
+    "csv" and "arrow-ipc-base64" replace each result table's row objects
+    with an encoding that names every column once.
+    """
     try:
+        format = check_format(format)
         context = await _resolve_item(ctx, workspace, dataset, "SemanticModel")
-        payload = {
-            "queries": [{"query": query}],
-            "serializerSettings": {"includeNulls": True},
-        }
-        response = await context["fabric_client"]._make_request(
-            endpoint=f"https://api.powerbi.com/v1.0/myorg/groups/{context['workspace_id']}/datasets/{context['item_id']}/executeQueries",
-            params=payload,
-            method="post",
-            token_scope="https://analysis.windows.net/powerbi/api/.default",
+        response, cache, _ = await SemanticModelClient(context["fabric_client"]).execute_dax(
+            context["workspace_id"],
+            context["item_id"],
+            query,
+            use_cache=use_cache,
+            invalidate_cache=invalidate_cache,
         )
+        if isinstance(response, dict):
+            if format != "rows":
+                _encode_dax_tables(response, format)
+            if cache is not None:
+                response["cache"] = cache
         return response
     except Exception as exc:
         logger.error("Error executing DAX query: %s", exc)
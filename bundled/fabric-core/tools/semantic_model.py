@@ -6,9 +6,10 @@ from helpers.clients import (
     SemanticModelClient,
 )
 from helpers.logging_config import get_logger
+from helpers.utils.model_cache import ModelDefinition, describe_measure, model_definitions
+from helpers.utils.result_cache import dax_source, query_result_cache
 
-from typing import Optional, Dict, Any, List
-import json
+from typing import Optional, Dict, Any, List, Tuple
 
 logger = get_logger(__name__)
 
@@ -84,131 +85,108 @@ async def get_semantic_model(
         return f"Error retrieving semantic model: {str(e)}"
 
 
+async def _resolve_model(
+    ctx: Context,
+    workspace: Optional[str],
+    model: Optional[str],
+) -> Tuple[FabricApiClient, str, str, str]:
+    """Resolve (fabric client, workspace ID, model name, model ID) for the model tools."""
+    credential = get_azure_credentials(ctx.client_id, __ctx_cache)
+    fabric_client = FabricApiClient(credential)
+
+    ws = workspace or __ctx_cache.get(f"{ctx.client_id}_workspace")
+    if not ws:
+        raise ValueError("Workspace must be specified or set with set_workspace.")
+
+    workspace_name, workspace_id = await fabric_client.resolve_workspace_name_and_id(ws)
+
+    model_ref = model or __ctx_cache.get(f"{ctx.client_id}_semantic_model")
+    if not model_ref:
+        raise ValueError("Model must be specified or set.")
+
+    model_name, model_id = await fabric_client.resolve_item_name_and_id(
+        workspace=workspace_id, item=model_ref, type="SemanticModel"
+    )
+    return fabric_client, workspace_id, model_name, model_id
+
+
+async def _load_for_edit(
+    fabric_client: FabricApiClient,
+    workspace_id: str,
+    model_id: str,
+) -> ModelDefinition:
+    """A private copy of the current definition to edit, under the model's write lock.
+
+    The definition is reloaded first, so a write never starts from a stale
+    cached copy and overwrites changes made outside these tools.
+    """
+    definition = await model_definitions.get(fabric_client, workspace_id, model_id, refresh=True)
+    return definition.copy()
+
+
+async def _save_definition(
+    fabric_client: FabricApiClient,
+    workspace_id: str,
+    model_id: str,
+    definition: ModelDefinition,
+) -> None:
+    """Send an edited copy of the definition with updateDefinition and cache it.
+
+    A failed update drops the cached definition, since the service may or may
+    not have applied it.
+    """
+    try:
+        await fabric_client._make_request(
+            endpoint=f"workspaces/{workspace_id}/semanticModels/{model_id}/updateDefinition",
+            method="post",
+            params={"definition": {"parts": definition.to_parts()}},
+            lro=True,
+        )
+    except BaseException:
+        model_definitions.invalidate(workspace_id, model_id)
+        raise
+    definition.commit()
+    model_definitions.committed(workspace_id, model_id, definition)
+    # Measure changes alter query results
+    query_result_cache.invalidate(dax_source(workspace_id, model_id))
+
+
 @mcp.tool()
 async def get_model_schema(
     workspace: Optional[str] = None,
     model: Optional[str] = None,
+    refresh: bool = False,
     ctx: Context = None,
 ) -> Dict[str, Any]:
     """Get the complete schema of a semantic model including tables, columns, measures, and relationships.
 
     This retrieves the model definition in TMSL format and parses the structure.
+    Parsed definitions are cached per model and kept current by the measure tools.
 
     Args:
         workspace: Name or ID of the workspace (optional)
         model: Name or ID of the semantic model (optional)
+        refresh: Fetch the definition again instead of using the cached copy (default: False)
         ctx: Context object containing client information
 
     Returns:
         A dictionary containing the model schema with tables, columns, measures, and relationships.
     """
     try:
-        credential = get_azure_credentials(ctx.client_id, __ctx_cache)
-        fabric_client = FabricApiClient(credential)
-
-        # Resolve workspace and model
-        ws = workspace or __ctx_cache.get(f"{ctx.client_id}_workspace")
-        if not ws:
-            return {"error": "Workspace must be specified or set with set_workspace."}
-
-        workspace_name, workspace_id = await fabric_client.resolve_workspace_name_and_id(ws)
-
-        model_ref = model or __ctx_cache.get(f"{ctx.client_id}_semantic_model")
-        if not model_ref:
-            return {"error": "Model must be specified or set."}
-
-        model_name, model_id = await fabric_client.resolve_item_name_and_id(
-            workspace=workspace_id, item=model_ref, type="SemanticModel"
+        fabric_client, workspace_id, model_name, model_id = await _resolve_model(
+            ctx, workspace, model
         )
-
-        # Get model definition using Fabric API
-        definition_response = await fabric_client._make_request(
-            endpoint=f"workspaces/{workspace_id}/semanticModels/{model_id}/getDefinition",
-            method="post",
-            lro=True,
+        definition = await model_definitions.get(
+            fabric_client, workspace_id, model_id, refresh=refresh
         )
 
-        logger.info(f"Got model definition for {model_name}")
-
-        # Parse the definition to extract schema information
-        # The definition comes in TMSL format with model.bim file
-        schema = {
+        return {
             "modelName": model_name,
             "modelId": model_id,
             "workspaceId": workspace_id,
-            "tables": [],
-            "relationships": [],
-            "measures": [],
-            "definition": definition_response
+            **definition.schema(),
         }
 
-        # If we have the definition, parse it
-        if isinstance(definition_response, dict) and "definition" in definition_response:
-            def_parts = definition_response["definition"].get("parts", [])
-
-            for part in def_parts:
-                if part.get("path") == "model.bim":
-                    # This contains the TMSL model definition
-                    payload_content = part.get("payload")
-                    if payload_content:
-                        # Parse the model.bim JSON
-                        try:
-                            model_bim = json.loads(payload_content) if isinstance(payload_content, str) else payload_content
-                            model_def = model_bim.get("model", {})
-
-                            # Extract tables and columns
-                            tables_list = model_def.get("tables", [])
-                            for table in tables_list:
-                                table_info = {
-                                    "name": table.get("name"),
-                                    "isHidden": table.get("isHidden", False),
-                                    "columns": [],
-                                    "measures": []
-                                }
-
-                                # Extract columns
-                                for col in table.get("columns", []):
-                                    table_info["columns"].append({
-                                        "name": col.get("name"),
-                                        "dataType": col.get("dataType"),
-                                        "isHidden": col.get("isHidden", False),
-                                        "sourceColumn": col.get("sourceColumn")
-                                    })
-
-                                # Extract measures from this table
-                                for measure in table.get("measures", []):
-                                    measure_info = {
-                                        "name": measure.get("name"),
-                                        "expression": measure.get("expression"),
-                                        "formatString": measure.get("formatString"),
-                                        "isHidden": measure.get("isHidden", False),
-                                        "table": table.get("name")
-                                    }
-                                    table_info["measures"].append(measure_info)
-                                    schema["measures"].append(measure_info)
-
-                                schema["tables"].append(table_info)
-
-                            # Extract relationships
-                            relationships_list = model_def.get("relationships", [])
-                            for rel in relationships_list:
-                                schema["relationships"].append({
-                                    "name": rel.get("name"),
-                                    "fromTable": rel.get("fromTable"),
-                                    "fromColumn": rel.get("fromColumn"),
-                                    "toTable": rel.get("toTable"),
-                                    "toColumn": rel.get("toColumn"),
-                                    "crossFilteringBehavior": rel.get("crossFilteringBehavior")
-                                })
-
-                        except json.JSONDecodeError as e:
-                            logger.error(f"Failed to parse model.bim: {e}")
-
-        # Remove the full definition to keep response clean
-        schema.pop("definition", None)
-
-        return schema
-
     except Exception as exc:
         logger.error(f"Error getting model schema: {exc}")
         return {"error": str(exc)}
@@ -218,6 +196,7 @@ async def get_model_schema(
 async def list_measures(
     workspace: Optional[str] = None,
     model: Optional[str] = None,
+    refresh: bool = False,
     ctx: Context = None,
 ) -> List[Dict[str, Any]]:
     """List all DAX measures in a semantic model.
@@ -225,22 +204,27 @@ async def list_measures(
     Args:
         workspace: Name or ID of the workspace (optional)
         model: Name or ID of the semantic model (optional)
+        refresh: Fetch the definition again instead of using the cached copy (default: False)
         ctx: Context object containing client information
 
     Returns:
         A list of measures with their definitions.
     """
     try:
-        # Get the full schema
-        schema = await get_model_schema(workspace=workspace, model=model, ctx=ctx)
-
-        if "error" in schema:
-            return schema
+        fabric_client, workspace_id, model_name, model_id = await _resolve_model(
+            ctx, workspace, model
+        )
+        definition = await model_definitions.get(
+            fabric_client, workspace_id, model_id, refresh=refresh
+        )
 
-        measures = schema.get("measures", [])
+        measures = [
+            describe_measure(table_name, measure)
+            for table_name, measure in definition.measures.values()
+        ]
 
         return {
-            "modelName": schema.get("modelName"),
+            "modelName": model_name,
             "measureCount": len(measures),
             "measures": measures
         }
@@ -255,6 +239,7 @@ async def get_measure(
     measure_name: str,
     workspace: Optional[str] = None,
     model: Optional[str] = None,
+    refresh: bool = False,
     ctx: Context = None,
 ) -> Dict[str, Any]:
     """Get a specific DAX measure definition by name.
@@ -263,25 +248,26 @@ async def get_measure(
         measure_name: Name of the measure to retrieve
         workspace: Name or ID of the workspace (optional)
         model: Name or ID of the semantic model (optional)
+        refresh: Fetch the definition again instead of using the cached copy (default: False)
         ctx: Context object containing client information
 
     Returns:
         The measure definition including DAX expression.
     """
     try:
-        measures_result = await list_measures(workspace=workspace, model=model, ctx=ctx)
-
-        if "error" in measures_result:
-            return measures_result
-
-        measures = measures_result.get("measures", [])
+        fabric_client, workspace_id, model_name, model_id = await _resolve_model(
+            ctx, workspace, model
+        )
+        definition = await model_definitions.get(
+            fabric_client, workspace_id, model_id, refresh=refresh
+        )
 
-        for measure in measures:
-            if measure.get("name") == measure_name:
-                return {
-                    "found": True,
-                    "measure": measure
-                }
+        found = definition.find_measure(measure_name)
+        if found is not None:
+            return {
+                "found": True,
+                "measure": describe_measure(*found)
+            }
 
         return {
             "found": False,
@@ -322,104 +308,35 @@ async def create_measure(
         A dictionary containing success status and the created measure details.
     """
     try:
-        credential = get_azure_credentials(ctx.client_id, __ctx_cache)
-        fabric_client = FabricApiClient(credential)
-
-        # Resolve workspace and model
-        ws = workspace or __ctx_cache.get(f"{ctx.client_id}_workspace")
-        if not ws:
-            return {"error": "Workspace must be specified or set with set_workspace."}
-
-        workspace_name, workspace_id = await fabric_client.resolve_workspace_name_and_id(ws)
-
-        model_ref = model or __ctx_cache.get(f"{ctx.client_id}_semantic_model")
-        if not model_ref:
-            return {"error": "Model must be specified or set."}
-
-        model_name, model_id = await fabric_client.resolve_item_name_and_id(
-            workspace=workspace_id, item=model_ref, type="SemanticModel"
-        )
-
-        # Get current model definition
-        definition_response = await fabric_client._make_request(
-            endpoint=f"workspaces/{workspace_id}/semanticModels/{model_id}/getDefinition",
-            method="post",
-            lro=True,
+        fabric_client, workspace_id, model_name, model_id = await _resolve_model(
+            ctx, workspace, model
         )
 
-        if not isinstance(definition_response, dict) or "definition" not in definition_response:
-            return {"error": "Failed to retrieve model definition"}
-
-        # Parse and modify the model.bim
-        def_parts = definition_response["definition"].get("parts", [])
-        model_bim_part = None
-        model_bim_index = -1
-
-        for i, part in enumerate(def_parts):
-            if part.get("path") == "model.bim":
-                model_bim_part = part
-                model_bim_index = i
-                break
-
-        if not model_bim_part:
-            return {"error": "model.bim not found in definition"}
-
-        # Parse the model.bim JSON
-        payload_content = model_bim_part.get("payload")
-        model_bim = json.loads(payload_content) if isinstance(payload_content, str) else payload_content
-        model_def = model_bim.get("model", {})
-        tables_list = model_def.get("tables", [])
-
-        # Find the target table
-        target_table = None
-        for table in tables_list:
-            if table.get("name") == table_name:
-                target_table = table
-                break
-
-        if not target_table:
-            return {"error": f"Table '{table_name}' not found in model"}
-
-        # Check if measure already exists
-        existing_measures = target_table.get("measures", [])
-        for measure in existing_measures:
-            if measure.get("name") == measure_name:
-                return {"error": f"Measure '{measure_name}' already exists in table '{table_name}'"}
-
-        # Create new measure object
-        new_measure = {
-            "name": measure_name,
-            "expression": dax_expression,
-            "isHidden": is_hidden
-        }
+        async with model_definitions.write_lock(workspace_id, model_id):
+            definition = await _load_for_edit(fabric_client, workspace_id, model_id)
 
-        if format_string:
-            new_measure["formatString"] = format_string
-        if description:
-            new_measure["description"] = description
+            if table_name not in definition.tables:
+                return {"error": f"Table '{table_name}' not found in model"}
 
-        # Add measure to table
-        if "measures" not in target_table:
-            target_table["measures"] = []
-        target_table["measures"].append(new_measure)
+            # Check if measure already exists
+            existing = definition.find_measure(measure_name)
+            if existing is not None:
+                return {"error": f"Measure '{measure_name}' already exists in table '{existing[0]}'"}
 
-        # Update the model.bim in the definition
-        updated_payload = json.dumps(model_bim)
-        def_parts[model_bim_index]["payload"] = updated_payload
-
-        # Call updateDefinition API
-        update_request = {
-            "definition": {
-                "parts": def_parts
+            # Create new measure object
+            new_measure = {
+                "name": measure_name,
+                "expression": dax_expression,
+                "isHidden": is_hidden
             }
-        }
 
-        update_response = await fabric_client._make_request(
-            endpoint=f"workspaces/{workspace_id}/semanticModels/{model_id}/updateDefinition",
-            method="post",
-            params=update_request,
-            lro=True,
-        )
+            if format_string:
+                new_measure["formatString"] = format_string
+            if description:
+                new_measure["description"] = description
+
+            definition.add_measure(table_name, new_measure)
+            await _save_definition(fabric_client, workspace_id, model_id, definition)
 
         logger.info(f"Created measure '{measure_name}' in table '{table_name}' of model '{model_name}'")
 
@@ -465,100 +382,33 @@ async def update_measure(
         A dictionary containing success status and the updated measure details.
     """
     try:
-        credential = get_azure_credentials(ctx.client_id, __ctx_cache)
-        fabric_client = FabricApiClient(credential)
-
-        # Resolve workspace and model
-        ws = workspace or __ctx_cache.get(f"{ctx.client_id}_workspace")
-        if not ws:
-            return {"error": "Workspace must be specified or set with set_workspace."}
-
-        workspace_name, workspace_id = await fabric_client.resolve_workspace_name_and_id(ws)
-
-        model_ref = model or __ctx_cache.get(f"{ctx.client_id}_semantic_model")
-        if not model_ref:
-            return {"error": "Model must be specified or set."}
-
-        model_name, model_id = await fabric_client.resolve_item_name_and_id(
-            workspace=workspace_id, item=model_ref, type="SemanticModel"
+        fabric_client, workspace_id, model_name, model_id = await _resolve_model(
+            ctx, workspace, model
         )
 
-        # Get current model definition
-        definition_response = await fabric_client._make_request(
-            endpoint=f"workspaces/{workspace_id}/semanticModels/{model_id}/getDefinition",
-            method="post",
-            lro=True,
-        )
-
-        if not isinstance(definition_response, dict) or "definition" not in definition_response:
-            return {"error": "Failed to retrieve model definition"}
-
-        # Parse and modify the model.bim
-        def_parts = definition_response["definition"].get("parts", [])
-        model_bim_part = None
-        model_bim_index = -1
-
-        for i, part in enumerate(def_parts):
-            if part.get("path") == "model.bim":
-                model_bim_part = part
-                model_bim_index = i
-                break
-
-        if not model_bim_part:
-            return {"error": "model.bim not found in definition"}
-
-        # Parse the model.bim JSON
-        payload_content = model_bim_part.get("payload")
-        model_bim = json.loads(payload_content) if isinstance(payload_content, str) else payload_content
-        model_def = model_bim.get("model", {})
-        tables_list = model_def.get("tables", [])
-
-        # Find the measure
-        measure_found = False
-        target_table_name = None
-        for table in tables_list:
-            measures = table.get("measures", [])
-            for measure in measures:
-                if measure.get("name") == measure_name:
-                    measure_found = True
-                    target_table_name = table.get("name")
-
-                    # Update measure properties
-                    if dax_expression is not None:
-                        measure["expression"] = dax_expression
-                    if format_string is not None:
-                        measure["formatString"] = format_string
-                    if description is not None:
-                        measure["description"] = description
-                    if is_hidden is not None:
-                        measure["isHidden"] = is_hidden
-                    if new_name is not None:
-                        measure["name"] = new_name
-
-                    break
-            if measure_found:
-                break
-
-        if not measure_found:
-            return {"error": f"Measure '{measure_name}' not found in model"}
-
-        # Update the model.bim in the definition
-        updated_payload = json.dumps(model_bim)
-        def_parts[model_bim_index]["payload"] = updated_payload
-
-        # Call updateDefinition API
-        update_request = {
-            "definition": {
-                "parts": def_parts
-            }
-        }
-
-        update_response = await fabric_client._make_request(
-            endpoint=f"workspaces/{workspace_id}/semanticModels/{model_id}/updateDefinition",
-            method="post",
-            params=update_request,
-            lro=True,
-        )
+        async with model_definitions.write_lock(workspace_id, model_id):
+            definition = await _load_for_edit(fabric_client, workspace_id, model_id)
+
+            found = definition.find_measure(measure_name)
+            if found is None:
+                return {"error": f"Measure '{measure_name}' not found in model"}
+            if new_name is not None and new_name != measure_name and definition.find_measure(new_name):
+                return {"error": f"Measure '{new_name}' already exists in model"}
+            target_table_name, measure = found
+
+            # Update measure properties
+            if dax_expression is not None:
+                measure["expression"] = dax_expression
+            if format_string is not None:
+                measure["formatString"] = format_string
+            if description is not None:
+                measure["description"] = description
+            if is_hidden is not None:
+                measure["isHidden"] = is_hidden
+            if new_name is not None:
+                definition.rename_measure(measure_name, new_name)
+
+            await _save_definition(fabric_client, workspace_id, model_id, definition)
 
         logger.info(f"Updated measure '{measure_name}' in model '{model_name}'")
 
@@ -593,101 +443,196 @@ async def delete_measure(
         A dictionary containing success status and deletion details.
     """
     try:
-        credential = get_azure_credentials(ctx.client_id, __ctx_cache)
-        fabric_client = FabricApiClient(credential)
+        fabric_client, workspace_id, model_name, model_id = await _resolve_model(
+            ctx, workspace, model
+        )
 
-        # Resolve workspace and model
-        ws = workspace or __ctx_cache.get(f"{ctx.client_id}_workspace")
-        if not ws:
-            return {"error": "Workspace must be specified or set with set_workspace."}
+        async with model_definitions.write_lock(workspace_id, model_id):
+            definition = await _load_for_edit(fabric_client, workspace_id, model_id)
 
-        workspace_name, workspace_id = await fabric_client.resolve_workspace_name_and_id(ws)
+            if definition.find_measure(measure_name) is None:
+                return {"error": f"Measure '{measure_name}' not found in model"}
+            target_table_name, _ = definition.remove_measure(measure_name)
 
-        model_ref = model or __ctx_cache.get(f"{ctx.client_id}_semantic_model")
-        if not model_ref:
-            return {"error": "Model must be specified or set."}
+            await _save_definition(fabric_client, workspace_id, model_id, definition)
 
-        model_name, model_id = await fabric_client.resolve_item_name_and_id(
-            workspace=workspace_id, item=model_ref, type="SemanticModel"
-        )
+        logger.info(f"Deleted measure '{measure_name}' from model '{model_name}'")
 
-        # Get current model definition
-        definition_response = await fabric_client._make_request(
-            endpoint=f"workspaces/{workspace_id}/semanticModels/{model_id}/getDefinition",
-            method="post",
-            lro=True,
-        )
+        return {
+            "success": True,
+            "message": f"Measure '{measure_name}' deleted successfully",
+            "table": target_table_name,
+            "model": model_name
+        }
 
-        if not isinstance(definition_response, dict) or "definition" not in definition_response:
-            return {"error": "Failed to retrieve model definition"}
-
-        # Parse and modify the model.bim
-        def_parts = definition_response["definition"].get("parts", [])
-        model_bim_part = None
-        model_bim_index = -1
-
-        for i, part in enumerate(def_parts):
-            if part.get("path") == "model.bim":
-                model_bim_part = part
-                model_bim_index = i
-                break
-
-        if not model_bim_part:
-            return {"error": "model.bim not found in definition"}
-
-        # Parse the model.bim JSON
-        payload_content = model_bim_part.get("payload")
-        model_bim = json.loads(payload_content) if isinstance(payload_content, str) else payload_content
-        model_def = model_bim.get("model", {})
-        tables_list = model_def.get("tables", [])
-
-        # Find and delete the measure
-        measure_found = False
-        target_table_name = None
-        for table in tables_list:
-            measures = table.get("measures", [])
-            for i, measure in enumerate(measures):
-                if measure.get("name") == measure_name:
-                    measure_found = True
-                    target_table_name = table.get("name")
-                    # Remove the measure from the list
-                    measures.pop(i)
-                    break
-            if measure_found:
-                break
-
-        if not measure_found:
-            return {"error": f"Measure '{measure_name}' not found in model"}
-
-        # Update the model.bim in the definition
-        updated_payload = json.dumps(model_bim)
-        def_parts[model_bim_index]["payload"] = updated_payload
-
-        # Call updateDefinition API
-        update_request = {
-            "definition": {
-                "parts": def_parts
+    except Exception as exc:
+        logger.error(f"Error deleting measure: {exc}")
+        return {"error": str(exc)}
+
+
+_MEASURE_ACTIONS = ("create", "update", "delete")
+
+
+def _check_measure_changes(
+    definition: ModelDefinition, changes: List[Dict[str, Any]]
+) -> List[Dict[str, Any]]:
+    """Validate a batch of measure changes in order, without touching the definition.
+
+    Each change is checked against the model as the earlier changes leave it,
+    so a batch may e.g. rename a measure and then create one with the old name.
+    """
+    names = set(definition.measures)
+    results = []
+    for index, change in enumerate(changes):
+        action = str(change.get("action", "")).lower()
+        name = change.get("measure_name")
+        result: Dict[str, Any] = {"index": index, "action": action, "measure": name}
+        error = None
+        if action not in _MEASURE_ACTIONS:
+            error = f"action must be one of {', '.join(_MEASURE_ACTIONS)}"
+        elif not name:
+            error = "measure_name is required"
+        elif action == "create":
+            table_name = change.get("table_name")
+            columns = {
+                column.get("name")
+                for column in definition.tables.get(table_name, {}).get("columns", [])
             }
+            if not change.get("dax_expression"):
+                error = "dax_expression is required"
+            elif table_name not in definition.tables:
+                error = f"Table '{table_name}' not found in model"
+            elif name in names:
+                error = f"Measure '{name}' already exists in model"
+            elif name in columns:
+                error = f"Table '{table_name}' already has a column named '{name}'"
+            else:
+                names.add(name)
+                result["table"] = table_name
+        elif name not in names:
+            error = f"Measure '{name}' not found in model"
+        elif action == "update":
+            new_name = change.get("new_name")
+            if new_name and new_name != name and new_name in names:
+                error = f"Measure '{new_name}' already exists in model"
+            elif new_name:
+                names.discard(name)
+                names.add(new_name)
+        else:
+            names.discard(name)
+
+        if error:
+            result.update({"status": "error", "error": error})
+        else:
+            result["status"] = "ok"
+        results.append(result)
+    return results
+
+
+def _apply_measure_change(definition: ModelDefinition, change: Dict[str, Any]) -> str:
+    """Apply one validated change and return the table it touched."""
+    action = change["action"].lower()
+    name = change["measure_name"]
+    if action == "create":
+        measure = {
+            "name": name,
+            "expression": change["dax_expression"],
+            "isHidden": bool(change.get("is_hidden", False)),
         }
+        if change.get("format_string"):
+            measure["formatString"] = change["format_string"]
+        if change.get("description"):
+            measure["description"] = change["description"]
+        definition.add_measure(change["table_name"], measure)
+        return change["table_name"]
+    if action == "delete":
+        return definition.remove_measure(name)[0]
+
+    table_name, measure = definition.find_measure(name)
+    for key, field in (
+        ("dax_expression", "expression"),
+        ("format_string", "formatString"),
+        ("description", "description"),
+        ("is_hidden", "isHidden"),
+    ):
+        if change.get(key) is not None:
+            measure[field] = change[key]
+    if change.get("new_name") and change["new_name"] != name:
+        definition.rename_measure(name, change["new_name"])
+    return table_name
 
-        update_response = await fabric_client._make_request(
-            endpoint=f"workspaces/{workspace_id}/semanticModels/{model_id}/updateDefinition",
-            method="post",
-            params=update_request,
-            lro=True,
+
+@mcp.tool()
+async def apply_measure_changes(
+    changes: List[Dict[str, Any]],
+    workspace: Optional[str] = None,
+    model: Optional[str] = None,
+    dry_run: bool = False,
+    ctx: Context = None,
+) -> Dict[str, Any]:
+    """Create, update and delete several DAX measures with one updateDefinition call.
+
+    All changes are validated first, in order, against the model as the
+    earlier changes leave it. If any change is invalid nothing is written;
+    otherwise they are applied to the model definition together and saved
+    in a single update.
+
+    Args:
+        changes: List of changes, each a dict with "action" ("create", "update"
+            or "delete") and "measure_name", plus the fields of the matching
+            single-measure tool: "table_name" and "dax_expression" (create),
+            "dax_expression", "format_string", "description", "is_hidden",
+            "new_name" (update; create takes the first four too).
+        workspace: Name or ID of the workspace (optional)
+        model: Name or ID of the semantic model (optional)
+        dry_run: Only validate the changes (default: False)
+        ctx: Context object containing client information
+
+    Returns:
+        A dictionary with overall success and a result per change.
+    """
+    try:
+        if not changes:
+            return {"error": "No changes given."}
+
+        fabric_client, workspace_id, model_name, model_id = await _resolve_model(
+            ctx, workspace, model
         )
 
-        logger.info(f"Deleted measure '{measure_name}' from model '{model_name}'")
+        async with model_definitions.write_lock(workspace_id, model_id):
+            definition = await _load_for_edit(fabric_client, workspace_id, model_id)
+
+            results = _check_measure_changes(definition, changes)
+            failed = [result for result in results if result["status"] == "error"]
+            if failed or dry_run:
+                return {
+                    "success": not failed,
+                    "applied": 0,
+                    "message": (
+                        f"{len(failed)} of {len(changes)} changes are invalid; nothing was written"
+                        if failed
+                        else f"All {len(changes)} changes are valid (dry run)"
+                    ),
+                    "model": model_name,
+                    "results": results,
+                }
+
+            for change, result in zip(changes, results):
+                result["table"] = _apply_measure_change(definition, change)
+            await _save_definition(fabric_client, workspace_id, model_id, definition)
+
+        logger.info(f"Applied {len(changes)} measure changes to model '{model_name}'")
 
         return {
             "success": True,
-            "message": f"Measure '{measure_name}' deleted successfully",
-            "table": target_table_name,
-            "model": model_name
+            "applied": len(changes),
+            "message": f"Applied {len(changes)} measure changes in one update",
+            "model": model_name,
+            "results": results,
         }
 
     except Exception as exc:
-        logger.error(f"Error deleting measure: {exc}")
+        logger.error(f"Error applying measure changes: {exc}")
         return {"error": str(exc)}
 
 
@@ -697,6 +642,8 @@ async def analyze_dax_query(
     workspace: Optional[str] = None,
     model: Optional[str] = None,
     include_execution_plan: bool = True,
+    use_cache: bool = False,
+    invalidate_cache: bool = False,
     ctx: Context = None,
 ) -> Dict[str, Any]:
     """Analyze a DAX query for performance insights and execution plan.
@@ -709,6 +656,8 @@ async def analyze_dax_query(
         workspace: Name or ID of the workspace (optional)
         model: Name or ID of the semantic model (optional)
         include_execution_plan: Whether to include detailed execution plan (default: True)
+        use_cache: Reuse a cached result of the same query on this model (default: False)
+        invalidate_cache: Drop the model's cached query results before running (default: False)
         ctx: Context object containing client information
 
     Returns:
@@ -735,27 +684,14 @@ async def analyze_dax_query(
 
         # Execute DAX query with performance analysis
         # Using the Power BI executeQueries endpoint
-        query_request = {
-            "queries": [
-                {
-                    "query": dax_query
-                }
-            ],
-            "serializerSettings": {"includeNulls": True},
-        }
-
-        import time
-        start_time = time.time()
-
-        query_response = await fabric_client._make_request(
-            endpoint=f"https://api.powerbi.com/v1.0/myorg/groups/{workspace_id}/datasets/{model_id}/executeQueries",
-            method="post",
-            params=query_request,
-            token_scope="https://analysis.windows.net/powerbi/api/.default",
+        query_response, cache, execution_time = await SemanticModelClient(fabric_client).execute_dax(
+            workspace_id,
+            model_id,
+            dax_query,
+            use_cache=use_cache,
+            invalidate_cache=invalidate_cache,
         )
 
-        execution_time = time.time() - start_time
-
         # Parse the response
         result = {
             "modelName": model_name,
@@ -764,6 +700,9 @@ async def analyze_dax_query(
             "executionTimeSeconds": round(execution_time, 3),
             "query": dax_query
         }
+        if cache is not None:
+            # On a hit, executionTimeSeconds is the timing of the cached run
+            result["cache"] = cache
 
         if isinstance(query_response, dict):
             # Extract results from response
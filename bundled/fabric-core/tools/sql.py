@@ -1,19 +1,28 @@
 import asyncio
-import io
+import time
+from itertools import chain
 from typing import Any, Dict, Optional, Tuple
 
+import polars as pl
+import pyarrow as pa
+import pyarrow.parquet as pq
 from mcp.server.fastmcp import Context
 
 from helpers.clients.fabric_client import FabricApiClient
 from helpers.clients.onelake_client import OneLakeClient
-from helpers.clients.sql_client import SQLClient, get_sql_endpoint
+from helpers.clients.sql_client import SQLClient, get_sql_endpoint, push_down_row_limit
 from helpers.utils.authentication import get_azure_credentials
 from helpers.utils.context import mcp, __ctx_cache
+from helpers.utils.result_cache import is_read_only_sql, query_result_cache, sql_source
+from helpers.utils.tabular import check_format, encode_frame
 from helpers.logging_config import get_logger
 
 
 logger = get_logger(__name__)
 
+# Rows per Parquet row group / CSV chunk when streaming an export
+_EXPORT_BATCH_ROWS = 100_000
+
 
 async def _resolve_sql_client(
     ctx: Context,
@@ -87,10 +96,19 @@ async def _resolve_lakehouse_ids(
     return name, str(lakehouse_id)
 
 
-def _prepare_rows(df, max_rows: int) -> Tuple[int, int, Any]:
-    total_rows = df.height
-    limited_df = df if max_rows <= 0 else df.head(max_rows)
-    return total_rows, limited_df.height, limited_df.to_dicts()
+def _read_limited(client: SQLClient, query: str, max_rows: int) -> pl.DataFrame:
+    """Fetch at most ``max_rows + 1`` rows so truncation can be reported."""
+    if max_rows <= 0:
+        batches = list(client.iter_batches(query))
+    else:
+        batches = list(
+            client.iter_batches(
+                push_down_row_limit(query, max_rows + 1), max_rows=max_rows + 1
+            )
+        )
+    if not batches:
+        return pl.DataFrame()
+    return pl.from_arrow(pa.Table.from_batches(batches))
 
 
 @mcp.tool()
@@ -101,31 +119,77 @@ async def sql_query(
     warehouse: Optional[str] = None,
     type: Optional[str] = None,
     max_rows: int = 100,
+    use_cache: bool = False,
+    invalidate_cache: bool = False,
+    format: str = "rows",
     ctx: Context = None,
 ) -> Dict[str, Any]:
-    """Run a SQL query against a lakehouse or warehouse endpoint."""
+    """Run a SQL query against a lakehouse or warehouse endpoint.
+
+    Only the rows that are returned are fetched: a plain SELECT gets a TOP
+    limit pushed down, and reading stops after max_rows rows otherwise
+    (max_rows <= 0 returns everything). rowCount is None when the result
+    was truncated, since the full size is never computed.
+
+    With use_cache=True, read-only queries are answered from a short-lived
+    result cache keyed by endpoint, normalized query text and max_rows; the
+    response then carries "cache" metadata (hit, ageSeconds). Cached results
+    of an endpoint are dropped when a statement is executed against it, or
+    explicitly with invalidate_cache=True.
+
+    format="rows" returns one object per row. For large or wide results,
+    "columnar" (column names once plus one value list per column), "csv" or
+    "arrow-ipc-base64" (a typed Arrow IPC stream) are much smaller to
+    serialize and transfer.
+    """
 
     try:
+        format = check_format(format)
         client, endpoint, resolved_type, workspace_id, credential = await _resolve_sql_client(
             ctx, workspace, lakehouse, warehouse, type
         )
-        df = await asyncio.to_thread(client.run_query, query)
+        source = sql_source(endpoint["server"], endpoint["database"])
+        if invalidate_cache:
+            query_result_cache.invalidate(source)
+        cacheable = use_cache and is_read_only_sql(query)
+        if cacheable:
+            cached = query_result_cache.get(source, query, max_rows, encoding=format)
+            if cached is not None:
+                result, result["cache"] = cached
+                return result
+
+        started = time.perf_counter()
+        df = await asyncio.to_thread(_read_limited, client, query, max_rows)
 
         if df.is_empty():
-            return {
+            result = {
                 "message": "Query executed successfully but returned no rows.",
                 "resource": endpoint,
             }
+        else:
+            truncated = max_rows > 0 and df.height > max_rows
+            limited_df = df.head(max_rows) if truncated else df
+            result = {
+                "resource": endpoint,
+                "rowCount": None if truncated else df.height,
+                "returnedRows": limited_df.height,
+                **encode_frame(limited_df, format),
+                "truncated": truncated,
+            }
 
-        total_rows, returned_rows, rows = _prepare_rows(df, max_rows)
-
-        return {
-            "resource": endpoint,
-            "rowCount": total_rows,
-            "returnedRows": returned_rows,
-            "rows": rows,
-            "truncated": total_rows > returned_rows,
-        }
+        if cacheable:
+            result["cache"] = query_result_cache.put(
+                source,
+                query,
+                max_rows,
+                result,
+                seconds=time.perf_counter() - started,
+                encoding=format,
+            )
+        elif not is_read_only_sql(query):
+            # The statement may have written to the endpoint
+            query_result_cache.invalidate(source)
+        return result
     except Exception as exc:
         logger.error("SQL query failed: %s", exc)
         return {"error": str(exc)}
@@ -150,9 +214,12 @@ async def sql_explain(
         def _get_plan():
             with client.engine.connect() as conn:
                 conn.exec_driver_sql("SET SHOWPLAN_XML ON")
-                result = conn.exec_driver_sql(query)
-                rows = result.fetchall()
-                conn.exec_driver_sql("SET SHOWPLAN_XML OFF")
+                try:
+                    result = conn.exec_driver_sql(query)
+                    rows = result.fetchall()
+                finally:
+                    # The connection goes back to a shared pool; never leave showplan on
+                    conn.exec_driver_sql("SET SHOWPLAN_XML OFF")
                 if rows:
                     return str(rows[0][0])
                 return None
@@ -181,27 +248,22 @@ async def sql_export(
     overwrite: bool = True,
     ctx: Context = None,
 ) -> Dict[str, Any]:
-    """Export query results to OneLake as CSV or Parquet."""
+    """Export query results to OneLake as CSV or Parquet.
+
+    Rows are streamed from the endpoint in batches and written as Parquet row
+    groups (or CSV chunks) straight into an append/flush upload, so memory use
+    stays flat regardless of the number of rows.
+    """
 
     try:
+        fmt = file_format.lower()
+        if fmt not in ("csv", "parquet"):
+            raise ValueError("file_format must be either 'csv' or 'parquet'.")
+        encoding = "utf-8" if fmt == "csv" else "binary"
+
         client, endpoint, resolved_type, workspace_id, credential = await _resolve_sql_client(
             ctx, workspace, lakehouse, warehouse, type
         )
-        df = await asyncio.to_thread(client.run_query, query)
-
-        if df.is_empty():
-            return {"message": "Query produced no rows; nothing exported."}
-
-        buffer = io.BytesIO()
-        fmt = file_format.lower()
-        if fmt == "csv":
-            df.write_csv(buffer)
-            encoding = "utf-8"
-        elif fmt == "parquet":
-            df.write_parquet(buffer)
-            encoding = "binary"
-        else:
-            raise ValueError("file_format must be either 'csv' or 'parquet'.")
 
         if resolved_type == "lakehouse":
             export_resource = lakehouse or __ctx_cache.get(f"{ctx.client_id}_lakehouse")
@@ -217,14 +279,42 @@ async def sql_export(
         _, export_lakehouse_id = await _resolve_lakehouse_ids(
             credential, endpoint["workspaceId"], export_resource
         )
-
         onelake_client = OneLakeClient(credential)
-        await onelake_client.write_file(
-            endpoint["workspaceId"], export_lakehouse_id, target_path, buffer.getvalue(), overwrite
-        )
+
+        def _export() -> Tuple[int, int]:
+            batches = client.iter_batches(query, batch_size=_EXPORT_BATCH_ROWS)
+            first = next(batches, None)
+            if first is None:
+                return 0, 0
+
+            stream = onelake_client.open_upload_stream(
+                endpoint["workspaceId"], export_lakehouse_id, target_path, overwrite
+            )
+            rows = 0
+            try:
+                if fmt == "parquet":
+                    with pq.ParquetWriter(stream, first.schema) as writer:
+                        for batch in chain([first], batches):
+                            writer.write_batch(batch)
+                            rows += batch.num_rows
+                else:
+                    for index, batch in enumerate(chain([first], batches)):
+                        pl.from_arrow(batch).write_csv(stream, include_header=index == 0)
+                        rows += batch.num_rows
+                stream.close()
+            except Exception:
+                stream.abort()
+                raise
+            return rows, stream.bytes_written
+
+        rows_exported, bytes_written = await asyncio.to_thread(_export)
+
+        if rows_exported == 0:
+            return {"message": "Query produced no rows; nothing exported."}
 
         return {
-            "rowsExported": df.height,
+            "rowsExported": rows_exported,
+            "bytesWritten": bytes_written,
             "format": fmt,
             "targetPath": target_path,
             "lakehouseId": export_lakehouse_id,
@@ -234,5 +324,3 @@ async def sql_export(
     except Exception as exc:
         logger.error("SQL export failed: %s", exc)
         return {"error": str(exc)}
-
-
@@ -1,23 +1,36 @@
 import asyncio
+import json
+import time
 from typing import Any, Dict, List, Optional
 
 from deltalake import DeltaTable
 
 from helpers.utils.context import mcp, __ctx_cache
 from mcp.server.fastmcp import Context
-from helpers.utils.authentication import get_azure_credentials
+from helpers.utils.authentication import get_azure_credentials, get_cached_token_async
 from helpers.clients import (
     FabricApiClient,
+    OneLakeClient,
     TableClient,
     SQLClient,
     get_sql_endpoint,
 )
+from helpers.utils.delta_cache import get_delta_cache, latest_delta_version
+from helpers.utils.table_tools import extract_delta_schemas
+from helpers.utils.tabular import check_format, encode_frame
 from helpers.logging_config import get_logger
 
 
 logger = get_logger(__name__)
 
 
+def _remember_version(table_path: str, dt: DeltaTable) -> None:
+    """Record the schema of the table version a tool just loaded or produced."""
+    cache = get_delta_cache()
+    cache.put(table_path, dt.version(), dt.schema(), dt.metadata())
+    cache.flush()
+
+
 async def _resolve_workspace_lakehouse(
     ctx: Context,
     workspace: Optional[str],
@@ -80,6 +93,12 @@ async def _resolve_lakehouse_and_table(
     if isinstance(tables, str):
         raise ValueError(tables)
 
+    context.update(_find_table(tables, table_ref, context["lakehouse_name"]))
+    context["table_client"] = table_client
+    return context
+
+
+def _find_table(tables: List[Dict[str, Any]], table_ref: str, lakehouse_name: str) -> Dict[str, Any]:
     target = next(
         (
             t
@@ -91,7 +110,7 @@ async def _resolve_lakehouse_and_table(
 
     if not target:
         raise ValueError(
-            f"Table '{table_ref}' not found in lakehouse '{context['lakehouse_name']}'."
+            f"Table '{table_ref}' not found in lakehouse '{lakehouse_name}'."
         )
 
     schema_name = (
@@ -102,16 +121,26 @@ async def _resolve_lakehouse_and_table(
     )
     identifier = f"[{schema_name}].[{target.get('name')}]"
 
-    context.update(
-        {
-            "table": target,
-            "table_name": target.get("name"),
-            "schema": schema_name,
-            "identifier": identifier,
-            "table_client": table_client,
-        }
-    )
-    return context
+    return {
+        "table": target,
+        "table_name": target.get("name"),
+        "schema": schema_name,
+        "identifier": identifier,
+    }
+
+
+def _preview_query(identifier: str, limit: int) -> str:
+    limit_clause = f"TOP {max(limit, 1)} " if limit and limit > 0 else ""
+    return f"SELECT {limit_clause}* FROM {identifier}"
+
+
+def _preview_rows(df, limit: int, format: str = "rows") -> Dict[str, Any]:
+    return {
+        "columns": list(df.columns),
+        **encode_frame(df, format),
+        "returnedRows": df.height,
+        "truncated": bool(limit and df.height >= max(limit, 1)),
+    }
 
 
 @mcp.tool()
@@ -162,8 +191,22 @@ async def get_lakehouse_table_schema(
 async def get_all_lakehouse_schemas(
     lakehouse: Optional[str],
     workspace: Optional[str] = None,
+    max_concurrency: int = 8,
+    table_timeout: float = 60.0,
+    metadata_only: bool = False,
     ctx: Context = None,
 ) -> Any:
+    """Get schemas for all Delta tables in a lakehouse.
+
+    Args:
+        lakehouse: Name or ID of the lakehouse.
+        workspace: Name or ID of the workspace (optional).
+        max_concurrency: Number of tables read in parallel.
+        table_timeout: Seconds allowed per table; slower tables are reported as skipped.
+        metadata_only: Read only the _delta_log (checkpoint + later commits)
+            instead of loading each table's full state.
+        ctx: Context object containing client information.
+    """
     try:
         context = await _resolve_workspace_lakehouse(ctx, workspace, lakehouse)
         table_client = TableClient(context["fabric_client"])
@@ -172,6 +215,9 @@ async def get_all_lakehouse_schemas(
             context["lakehouse_id"],
             "lakehouse",
             context["credential"],
+            max_concurrency=max_concurrency,
+            table_timeout=table_timeout,
+            metadata_only=metadata_only,
         )
     except Exception as exc:
         logger.error("Error retrieving table schemas: %s", exc)
@@ -184,9 +230,17 @@ async def table_preview(
     lakehouse: Optional[str] = None,
     workspace: Optional[str] = None,
     limit: int = 50,
+    format: str = "rows",
     ctx: Context = None,
 ) -> Dict[str, Any]:
+    """Preview the first rows of a lakehouse table.
+
+    format selects the row encoding: "rows" (one object per row), or the
+    compact "columnar", "csv" and "arrow-ipc-base64" encodings that name each
+    column once.
+    """
     try:
+        format = check_format(format)
         context = await _resolve_lakehouse_and_table(ctx, workspace, lakehouse, table)
 
         _, endpoint = await get_sql_endpoint(
@@ -201,26 +255,124 @@ async def table_preview(
         client = SQLClient(
             endpoint["server"], endpoint["database"], context["credential"]
         )
-        limit_clause = f"TOP {max(limit, 1)} " if limit and limit > 0 else ""
-        query = f"SELECT {limit_clause}* FROM {context['identifier']}"
+        query = _preview_query(context["identifier"], limit)
         df = await asyncio.to_thread(client.run_query, query)
 
-        columns = list(df.columns)
-        rows = [dict(zip(columns, row)) for row in df.rows()]
-
         return {
             "table": context["table_name"],
             "schema": context["schema"],
-            "columns": columns,
-            "rows": rows,
-            "returnedRows": len(rows),
-            "truncated": bool(limit and len(rows) >= max(limit, 1)),
+            **_preview_rows(df, limit, format),
         }
     except Exception as exc:
         logger.error("Error generating table preview: %s", exc)
         return {"error": str(exc)}
 
 
+@mcp.tool()
+async def table_preview_batch(
+    tables: List[str],
+    lakehouse: Optional[str] = None,
+    workspace: Optional[str] = None,
+    limit: int = 20,
+    include_schema: bool = False,
+    max_concurrency: int = 4,
+    format: str = "rows",
+    ctx: Context = None,
+) -> Dict[str, Any]:
+    """Preview several lakehouse tables in one call.
+
+    The workspace, lakehouse, table list and SQL endpoint are resolved once and
+    the previews run concurrently on the endpoint's pooled connections. A table
+    that fails reports its own error without failing the batch.
+
+    Args:
+        tables: Names of the tables to preview.
+        lakehouse: Name or ID of the lakehouse (optional, uses active).
+        workspace: Name or ID of the workspace (optional, uses active).
+        limit: Maximum rows returned per table.
+        include_schema: Also return each table's Delta schema (read from the _delta_log).
+        max_concurrency: Number of previews run at the same time.
+        format: Row encoding: "rows", "columnar", "csv" or "arrow-ipc-base64".
+        ctx: Context object containing client information.
+    Returns:
+        Per-table columns, rows and timings, plus the one-off setup time.
+    """
+    try:
+        started = time.perf_counter()
+        format = check_format(format)
+        context = await _resolve_workspace_lakehouse(ctx, workspace, lakehouse)
+        table_client = TableClient(context["fabric_client"])
+        table_list = await table_client.list_tables(
+            context["workspace_id"], context["lakehouse_id"], "lakehouse"
+        )
+        if isinstance(table_list, str):
+            raise ValueError(table_list)
+
+        _, endpoint = await get_sql_endpoint(
+            workspace=context["workspace_ref"],
+            lakehouse=context["lakehouse_name"],
+            type="lakehouse",
+            credential=context["credential"],
+        )
+        if not endpoint:
+            raise ValueError("Unable to resolve SQL endpoint for the specified lakehouse.")
+        client = SQLClient(
+            endpoint["server"], endpoint["database"], context["credential"]
+        )
+        setup_seconds = time.perf_counter() - started
+
+        targets: Dict[str, Dict[str, Any]] = {}
+        results: Dict[str, Dict[str, Any]] = {}
+        for name in dict.fromkeys(tables):
+            try:
+                targets[name] = _find_table(table_list, name, context["lakehouse_name"])
+            except ValueError as exc:
+                results[name] = {"table": name, "error": str(exc)}
+
+        schemas: Dict[str, Any] = {}
+        if include_schema and targets:
+            found, failed = await extract_delta_schemas(
+                [target["table"] for target in targets.values()],
+                context["credential"],
+                metadata_only=True,
+            )
+            for table_info, schema, _ in found:
+                schemas[table_info["name"]] = json.loads(schema.to_json())["fields"]
+            for failure in failed:
+                schemas[failure["table"]] = {"error": failure["error"]}
+
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def _preview(name: str, target: Dict[str, Any]) -> None:
+            async with semaphore:
+                table_started = time.perf_counter()
+                result: Dict[str, Any] = {"table": target["table_name"], "schema": target["schema"]}
+                try:
+                    df = await asyncio.to_thread(
+                        client.run_query, _preview_query(target["identifier"], limit)
+                    )
+                    result.update(_preview_rows(df, limit, format))
+                except Exception as exc:
+                    logger.error("Error previewing table '%s': %s", name, exc)
+                    result["error"] = str(exc)
+                if include_schema:
+                    result["deltaSchema"] = schemas.get(target["table_name"])
+                result["seconds"] = round(time.perf_counter() - table_started, 3)
+                results[name] = result
+
+        await asyncio.gather(*(_preview(name, target) for name, target in targets.items()))
+
+        return {
+            "lakehouse": context["lakehouse_name"],
+            "tables": [results[name] for name in dict.fromkeys(tables)],
+            "setupSeconds": round(setup_seconds, 3),
+            "totalSeconds": round(time.perf_counter() - started, 3),
+        }
+    except Exception as exc:
+        logger.error("Error generating table previews: %s", exc)
+        return {"error": str(exc)}
+
+
 @mcp.tool()
 async def table_schema(
     table: Optional[str] = None,
@@ -245,12 +397,27 @@ async def describe_history(
         if not table_path:
             raise ValueError(f"No location found for table '{context['table_name']}'.")
 
-        token = context["credential"].get_token("https://storage.azure.com/.default").token
+        token = await get_cached_token_async(context["credential"], "https://storage.azure.com/.default")
         storage_options = {"bearer_token": token, "use_fabric_endpoint": "true"}
 
+        fs_client_factory = OneLakeClient(context["credential"])._get_file_system_client
+        cache = get_delta_cache()
+
         def _get_history():
+            try:
+                version = latest_delta_version(table_path, fs_client_factory)
+            except Exception as exc:
+                logger.debug("Latest version check failed for %s: %s", table_path, exc)
+                version = None
+            if version is not None:
+                cached = cache.get_history(table_path, version, max(limit, 1))
+                if cached is not None:
+                    return cached
             dt = DeltaTable(table_path, storage_options=storage_options)
-            return dt.history(limit=max(limit, 1))
+            history = dt.history(limit=max(limit, 1))
+            cache.put_history(table_path, dt.version(), history, max(limit, 1))
+            _remember_version(table_path, dt)
+            return history
 
         history = await asyncio.to_thread(_get_history)
 
@@ -278,14 +445,17 @@ async def optimize_delta(
         if not table_path:
             raise ValueError(f"No location found for table '{context['table_name']}'.")
 
-        token = context["credential"].get_token("https://storage.azure.com/.default").token
+        token = await get_cached_token_async(context["credential"], "https://storage.azure.com/.default")
         storage_options = {"bearer_token": token, "use_fabric_endpoint": "true"}
 
         def _optimize():
             dt = DeltaTable(table_path, storage_options=storage_options)
             if zorder_by:
-                return dt.optimize.z_order(zorder_by)
-            return dt.optimize.compact()
+                result = dt.optimize.z_order(zorder_by)
+            else:
+                result = dt.optimize.compact()
+            _remember_version(table_path, dt)
+            return result
 
         result = await asyncio.to_thread(_optimize)
         return {
@@ -312,13 +482,14 @@ async def vacuum_delta(
         if not table_path:
             raise ValueError(f"No location found for table '{context['table_name']}'.")
 
-        token = context["credential"].get_token("https://storage.azure.com/.default").token
+        token = await get_cached_token_async(context["credential"], "https://storage.azure.com/.default")
         storage_options = {"bearer_token": token, "use_fabric_endpoint": "true"}
 
         def _vacuum():
             dt = DeltaTable(table_path, storage_options=storage_options)
-            from datetime import timedelta
-            return dt.vacuum(retention_hours=max(retain_hours, 0), enforce_retention_duration=False)
+            deleted = dt.vacuum(retention_hours=max(retain_hours, 0), enforce_retention_duration=False)
+            _remember_version(table_path, dt)
+            return deleted
 
         deleted_files = await asyncio.to_thread(_vacuum)
         return {